@@ -0,0 +1,368 @@
+"""Code Generation Module - generates Python validators from compiled schema sections."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import os
+import re
+import sys
+import tempfile
+from typing import TYPE_CHECKING
+
+import orjson
+from django.utils.functional import cached_property
+
+from openapi_tester.compiler import KEYWORD_VALIDATORS
+from openapi_tester.schema_cache import SchemaCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from openapi_tester.compiler import CompiledSchemaSection
+
+    Fallback = Callable[[CompiledSchemaSection, Any], bool]
+
+# Bump whenever the generated code changes, so that modules generated by an older version are not imported.
+CODEGEN_FORMAT = 1
+
+TYPE_CHECKS = {
+    "string": "isinstance(data, str)",
+    "file": "isinstance(data, str)",
+    "boolean": "isinstance(data, bool)",
+    "integer": "(isinstance(data, int) and not isinstance(data, bool))",
+    "number": "(isinstance(data, (int, float)) and not isinstance(data, bool))",
+    "object": "isinstance(data, dict)",
+    "array": "isinstance(data, list)",
+    "null": "data is None",
+}
+
+# Inlined keyword checks: (keyword, type of the keyword value, check failing the data). Other keywords, and keywords
+# with values of another type, are checked by calling their validator.
+INLINED_CHECKS: tuple[tuple[str, type | tuple[type, ...], str], ...] = (
+    ("pattern", str, "isinstance(data, str) and not pattern_{index}.match(data)"),
+    (
+        "multipleOf",
+        (int, float),
+        "isinstance(data, (int, float)) and data % {value} != 0",
+    ),
+    ("minLength", int, "isinstance(data, str) and len(data) < {value}"),
+    ("maxLength", int, "isinstance(data, str) and len(data) > {value}"),
+    ("minItems", int, "isinstance(data, list) and len(data) < {value}"),
+    ("maxItems", int, "isinstance(data, list) and len(data) > {value}"),
+    ("enum", list, "data not in {value}"),
+)
+
+
+def canonicalize(data: Any, seen: dict[int, int]) -> Any:
+    """
+    Returns a JSON serializable copy of a schema section, in which objects seen before (shared or recursive) are
+    replaced by their position, so that differently shaped graphs never serialize the same.
+    """
+    if isinstance(data, list):
+        return [canonicalize(item, seen) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if id(data) in seen:
+        return {"$seen": seen[id(data)]}
+    seen[id(data)] = len(seen)
+    return [[key, canonicalize(value, seen)] for key, value in data.items()]
+
+
+class ValidatorGenerator:
+    """
+    Generates the Python source of a validator for a compiled schema section.
+
+    The generated validator is a function per section, returning whether data matches it, with the type tests and
+    bound checks inlined and object keys checked in straight lines. It only ever accepts data the interpreter
+    (``SchemaTester.test_compiled_schema_section``) accepts: sections it does not handle (``oneOf``, ``anyOf``, ...)
+    are handed to a fallback running the interpreter, and data it rejects is validated again by the interpreter, which
+    raises the usual errors.
+    """
+
+    def __init__(
+        self,
+        root: CompiledSchemaSection,
+        http_message: str,
+        openapi_version: str | None,
+    ) -> None:
+        self.root = root
+        self.http_message = http_message
+        # OpenAPI 3.1 documents null values as types, which are left to the interpreter
+        self.null_as_type = "3.1" in (openapi_version or "")
+        self.sections: list[CompiledSchemaSection] = []
+        self._indices: dict[int, int] = {}
+        self._collect_sections()
+
+    def _collect_sections(self) -> None:
+        stack = [self.root]
+        while stack:
+            section = stack.pop()
+            if id(section) in self._indices:
+                continue
+            self._indices[id(section)] = len(self.sections)
+            self.sections.append(section)
+            stack.extend(reversed([child for _, child in self.get_children(section)]))
+
+    def get_children(
+        self, section: CompiledSchemaSection
+    ) -> list[tuple[str | int | None, CompiledSchemaSection]]:
+        """
+        Returns the sub-sections the generated code validates, keyed by property (``None`` for array items and
+        additional properties).
+        """
+        if self.falls_back(section):
+            return []
+        children: list[tuple[str | int | None, CompiledSchemaSection]] = []
+        if section.schema_type == "object":
+            children.extend(
+                (key, section.get_property(key)) for key in section.properties
+            )
+            if isinstance(section.additional_properties, dict):
+                children.append((None, section.get_additional_properties()))
+        elif section.schema_type == "array":
+            children.append((None, section.get_items()))
+        return children
+
+    @staticmethod
+    def falls_back(section: CompiledSchemaSection) -> bool:
+        schema_section = section.schema_section
+        if "oneOf" in schema_section or "anyOf" in schema_section:
+            return True
+        schema_type = schema_section.get("type", "object")
+        schema_types = schema_type if isinstance(schema_type, list) else [schema_type]
+        if not all(
+            isinstance(item, str) and item in TYPE_CHECKS for item in schema_types
+        ):
+            return True
+        if section.schema_type == "object":
+            return not isinstance(
+                section.additional_properties, (bool, dict, type(None))
+            ) or not all(
+                isinstance(key, (str, int)) and isinstance(value, dict)
+                for key, value in section.properties.items()
+            )
+        if section.schema_type == "array":
+            return not isinstance(schema_section.get("items"), dict)
+        return False
+
+    @cached_property
+    def key(self) -> str:
+        source = orjson.dumps(
+            canonicalize(self.root.source, {}),
+            option=orjson.OPT_NON_STR_KEYS,
+            default=repr,
+        )
+        return SchemaCache.get_key(
+            source,
+            [str(CODEGEN_FORMAT), self.http_message, str(self.null_as_type)],
+        )
+
+    def generate_source(self) -> str:
+        lines = [
+            f'"""Validator generated by openapi_tester.codegen, do not edit. Key: {self.key}"""',
+            "",
+            "import re",
+            "",
+            "from openapi_tester.validators import (",
+            *(
+                f"    {validator.__name__},"
+                for _, validator in sorted(
+                    KEYWORD_VALIDATORS[1:], key=lambda item: item[1].__name__
+                )
+            ),
+            ")",
+            "",
+            "",
+            "def build(sections, fallback):",
+        ]
+        for index, section in enumerate(self.sections):
+            lines.extend(self.generate_constants(index, section))
+        for index, section in enumerate(self.sections):
+            lines.append("")
+            lines.extend(self.generate_function(index, section))
+        lines.extend(["", "    return check_0", ""])
+        return "\n".join(lines)
+
+    def generate_constants(
+        self, index: int, section: CompiledSchemaSection
+    ) -> list[str]:
+        lines = [
+            f"    section_{index} = sections[{index}]",
+            f"    schema_{index} = section_{index}.schema_section",
+        ]
+        if section.schema_type == "object" and not self.falls_back(section):
+            lines.append(f"    keys_{index} = frozenset(section_{index}.properties)")
+        pattern = section.schema_section.get("pattern")
+        if self._compiles(pattern):
+            lines.append(f'    pattern_{index} = re.compile(schema_{index}["pattern"])')
+        return lines
+
+    def generate_function(
+        self, index: int, section: CompiledSchemaSection
+    ) -> list[str]:
+        body = self.generate_body(index, section)
+        return [f"    def check_{index}(data):", *(f"        {line}" for line in body)]
+
+    def generate_body(self, index: int, section: CompiledSchemaSection) -> list[str]:
+        lines = ["if data is None:"]
+        if self.null_as_type:
+            lines.append(f"    return fallback(section_{index}, data)")
+        else:
+            lines.append(f"    return {section.nullable or section.is_empty}")
+        if self.falls_back(section):
+            return [*lines, f"return fallback(section_{index}, data)"]
+        if not section.schema_type:
+            return [*lines, "return True"]
+        schema_section = section.schema_section
+        schema_type = schema_section.get("type", "object")
+        schema_types = schema_type if isinstance(schema_type, list) else [schema_type]
+        type_check = " or ".join(TYPE_CHECKS[item] for item in schema_types) or "False"
+        if len(schema_types) > 1:
+            type_check = f"({type_check})"
+        lines.extend([f"if not {type_check}:", "    return False"])
+        lines.extend(self.generate_keyword_checks(index, section))
+        if section.schema_type == "object":
+            lines.extend(self.generate_object_checks(index, section))
+        elif section.schema_type == "array":
+            items = self._indices[id(section.get_items())]
+            lines.extend(
+                [
+                    "for item in data:",
+                    f"    if not check_{items}(item):",
+                    "        return False",
+                ]
+            )
+        lines.append("return True")
+        return lines
+
+    def generate_keyword_checks(
+        self, index: int, section: CompiledSchemaSection
+    ) -> list[str]:
+        schema_section = section.schema_section
+        inlined = {
+            keyword: (value_type, check)
+            for keyword, value_type, check in INLINED_CHECKS
+        }
+        checks: list[str] = []
+        for keyword, validator in KEYWORD_VALIDATORS:
+            if keyword is None:
+                # the type check, inlined by ``generate_body``
+                continue
+            value = schema_section.get(keyword)
+            if keyword in ("minimum", "maximum"):
+                # only checked when set to a number, and then exclusive when exclusiveMinimum/Maximum is set
+                if isinstance(value, (int, float)):
+                    exclusive = schema_section.get(f"exclusive{keyword.capitalize()}")
+                    comparison = {"minimum": "<", "maximum": ">"}[keyword]
+                    checks.append(
+                        f"isinstance(data, (int, float)) and data {comparison}{'=' if exclusive else ''}"
+                        f' schema_{index}["{keyword}"]'
+                    )
+                continue
+            if not value:
+                # every other keyword check is a no-op for empty values
+                continue
+            if (
+                keyword in inlined
+                and isinstance(value, inlined[keyword][0])
+                and (keyword != "pattern" or self._compiles(value))
+            ):
+                checks.append(
+                    inlined[keyword][1].format(
+                        index=index, value=f'schema_{index}["{keyword}"]'
+                    )
+                )
+            else:
+                checks.append(f"{validator.__name__}(schema_{index}, data) is not None")
+        return [
+            line for check in checks for line in (f"if {check}:", "    return False")
+        ]
+
+    def generate_object_checks(
+        self, index: int, section: CompiledSchemaSection
+    ) -> list[str]:
+        lines: list[str] = []
+        required_keys = section.get_required_keys(self.http_message)
+        for key in section.schema_section.get("required", []):
+            if key in required_keys:
+                lines.extend([f"if {key!r} not in data:", "    return False"])
+        if section.additional_properties is None:
+            lines.extend([f"if not keys_{index}.issuperset(data):", "    return False"])
+        excluded_properties = {
+            "response": section.write_only_properties,
+            "request": section.read_only_properties,
+        }.get(self.http_message, frozenset())
+        for key, child in self.get_children(section):
+            if key is None:
+                continue
+            if key in excluded_properties:
+                lines.extend([f"if {key!r} in data:", "    return False"])
+            lines.extend(
+                [
+                    f"if {key!r} in data and not check_{self._indices[id(child)]}(data[{key!r}]):",
+                    "    return False",
+                ]
+            )
+        if isinstance(section.additional_properties, dict):
+            additional = self._indices[id(section.get_additional_properties())]
+            lines.extend(
+                [
+                    "for key, value in data.items():",
+                    f"    if key not in keys_{index} and not check_{additional}(value):",
+                    "        return False",
+                ]
+            )
+        return lines
+
+    @staticmethod
+    def _compiles(pattern: Any) -> bool:
+        if not isinstance(pattern, str):
+            return False
+        try:
+            re.compile(pattern)
+        except re.error:
+            return False
+        return True
+
+    def build(
+        self, fallback: Fallback, build_dir: str | None = None
+    ) -> Callable[[Any], bool]:
+        """
+        Returns the generated validator. With a build directory, the generated module is written to (and on later
+        runs imported from) ``<build_dir>/<key>.py``, so that it is only generated once per schema section.
+        """
+        if build_dir is None:
+            namespace: dict[str, Any] = {}
+            code = compile(self.generate_source(), "<generated validator>", "exec")
+            # the source is generated from the compiled schema section, never from the validated data
+            exec(code, namespace)  # noqa: S102  # pylint: disable=exec-used
+            return namespace["build"](self.sections, fallback)
+        module_name = f"openapi_tester_validator_{self.key}"
+        module = sys.modules.get(module_name)
+        if module is None:
+            path = os.path.join(build_dir, f"{self.key}.py")
+            if not os.path.exists(path):
+                self.write_module(path)
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+            spec.loader.exec_module(module)  # type: ignore[union-attr]
+            sys.modules[module_name] = module
+        return module.build(self.sections, fallback)
+
+    def write_module(self, path: str) -> None:
+        """
+        Writes the generated module atomically, so concurrent test processes never import a partial module.
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(self.generate_source())
+            os.replace(temporary_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            raise
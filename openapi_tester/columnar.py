@@ -0,0 +1,198 @@
+"""Columnar Module - validates large arrays of flat objects column by column, when numpy is installed."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import TYPE_CHECKING, Protocol
+
+from openapi_tester.compiler import (
+    BULK_CHECKED_VALIDATORS,
+    SCALAR_TYPES,
+    ScalarKeywords,
+)
+from openapi_tester.validators import validate_multiple_of, validate_type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from openapi_tester.compiler import CompiledSchemaSection
+
+# Arrays with fewer rows are validated row by row: building their columns costs more than it saves
+MIN_ROWS = 1_000
+
+COLUMN_VALIDATORS = BULK_CHECKED_VALIDATORS | {validate_multiple_of}
+
+
+class ColumnarCheck(Protocol):
+    """
+    A check of all the rows of an array of flat objects, see ``compile_columnar_check``.
+    """
+
+    def __call__(self, rows: list, http_message: str, none_allowed: bool) -> bool: ...
+
+
+def is_composed(compiled: CompiledSchemaSection) -> bool:
+    """
+    Returns whether a compiled section selects between options (``oneOf``, ``anyOf``, discriminator), which are
+    validated one by one.
+    """
+    return (
+        "oneOf" in compiled.schema_section
+        or "anyOf" in compiled.schema_section
+        or compiled.discriminator is not None
+    )
+
+
+def compile_column_check(
+    compiled: CompiledSchemaSection,
+) -> Callable[[list], bool] | None:
+    """
+    Returns a check of the values of a column (one property of every row) against its compiled schema section, or
+    None if the section has keywords columns are not checked for. Values that are None are checked by the caller.
+    """
+    if is_composed(compiled):
+        return None
+    if not compiled.schema_type:
+        # untyped sections accept any value
+        return lambda values: True
+    schema_type = compiled.schema_type
+    if (
+        not isinstance(schema_type, str)
+        or schema_type not in SCALAR_TYPES
+        or not COLUMN_VALIDATORS.issuperset(compiled.validators)
+    ):
+        return None
+    allowed_types = SCALAR_TYPES[schema_type]
+    keywords = ScalarKeywords.from_schema_section(compiled.schema_section, schema_type)
+    if keywords is None:
+        return None
+    # like the other keywords (see ``ScalarKeywords``), multipleOf is only checked for numbers
+    multiple_of = (
+        compiled.schema_section.get("multipleOf")
+        if schema_type in ("integer", "number")
+        else None
+    )
+    if not isinstance(multiple_of, (int, float)) or isinstance(multiple_of, bool):
+        multiple_of = None
+    numeric = keywords.bounded or bool(multiple_of)
+
+    def check(values: list) -> bool:
+        if not values:
+            return True
+        value_types = set(map(type, values))
+        if not allowed_types.issuperset(value_types):
+            return False
+        if numeric:
+            column = np.asarray(values)
+            # ints beyond 64 bits make object columns, ints beyond 53 bits lose precision in float columns
+            if column.dtype.kind not in "iuf" or (
+                column.dtype.kind == "f" and int in value_types
+            ):
+                column = np.asarray(values, dtype=object)
+            if not keywords.check_bounds(column, np.min, np.max):
+                return False
+            if multiple_of and np.any(np.remainder(column, multiple_of) != 0):
+                return False
+        if keywords.measured:
+            lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+            if not keywords.check_lengths(lengths, np.min, np.max):
+                return False
+        return keywords.check_values(values)
+
+    return check
+
+
+def has_flat_rows(compiled: CompiledSchemaSection) -> bool:
+    """
+    Returns whether a compiled section documents objects that are only checked by their keys and the values of their
+    properties, i.e. without composition, object keywords or schemas of additional properties.
+    """
+    return (
+        compiled.schema_type == "object"
+        and compiled.validators == (validate_type,)
+        and not is_composed(compiled)
+        and (
+            compiled.additional_properties is None
+            or isinstance(compiled.additional_properties, bool)
+        )
+    )
+
+
+def compile_columnar_check(
+    compiled: CompiledSchemaSection,
+) -> ColumnarCheck | None:
+    """
+    Returns a check of all the rows of an array of flat objects at once, or None if numpy is not installed or the
+    objects are not flat: their properties must be scalars, checked by ``compile_column_check``.
+
+    The rows are checked by their key sets (required, undocumented, read-only and write-only keys) and then one column
+    at a time, with numpy for bounds, multiples and lengths. As with ``compile_bulk_check``, arrays that pass the check
+    would pass row by row validation, and those that do not are validated row by row, which reports the first invalid
+    row and key as usual.
+
+    The check takes the rows, the HTTP message and whether None is accepted for nullable properties.
+    """
+    if np is None or not has_flat_rows(compiled):
+        return None
+    columns: list[tuple[str, Callable[[list], bool], bool]] = []
+    for key in compiled.properties:
+        prop = compiled.get_property(key)
+        column_check = compile_column_check(prop)
+        if column_check is None:
+            return None
+        columns.append((key, column_check, prop.nullable or prop.is_empty))
+    properties = compiled.properties.keys()
+    closed = compiled.additional_properties is None
+
+    def check(rows: list, http_message: str, none_allowed: bool) -> bool:
+        if not {dict}.issuperset(map(type, rows)):
+            return False
+        required_keys = compiled.get_required_keys(http_message)
+        if http_message == "response":
+            forbidden_keys = compiled.write_only_properties
+        elif http_message == "request":
+            forbidden_keys = compiled.read_only_properties
+        else:
+            forbidden_keys = frozenset()
+        shapes = set(map(frozenset, rows))
+        for shape in shapes:
+            if (
+                not required_keys.issubset(shape)
+                or (closed and not properties >= shape)
+                or not forbidden_keys.isdisjoint(shape)
+            ):
+                return False
+        for key, column_check, nullable in columns:
+            if all(key in shape for shape in shapes):
+                values = list(map(itemgetter(key), rows))
+            else:
+                values = [row[key] for row in rows if key in row]
+            if None in values:
+                if not (none_allowed and nullable):
+                    return False
+                values = [value for value in values if value is not None]
+            if not column_check(values):
+                return False
+        return True
+
+    return check
+
+
+def get_columnar_check(
+    compiled: CompiledSchemaSection,
+) -> ColumnarCheck | None:
+    """
+    Returns the columnar check of the items of an array, compiled once per compiled section.
+    """
+    cached = compiled.compiler.columnar_checks.get(id(compiled))
+    if cached is None or cached[0] is not compiled:
+        cached = compiled.compiler.columnar_checks[id(compiled)] = (
+            compiled,
+            compile_columnar_check(compiled),
+        )
+    return cached[1]
@@ -0,0 +1,598 @@
+"""Compiler Module - turns schema sections into reusable validator nodes."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
+
+from openapi_tester import validators
+from openapi_tester.resolver import ReferenceResolutionError, ReferenceResolver
+from openapi_tester.utils import (
+    get_required_keys,
+    normalize_schema_section,
+)
+from openapi_tester.validators import (
+    VALIDATOR_MAP,
+    validate_enum,
+    validate_format,
+    validate_max_items,
+    validate_max_length,
+    validate_max_properties,
+    validate_maximum,
+    validate_min_items,
+    validate_min_length,
+    validate_min_properties,
+    validate_minimum,
+    validate_multiple_of,
+    validate_pattern,
+    validate_type,
+    validate_unique_items,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+# Keyword checks in the order they are run, each with the keyword it requires. Checks whose keyword is missing from
+# a schema section can never fail, so compiled sections leave them out; ``validate_type`` always runs.
+KEYWORD_VALIDATORS: tuple[tuple[str | None, Callable[[dict, Any], str | None]], ...] = (
+    (None, validate_type),
+    ("format", validate_format),
+    ("pattern", validate_pattern),
+    ("multipleOf", validate_multiple_of),
+    ("minimum", validate_minimum),
+    ("maximum", validate_maximum),
+    ("uniqueItems", validate_unique_items),
+    ("minLength", validate_min_length),
+    ("maxLength", validate_max_length),
+    ("minItems", validate_min_items),
+    ("maxItems", validate_max_items),
+    ("maxProperties", validate_max_properties),
+    ("minProperties", validate_min_properties),
+    ("enum", validate_enum),
+)
+
+# The exact Python types of the values that pass ``validate_type`` for a scalar type, see ``compile_bulk_check``
+SCALAR_TYPES: dict[str, frozenset[type]] = {
+    "string": frozenset({str}),
+    "integer": frozenset({int}),
+    "number": frozenset({int, float}),
+    "boolean": frozenset({bool}),
+}
+BULK_CHECKED_VALIDATORS = frozenset(
+    {
+        validate_type,
+        validate_pattern,
+        validate_minimum,
+        validate_maximum,
+        validate_min_length,
+        validate_max_length,
+        validate_enum,
+    }
+)
+
+
+def get_schema_type(schema: dict[str, Any]) -> str | None:
+    if "type" in schema:
+        return schema["type"]
+    if "properties" in schema or "additionalProperties" in schema:
+        return "object"
+    return None
+
+
+def is_nullable(schema_item: dict) -> bool:
+    """
+    Checks if the item is nullable, see ``SchemaTester.test_is_nullable``.
+    """
+    openapi_schema_3_nullable = "nullable"
+    swagger_2_nullable = "x-nullable"
+
+    if "oneOf" in schema_item:
+        one_of: list[dict[str, Any]] = schema_item.get("oneOf", [])
+        return any(
+            nullable_key in schema and schema[nullable_key]
+            for schema in one_of
+            for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
+        )
+
+    if "anyOf" in schema_item:
+        any_of: list[dict[str, Any]] = schema_item.get("anyOf", [])
+        return any(
+            nullable_key in schema and schema[nullable_key]
+            for schema in any_of
+            for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
+        )
+
+    return any(
+        nullable_key in schema_item and schema_item[nullable_key]
+        for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
+    )
+
+
+class ScalarKeywords(NamedTuple):
+    """
+    The keywords of a scalar schema section that lists of values are checked against at once: bounds, lengths, enum
+    and pattern. Used by ``compile_bulk_check`` and by the column checks of ``openapi_tester.columnar``, which pass
+    their own ``lowest`` and ``highest`` functions for numpy columns.
+    """
+
+    minimum: int | float | None
+    maximum: int | float | None
+    exclusive_minimum: bool
+    exclusive_maximum: bool
+    min_length: int | None
+    max_length: int | None
+    enum: frozenset[Any] | None
+    match: Callable[[str], Any] | None
+
+    @classmethod
+    def from_schema_section(
+        cls, schema_section: dict[str, Any], schema_type: str
+    ) -> ScalarKeywords | None:
+        """
+        Returns the keywords of a schema section of a scalar type, or None if its enum or pattern can't be checked at
+        once: enums with unhashable values, and invalid patterns (reported by ``validate_pattern``).
+
+        Like the validators of single values, bounds are only checked for numbers, and lengths and patterns only for
+        strings: the keywords that do not apply to the type are left out.
+        """
+        enum: frozenset[Any] | None = None
+        if schema_section.get("enum"):
+            try:
+                enum = frozenset(schema_section["enum"])
+            except TypeError:
+                return None
+        if schema_type == "string":
+            match: Callable[[str], Any] | None = None
+            if schema_section.get("pattern"):
+                try:
+                    match = re.compile(schema_section["pattern"]).match
+                except re.error:
+                    return None
+            return cls(
+                minimum=None,
+                maximum=None,
+                exclusive_minimum=False,
+                exclusive_maximum=False,
+                min_length=schema_section.get("minLength"),
+                max_length=schema_section.get("maxLength"),
+                enum=enum,
+                match=match,
+            )
+        minimum = maximum = None
+        if schema_type in ("integer", "number"):
+            minimum = schema_section.get("minimum")
+            maximum = schema_section.get("maximum")
+        return cls(
+            minimum=minimum if isinstance(minimum, (int, float)) else None,
+            maximum=maximum if isinstance(maximum, (int, float)) else None,
+            exclusive_minimum=bool(schema_section.get("exclusiveMinimum")),
+            exclusive_maximum=bool(schema_section.get("exclusiveMaximum")),
+            min_length=None,
+            max_length=None,
+            enum=enum,
+            match=None,
+        )
+
+    @property
+    def bounded(self) -> bool:
+        return self.minimum is not None or self.maximum is not None
+
+    @property
+    def measured(self) -> bool:
+        return bool(self.min_length) or bool(self.max_length)
+
+    def check_bounds(
+        self, values: Any, lowest: Callable = min, highest: Callable = max
+    ) -> bool:
+        if self.minimum is not None:
+            low = lowest(values)
+            if low < self.minimum or (self.exclusive_minimum and low == self.minimum):
+                return False
+        if self.maximum is not None:
+            high = highest(values)
+            if high > self.maximum or (self.exclusive_maximum and high == self.maximum):
+                return False
+        return True
+
+    def check_lengths(
+        self, lengths: Any, lowest: Callable = min, highest: Callable = max
+    ) -> bool:
+        if self.min_length and lowest(lengths) < self.min_length:
+            return False
+        return not (self.max_length and highest(lengths) > self.max_length)
+
+    def check_values(self, values: list) -> bool:
+        """
+        Checks the values against the enum and the pattern.
+        """
+        if self.enum is not None and not self.enum.issuperset(values):
+            return False
+        return self.match is None or all(map(self.match, values))
+
+
+def compile_bulk_check(
+    schema_section: dict[str, Any],
+    section_validators: tuple[Callable[[dict, Any], str | None], ...],
+) -> Callable[[list], bool] | None:
+    """
+    Returns a check of all the items of an array against a scalar schema section at once: their types, bounds,
+    lengths, pattern and enum are checked over the whole list. Lists that pass it would pass item by item validation;
+    those that do not are validated item by item, which finds the first invalid item and reports it as usual.
+
+    Returns None for sections with keywords the check does not cover (formats, compositions, ...).
+    """
+    schema_type = schema_section.get("type")
+    if (
+        not isinstance(schema_type, str)
+        or schema_type not in SCALAR_TYPES
+        or not BULK_CHECKED_VALIDATORS.issuperset(section_validators)
+        or "oneOf" in schema_section
+        or "anyOf" in schema_section
+    ):
+        return None
+    allowed_types = SCALAR_TYPES[schema_type]
+    keywords = ScalarKeywords.from_schema_section(schema_section, schema_type)
+    if keywords is None:
+        return None
+
+    def check(data: list) -> bool:
+        if not data:
+            return True
+        if not allowed_types.issuperset(map(type, data)):
+            return False
+        if not keywords.check_bounds(data):
+            return False
+        if keywords.measured and not keywords.check_lengths(list(map(len, data))):
+            return False
+        return keywords.check_values(data)
+
+    return check
+
+
+@dataclass
+class SectionCache:
+    """
+    What validation learns about a compiled schema section while it is used, kept for the lifetime of the section,
+    i.e. of the ``SchemaCompiler`` of the ``SchemaTester`` that compiled it.
+    """
+
+    # compiled sub-schemas, by property name ("[]" for the items of an array)
+    children: dict[str, CompiledSchemaSection] = field(default_factory=dict)
+    # required keys by HTTP message, see ``CompiledSchemaSection.get_required_keys``
+    required_keys: dict[str, frozenset[str]] = field(default_factory=dict)
+    # discriminator values and the option they select, see ``CompiledSchemaSection.get_discriminated_option``
+    discriminated_options: dict[str, CompiledSchemaSection | None] = field(
+        default_factory=dict
+    )
+    # the shapes of the objects whose keys passed ``SchemaTester.test_compiled_object_keys``: a key set and the
+    # context it was tested in (direction, case tester, ignored keys)
+    validated_shapes: set[
+        tuple[frozenset[str], str, Callable[[str], None] | None, tuple[str, ...]]
+    ] = field(default_factory=set)
+
+    max_validated_shapes: ClassVar[int] = 1_000
+
+
+class CompiledSchemaSection:
+    """
+    A schema section with everything validation derives from it computed once: its normalized form, nullability,
+    type, the keyword checks that apply to it and, for objects, its property sets. Sub-schemas are compiled on first
+    use, so only the parts of a schema that payloads reach are compiled.
+
+    Nothing here depends on the validation settings: keyword checks still consult them when they are run.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # each attribute is a keyword, or a set of properties, read once from the schema section
+
+    def __init__(
+        self,
+        compiler: SchemaCompiler,
+        source: dict[str, Any],
+        normalize: bool = True,
+    ) -> None:
+        self.compiler = compiler
+        self.source = source
+        self.is_empty = not source
+        self.nullable = is_nullable(source)
+        schema_section = (
+            normalize_schema_section(source, compiler.normalized)
+            if normalize
+            else source
+        )
+        self.schema_section = schema_section
+        self.schema_type = get_schema_type(schema_section)
+        self.validators = tuple(
+            validator
+            for keyword, validator in KEYWORD_VALIDATORS
+            if keyword is None or keyword in schema_section
+        )
+        # used when the section is the items of an array, see ``SchemaTester.test_compiled_array``
+        self.bulk_check = compile_bulk_check(schema_section, self.validators)
+        self.properties: dict[str, Any] = schema_section.get("properties", {})
+        self.write_only_properties = frozenset(
+            key for key, value in self.properties.items() if value.get("writeOnly")
+        )
+        self.read_only_properties = frozenset(
+            key for key, value in self.properties.items() if value.get("readOnly")
+        )
+        self.additional_properties: bool | dict | None = schema_section.get(
+            "additionalProperties"
+        )
+        discriminator = schema_section.get("discriminator")
+        # OpenAPI 2 discriminators (a property name) only apply to allOf inheritance, which normalization removes
+        self.discriminator: str | None = None
+        self.discriminator_mapping: dict[str, str] = {}
+        if isinstance(discriminator, dict) and isinstance(
+            discriminator.get("propertyName"), str
+        ):
+            self.discriminator = discriminator["propertyName"]
+            self.discriminator_mapping = discriminator.get("mapping") or {}
+        self.cache = SectionCache()
+
+    def get_required_keys(self, http_message: str) -> frozenset[str]:
+        required_keys = self.cache.required_keys.get(http_message)
+        if required_keys is None:
+            required_keys = self.cache.required_keys[http_message] = frozenset(
+                get_required_keys(
+                    schema_section=self.schema_section,
+                    http_message=http_message,
+                    write_only_props=list(self.write_only_properties),
+                    read_only_props=list(self.read_only_properties),
+                )
+            )
+        return required_keys
+
+    def has_required_keys(self, data: dict, http_message: str) -> bool:
+        """
+        Returns whether an object has the required keys of the section that validating it enforces, i.e. the ones
+        documented in its properties.
+        """
+        required_keys = self.get_required_keys(http_message)
+        return required_keys.issubset(data.keys()) or (
+            required_keys & self.properties.keys()
+        ).issubset(data.keys())
+
+    def get_property(self, key: str) -> CompiledSchemaSection:
+        child = self.cache.children.get(key)
+        if child is None:
+            child = self.cache.children[key] = self.compiler.compile(
+                self.properties[key]
+            )
+        return child
+
+    def get_additional_properties(self) -> CompiledSchemaSection:
+        return self.compiler.compile(self.additional_properties)  # type: ignore[arg-type]
+
+    def get_items(self) -> CompiledSchemaSection:
+        child = self.cache.children.get("[]")
+        if child is None:
+            # the items keyword is required in arrays
+            child = self.cache.children["[]"] = self.compiler.compile(
+                self.schema_section["items"]
+            )
+        return child
+
+    def get_discriminated_option(
+        self, data: Any, schema: dict[str, Any]
+    ) -> CompiledSchemaSection | None:
+        """
+        Returns the ``oneOf`` or ``anyOf`` option that the discriminator of the section selects for the data, so that
+        only this option is validated. Returns ``None``, for the options to be tried in turn, when the data has no
+        discriminator value or the value does not lead to one of the options.
+
+        The option a value selects is looked up once: values are mapped to components of the schema by the
+        discriminator's ``mapping``, or by their name, and the option resolved from that component is kept.
+        """
+        if not isinstance(data, dict):
+            return None
+        value = data.get(self.discriminator)
+        if not isinstance(value, str):
+            return None
+        if value in self.cache.discriminated_options:
+            return self.cache.discriminated_options[value]
+        discriminated_option = None
+        reference = self.discriminator_mapping.get(value, value)
+        if not reference.startswith("#"):
+            # references to other documents are not followed
+            reference = (
+                f"#/components/schemas/{reference}" if "/" not in reference else ""
+            )
+        if reference:
+            try:
+                component = ReferenceResolver.get_pointer_target(
+                    schema, reference[1:], reference
+                )
+            except ReferenceResolutionError:
+                component = None
+            options = self.schema_section.get(
+                "oneOf", self.schema_section.get("anyOf", [])
+            )
+            for option in options:
+                if option is component or getattr(option, "origin", None) is component:
+                    discriminated_option = self.compiler.compile(option)
+                    break
+        self.cache.discriminated_options[value] = discriminated_option
+        return discriminated_option
+
+
+class BranchIndex:
+    """
+    The compiled options of a ``oneOf`` or ``anyOf`` section, with what is needed to rule out, before validating
+    them, the options a value cannot match: their JSON type, the required properties they document, whether they
+    accept properties they do not document, and the ``enum`` constraints on the value or on its properties.
+
+    Options are only ruled out when validating them would fail, so ``get_candidates`` never changes the outcome of a
+    validation. Type and enum checks are skipped when the validation settings disable them.
+    """
+
+    def __init__(self, compiler: SchemaCompiler, options: list[dict[str, Any]]) -> None:
+        self.source = options
+        self.options = tuple(compiler.compile(option) for option in options)
+        # options whose data is validated by other options (oneOf, anyOf) or not at all (untyped) are never ruled out
+        self.indexed = tuple(
+            option.schema_type is not None
+            and "oneOf" not in option.schema_section
+            and "anyOf" not in option.schema_section
+            for option in self.options
+        )
+        self.types = tuple(
+            option.schema_section.get("type", "object") for option in self.options
+        )
+        self._property_enums: tuple[dict[str, list[Any]], ...] | None = None
+        self._enum_index: dict[
+            str, tuple[dict[Any, frozenset[int]], frozenset[int]]
+        ] = {}
+
+    @property
+    def property_enums(self) -> tuple[dict[str, list[Any]], ...]:
+        # built on first use, as it compiles the properties of every option
+        if self._property_enums is None:
+            self._property_enums = property_enums = tuple(
+                {
+                    key: prop.schema_section["enum"]
+                    for key in option.properties
+                    if (prop := option.get_property(key)).schema_type is not None
+                    and prop.schema_section.get("enum")
+                    and "oneOf" not in prop.schema_section
+                    and "anyOf" not in prop.schema_section
+                }
+                if indexed and option.schema_type == "object"
+                else {}
+                for option, indexed in zip(self.options, self.indexed, strict=True)
+            )
+            # for each property with an enum (a type or kind property, typically): the options each value allows
+            for key in {key for enums in property_enums for key in enums}:
+                unconstrained = frozenset(
+                    position
+                    for position, enums in enumerate(property_enums)
+                    if key not in enums
+                )
+                by_value: dict[Any, set[int]] = {}
+                try:
+                    for position, enums in enumerate(property_enums):
+                        for value in enums.get(key, ()):
+                            by_value.setdefault(value, set()).add(position)
+                except TypeError:
+                    # unhashable enum members, the options are checked one by one
+                    continue
+                self._enum_index[key] = (
+                    {
+                        value: frozenset(positions) | unconstrained
+                        for value, positions in by_value.items()
+                    },
+                    unconstrained,
+                )
+        return self._property_enums
+
+    def get_candidates(
+        self, data: Any, http_message: str
+    ) -> tuple[CompiledSchemaSection, ...]:
+        if data is None:
+            # None is accepted by nullable options before any keyword is checked
+            return self.options
+        validation = validators.settings.validation
+        check_types = validation.types is not False
+        check_enums = "enum" not in validation.disabled_constraints
+        property_enums = self.property_enums
+        positions: Iterable[int] = range(len(self.options))
+        if check_enums and isinstance(data, dict):
+            allowed: frozenset[int] | None = None
+            for key, (by_value, unconstrained) in self._enum_index.items():
+                value = data.get(key)
+                if value is None:
+                    continue
+                try:
+                    value_allowed = by_value.get(value, unconstrained)
+                except TypeError:
+                    continue
+                allowed = value_allowed if allowed is None else allowed & value_allowed
+            if allowed is not None:
+                positions = sorted(allowed)
+        type_matches: dict[str, bool] = {}
+        candidates = []
+        for position in positions:
+            option = self.options[position]
+            if not self.indexed[position]:
+                candidates.append(option)
+                continue
+            schema_type = self.types[position]
+            if (
+                check_types
+                and isinstance(schema_type, str)
+                and schema_type in VALIDATOR_MAP
+                and schema_type not in validation.disabled_types
+            ):
+                if schema_type not in type_matches:
+                    type_matches[schema_type] = bool(VALIDATOR_MAP[schema_type](data))
+                if not type_matches[schema_type]:
+                    continue
+            enum = option.schema_section.get("enum")
+            if check_enums and enum and data not in enum:
+                continue
+            if option.schema_type == "object" and isinstance(data, dict):
+                if not option.has_required_keys(data, http_message):
+                    continue
+                if (
+                    option.additional_properties is None
+                    and not option.properties.keys() >= data.keys()
+                ):
+                    continue
+                if check_enums and any(
+                    key in data and data[key] is not None and data[key] not in enum
+                    for key, enum in property_enums[position].items()
+                    if key not in self._enum_index
+                ):
+                    continue
+            candidates.append(option)
+        return tuple(candidates)
+
+
+class SchemaCompiler:
+    """
+    Compiles schema sections, keyed by their identity: a section that is validated again (another item of a list
+    response, another test of the same endpoint) reuses its compiled form. Schema sections are treated as immutable
+    once they have been validated.
+    """
+
+    max_size = 10_000
+
+    def __init__(self) -> None:
+        self._compiled: dict[tuple[int, bool], CompiledSchemaSection] = {}
+        self._branch_indexes: dict[int, BranchIndex] = {}
+        # see ``openapi_tester.columnar.get_columnar_check``
+        self.columnar_checks: dict[int, tuple[CompiledSchemaSection, Any]] = {}
+        # shared by all compiled sections, so that sections reached from several others are normalized once
+        self.normalized: dict[int, tuple[dict, dict]] = {}
+
+    def compile(
+        self, schema_section: dict[str, Any], normalize: bool = True
+    ) -> CompiledSchemaSection:
+        key = (id(schema_section), normalize)
+        compiled = self._compiled.get(key)
+        # compiled sections hold on to their source, so that its id is not reused while cached
+        if compiled is None or compiled.source is not schema_section:
+            if len(self._compiled) >= self.max_size:
+                self.clear()
+            compiled = self._compiled[key] = CompiledSchemaSection(
+                self, schema_section, normalize=normalize
+            )
+        return compiled
+
+    def get_branch_index(self, options: list[dict[str, Any]]) -> BranchIndex:
+        branch_index = self._branch_indexes.get(id(options))
+        if branch_index is None or branch_index.source is not options:
+            if len(self._branch_indexes) >= self.max_size:
+                self._branch_indexes.clear()
+            branch_index = self._branch_indexes[id(options)] = BranchIndex(
+                self, options
+            )
+        return branch_index
+
+    def clear(self) -> None:
+        self._compiled.clear()
+        self._branch_indexes.clear()
+        self.columnar_checks.clear()
+        self.normalized.clear()
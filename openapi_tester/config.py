@@ -6,17 +6,43 @@ import configparser
 import pathlib
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
 import toml
 
+T = TypeVar("T")
+
+
+@dataclass
+class SamplingPolicy:
+    """How many of the items of large arrays and additionalProperties maps are validated, see ``SamplingSettings``."""
+
+    first: int = 100
+    last: int = 100
+    random: int = 100
+    seed: int = 0
+
+
+@dataclass
+class SamplingSettings(SamplingPolicy):
+    """
+    Settings for validating a sample of the items of large arrays and additionalProperties maps: the first and last
+    items and a seeded random sample of the others. Sampling is off unless endpoint patterns (as in
+    ``excluded_endpoints``) are given, either in ``endpoints``, sampled with the policy of these settings, or as keys
+    of ``policies``, sampled with their own policy.
+    """
+
+    endpoints: list[str] = field(default_factory=list)
+    policies: dict[str, SamplingPolicy] = field(default_factory=dict)
+
 
 @dataclass
 class ValidationSettings:
     """Specific settings for controlling validation behavior."""
 
     # pylint: disable=too-many-instance-attributes
-    # Eight is reasonable in this case as has the required configuration options
+    # each attribute is an option of the validation section of the configuration files, which keep them flat; only the
+    # sampling options, which have a section of their own, are grouped
     excluded_endpoints: list[str] | None = None
     request: bool = True
     request_for_non_successful_responses: bool = False
@@ -27,6 +53,26 @@ class ValidationSettings:
     disabled_types: list[str] = field(default_factory=list)
     disabled_formats: list[str] = field(default_factory=list)
     disabled_constraints: list[str] = field(default_factory=list)
+    max_any_of_options: int = 64
+    native_response_data: bool = False
+    stream_min_size: int | None = None
+    memoize_subtrees: bool = False
+    cache_verdicts: bool = False
+    verdict_cache_dir: str | None = None
+    sampling: SamplingSettings = field(default_factory=SamplingSettings)
+
+
+@dataclass
+class SchemaSettings:
+    """
+    Settings for controlling how schemas are loaded and prepared. Lazily prepared schemas (``lazy``) are validated
+    against the OpenAPI specification one operation at a time, when it is first used.
+    """
+
+    cache_dir: str | None = None
+    lazy: bool = False
+    codegen: bool = False
+    build_dir: str | None = None
 
 
 @dataclass
@@ -39,6 +85,7 @@ class OpenAPITestConfig:
     reference: str = "root"
     http_message: str = "response"
     validation: ValidationSettings = field(default_factory=ValidationSettings)
+    schema: SchemaSettings = field(default_factory=SchemaSettings)
 
 
 DEFAULT_CONFIG = OpenAPITestConfig()
@@ -64,6 +111,140 @@ def _parse_bool_value(value: str) -> bool:
     return value.lower() in ("true", "1", "yes", "on")
 
 
+def _parse_ini_validation_data(
+    config: configparser.ConfigParser, section: str
+) -> dict[str, bool | int | list[str] | str]:
+    """Parse the options of the validation section by type."""
+    validation_data: dict[str, bool | int | list[str] | str] = {}
+    if not config.has_section(section):
+        return validation_data
+    for option in config.options(section):
+        value = config.get(section, option)
+
+        # Boolean options
+        if option in (
+            "request",
+            "response",
+            "types",
+            "formats",
+            "query_parameters",
+            "request_for_non_successful_responses",
+            "native_response_data",
+            "memoize_subtrees",
+            "cache_verdicts",
+        ):
+            validation_data[option] = _parse_bool_value(value)
+        # list options
+        elif option in (
+            "excluded_endpoints",
+            "disabled_types",
+            "disabled_formats",
+            "disabled_constraints",
+        ):
+            validation_data[option] = _parse_list_value(value)
+        # integer options
+        elif option in ("max_any_of_options", "stream_min_size"):
+            validation_data[option] = int(value)
+        # string options
+        elif option == "verdict_cache_dir":
+            validation_data[option] = value
+    return validation_data
+
+
+def _parse_ini_validation_settings(
+    config: configparser.ConfigParser, section: str, sampling_section: str
+) -> ValidationSettings:
+    """Parse the validation section, and its sampling section, of an INI file."""
+    validation_data = _parse_ini_validation_data(config, section)
+
+    # Build ValidationSettings with proper type casting
+    def get_bool(key: str, default: bool) -> bool:
+        val = validation_data.get(key, default)
+        return val if isinstance(val, bool) else default
+
+    def get_int(key: str, default: T) -> int | T:
+        val = validation_data.get(key, default)
+        return val if isinstance(val, int) and not isinstance(val, bool) else default
+
+    def get_str(key: str) -> str | None:
+        val = validation_data.get(key)
+        return val if isinstance(val, str) and val else None
+
+    def get_list(key: str) -> list[str]:
+        val = validation_data.get(key, [])
+        return val if isinstance(val, list) else []
+
+    return ValidationSettings(
+        excluded_endpoints=get_list("excluded_endpoints"),
+        request=get_bool("request", True),
+        request_for_non_successful_responses=get_bool(
+            "request_for_non_successful_responses", False
+        ),
+        response=get_bool("response", True),
+        types=get_bool("types", True),
+        formats=get_bool("formats", True),
+        query_parameters=get_bool("query_parameters", True),
+        disabled_types=get_list("disabled_types"),
+        disabled_formats=get_list("disabled_formats"),
+        disabled_constraints=get_list("disabled_constraints"),
+        max_any_of_options=get_int("max_any_of_options", 64),
+        native_response_data=get_bool("native_response_data", False),
+        stream_min_size=get_int("stream_min_size", None),
+        memoize_subtrees=get_bool("memoize_subtrees", False),
+        cache_verdicts=get_bool("cache_verdicts", False),
+        verdict_cache_dir=get_str("verdict_cache_dir"),
+        sampling=_parse_ini_sampling_settings(config, sampling_section),
+    )
+
+
+def _parse_ini_sampling_policy(
+    config: configparser.ConfigParser, section: str, default: SamplingPolicy
+) -> SamplingPolicy:
+    """Parse the policy options of a sampling section, falling back to those of ``default``."""
+    return SamplingPolicy(
+        first=config.getint(section, "first", fallback=default.first),
+        last=config.getint(section, "last", fallback=default.last),
+        random=config.getint(section, "random", fallback=default.random),
+        seed=config.getint(section, "seed", fallback=default.seed),
+    )
+
+
+def _parse_ini_sampling_settings(
+    config: configparser.ConfigParser, section: str
+) -> SamplingSettings:
+    """
+    Parse the sampling section of an INI file, and its policy sections, named after the endpoint pattern they apply
+    to (``[<section>:GET /api/reports/*]``).
+    """
+    policy = _parse_ini_sampling_policy(config, section, SamplingPolicy())
+    return SamplingSettings(
+        endpoints=_parse_list_value(config.get(section, "endpoints", fallback="")),
+        policies={
+            policy_section[len(section) + 1 :]: _parse_ini_sampling_policy(
+                config, policy_section, policy
+            )
+            for policy_section in config.sections()
+            if policy_section.startswith(f"{section}:")
+        },
+        first=policy.first,
+        last=policy.last,
+        random=policy.random,
+        seed=policy.seed,
+    )
+
+
+def _parse_ini_schema_settings(
+    config: configparser.ConfigParser, section: str
+) -> SchemaSettings:
+    """Parse the schema section of an INI file."""
+    return SchemaSettings(
+        cache_dir=config.get(section, "cache_dir", fallback=None) or None,
+        lazy=_parse_bool_value(config.get(section, "lazy", fallback="false")),
+        codegen=_parse_bool_value(config.get(section, "codegen", fallback="false")),
+        build_dir=config.get(section, "build_dir", fallback=None) or None,
+    )
+
+
 def load_config_from_ini_file(
     config_path: pathlib.Path | None = None,
 ) -> OpenAPITestConfig:
@@ -84,6 +265,30 @@ def load_config_from_ini_file(
         disabled_types = array
         disabled_formats = date-time, email
         disabled_constraints = enum, pattern, minLength
+        max_any_of_options = 64
+        native_response_data = false
+        stream_min_size = 10000000
+        memoize_subtrees = false
+        cache_verdicts = false
+        verdict_cache_dir = .pytest_cache/django-contract-tester
+
+        [django-contract-tester:validation.sampling]
+        endpoints = GET /api/reports/*
+        first = 100
+        last = 100
+        random = 100
+        seed = 0
+
+        [django-contract-tester:validation.sampling:GET /api/exports/*]
+        first = 10
+        last = 10
+        random = 1000
+
+        [django-contract-tester:schema]
+        cache_dir = .django-contract-tester-cache
+        lazy = false
+        codegen = false
+        build_dir = .django-contract-tester-build
 
     Args:
         config_path: Optional path to a .django-contract-tester file. If not provided,
@@ -117,6 +322,8 @@ def load_config_from_ini_file(
         # Main section
         main_section = "django-contract-tester"
         validation_section = "django-contract-tester:validation"
+        sampling_section = "django-contract-tester:validation.sampling"
+        schema_section = "django-contract-tester:schema"
 
         # Parse ignore_case
         ignore_case_value = None
@@ -124,54 +331,10 @@ def load_config_from_ini_file(
             ignore_case_str = config.get(main_section, "ignore_case")
             ignore_case_value = _parse_list_value(ignore_case_str)
 
-        # Parse validation settings
-        validation_data: dict[str, bool | list[str]] = {}
-        if config.has_section(validation_section):
-            for option in config.options(validation_section):
-                value = config.get(validation_section, option)
-
-                # Boolean options
-                if option in (
-                    "request",
-                    "response",
-                    "types",
-                    "formats",
-                    "query_parameters",
-                    "request_for_non_successful_responses",
-                ):
-                    validation_data[option] = _parse_bool_value(value)
-                # list options
-                elif option in (
-                    "excluded_endpoints",
-                    "disabled_types",
-                    "disabled_formats",
-                    "disabled_constraints",
-                ):
-                    validation_data[option] = _parse_list_value(value)
-
-        # Build ValidationSettings with proper type casting
-        def get_bool(key: str, default: bool) -> bool:
-            val = validation_data.get(key, default)
-            return val if isinstance(val, bool) else default
-
-        def get_list(key: str) -> list[str]:
-            val = validation_data.get(key, [])
-            return val if isinstance(val, list) else []
-
-        current_validation_settings = ValidationSettings(
-            excluded_endpoints=get_list("excluded_endpoints"),
-            request=get_bool("request", True),
-            request_for_non_successful_responses=get_bool(
-                "request_for_non_successful_responses", False
-            ),
-            response=get_bool("response", True),
-            types=get_bool("types", True),
-            formats=get_bool("formats", True),
-            query_parameters=get_bool("query_parameters", True),
-            disabled_types=get_list("disabled_types"),
-            disabled_formats=get_list("disabled_formats"),
-            disabled_constraints=get_list("disabled_constraints"),
+        current_validation_settings = _parse_ini_validation_settings(
+            config, validation_section, sampling_section
         )
+        current_schema_settings = _parse_ini_schema_settings(config, schema_section)
 
         return OpenAPITestConfig(
             case_tester=DEFAULT_CONFIG.case_tester,
@@ -182,11 +345,138 @@ def load_config_from_ini_file(
             reference=DEFAULT_CONFIG.reference,
             http_message=DEFAULT_CONFIG.http_message,
             validation=current_validation_settings,
+            schema=current_schema_settings,
         )
     except (configparser.Error, ValueError):
         return DEFAULT_CONFIG
 
 
+def _get_toml_bool(data: dict[str, Any], key: str, default: bool) -> bool:
+    value = data.get(key, default)
+    return value if isinstance(value, bool) else default
+
+
+def _get_toml_int(data: dict[str, Any], key: str, default: T) -> int | T:
+    value = data.get(key, default)
+    if not isinstance(value, int) or isinstance(value, bool):
+        return default
+    return value
+
+
+def _get_toml_str(data: dict[str, Any], key: str) -> str | None:
+    value = data.get(key)
+    return value if isinstance(value, str) and value else None
+
+
+def _parse_toml_validation_settings(
+    validation_data: dict[str, Any],
+) -> ValidationSettings:
+    """Parse [tool.django-contract-tester.validation], and its sampling table."""
+    excluded_endpoints_from_toml = validation_data.get("excluded_endpoints")
+    if excluded_endpoints_from_toml is not None and not isinstance(
+        excluded_endpoints_from_toml, list
+    ):
+        excluded_endpoints_from_toml = None
+
+    disabled_types_from_toml = validation_data.get("disabled_types")
+    if disabled_types_from_toml is not None and not isinstance(
+        disabled_types_from_toml, list
+    ):
+        disabled_types_from_toml = []
+
+    disabled_formats_from_toml = validation_data.get("disabled_formats")
+    if disabled_formats_from_toml is not None and not isinstance(
+        disabled_formats_from_toml, list
+    ):
+        disabled_formats_from_toml = []
+
+    disabled_constraints_from_toml = validation_data.get("disabled_constraints")
+    if disabled_constraints_from_toml is not None and not isinstance(
+        disabled_constraints_from_toml, list
+    ):
+        disabled_constraints_from_toml = []
+
+    sampling_data = validation_data.get("sampling", {})
+    if not isinstance(sampling_data, dict):
+        sampling_data = {}
+
+    return ValidationSettings(
+        excluded_endpoints=excluded_endpoints_from_toml,
+        request=validation_data.get("request", True),
+        request_for_non_successful_responses=validation_data.get(
+            "request_for_non_successful_responses", False
+        ),
+        response=validation_data.get("response", True),
+        types=validation_data.get("types", True),
+        formats=validation_data.get("formats", True),
+        query_parameters=validation_data.get("query_parameters", True),
+        disabled_types=disabled_types_from_toml
+        if disabled_types_from_toml is not None
+        else [],
+        disabled_formats=disabled_formats_from_toml
+        if disabled_formats_from_toml is not None
+        else [],
+        disabled_constraints=disabled_constraints_from_toml
+        if disabled_constraints_from_toml is not None
+        else [],
+        max_any_of_options=_get_toml_int(validation_data, "max_any_of_options", 64),
+        native_response_data=_get_toml_bool(
+            validation_data, "native_response_data", False
+        ),
+        stream_min_size=_get_toml_int(validation_data, "stream_min_size", None),
+        memoize_subtrees=_get_toml_bool(validation_data, "memoize_subtrees", False),
+        cache_verdicts=_get_toml_bool(validation_data, "cache_verdicts", False),
+        verdict_cache_dir=_get_toml_str(validation_data, "verdict_cache_dir"),
+        sampling=_parse_toml_sampling_settings(sampling_data),
+    )
+
+
+def _parse_toml_sampling_policy(
+    policy_data: dict[str, Any], default: SamplingPolicy
+) -> SamplingPolicy:
+    """Parse the policy options of a sampling table, falling back to those of ``default``."""
+    return SamplingPolicy(
+        first=_get_toml_int(policy_data, "first", default.first),
+        last=_get_toml_int(policy_data, "last", default.last),
+        random=_get_toml_int(policy_data, "random", default.random),
+        seed=_get_toml_int(policy_data, "seed", default.seed),
+    )
+
+
+def _parse_toml_sampling_settings(sampling_data: dict[str, Any]) -> SamplingSettings:
+    """
+    Parse [tool.django-contract-tester.validation.sampling], and its policy tables, keyed by the endpoint pattern
+    they apply to ([tool.django-contract-tester.validation.sampling.policies."GET /api/reports/*"]).
+    """
+    endpoints = sampling_data.get("endpoints", [])
+    policies = sampling_data.get("policies", {})
+    policy = _parse_toml_sampling_policy(sampling_data, SamplingPolicy())
+    return SamplingSettings(
+        endpoints=endpoints if isinstance(endpoints, list) else [],
+        policies={
+            pattern: _parse_toml_sampling_policy(policy_data, policy)
+            for pattern, policy_data in policies.items()
+            if isinstance(policy_data, dict)
+        }
+        if isinstance(policies, dict)
+        else {},
+        first=policy.first,
+        last=policy.last,
+        random=policy.random,
+        seed=policy.seed,
+    )
+
+
+def _parse_toml_schema_settings(schema_data: dict[str, Any]) -> SchemaSettings:
+    """Parse [tool.django-contract-tester.schema]."""
+    return SchemaSettings(
+        cache_dir=_get_toml_str(schema_data, "cache_dir"),
+        lazy=_get_toml_bool(schema_data, "lazy", False),
+        codegen=_get_toml_bool(schema_data, "codegen", False),
+        build_dir=_get_toml_str(schema_data, "build_dir"),
+    )
+
+
 def load_config_from_pyproject_toml(
     config_path: pathlib.Path | None = None,
 ) -> OpenAPITestConfig:
@@ -194,6 +484,8 @@ def load_config_from_pyproject_toml(
     Loads configuration from pyproject.toml.
     Top-level settings under [tool.django-contract-tester].
     Validation behavior settings under [tool.django-contract-tester.validation].
+    Sampling settings under [tool.django-contract-tester.validation.sampling].
+    Schema loading settings under [tool.django-contract-tester.schema].
     Returns an OpenAPITestConfig instance.
     Falls back to default values if pyproject.toml is not found or sections are missing.
 
@@ -232,51 +524,11 @@ def load_config_from_pyproject_toml(
         ):
             ignore_case_from_toml = DEFAULT_CONFIG.ignore_case
 
-        validation_data = tool_config.get("validation", {})
-
-        excluded_endpoints_from_toml = validation_data.get("excluded_endpoints")
-        if excluded_endpoints_from_toml is not None and not isinstance(
-            excluded_endpoints_from_toml, list
-        ):
-            excluded_endpoints_from_toml = None
-
-        disabled_types_from_toml = validation_data.get("disabled_types")
-        if disabled_types_from_toml is not None and not isinstance(
-            disabled_types_from_toml, list
-        ):
-            disabled_types_from_toml = []
-
-        disabled_formats_from_toml = validation_data.get("disabled_formats")
-        if disabled_formats_from_toml is not None and not isinstance(
-            disabled_formats_from_toml, list
-        ):
-            disabled_formats_from_toml = []
-
-        disabled_constraints_from_toml = validation_data.get("disabled_constraints")
-        if disabled_constraints_from_toml is not None and not isinstance(
-            disabled_constraints_from_toml, list
-        ):
-            disabled_constraints_from_toml = []
-
-        current_validation_settings = ValidationSettings(
-            excluded_endpoints=excluded_endpoints_from_toml,
-            request=validation_data.get("request", True),
-            request_for_non_successful_responses=validation_data.get(
-                "request_for_non_successful_responses", False
-            ),
-            response=validation_data.get("response", True),
-            types=validation_data.get("types", True),
-            formats=validation_data.get("formats", True),
-            query_parameters=validation_data.get("query_parameters", True),
-            disabled_types=disabled_types_from_toml
-            if disabled_types_from_toml is not None
-            else [],
-            disabled_formats=disabled_formats_from_toml
-            if disabled_formats_from_toml is not None
-            else [],
-            disabled_constraints=disabled_constraints_from_toml
-            if disabled_constraints_from_toml is not None
-            else [],
+        current_validation_settings = _parse_toml_validation_settings(
+            tool_config.get("validation", {})
+        )
+        current_schema_settings = _parse_toml_schema_settings(
+            tool_config.get("schema", {})
         )
 
         return OpenAPITestConfig(
@@ -288,6 +540,7 @@ def load_config_from_pyproject_toml(
             reference=tool_config.get("reference", DEFAULT_CONFIG.reference),
             http_message=tool_config.get("http_message", DEFAULT_CONFIG.http_message),
             validation=current_validation_settings,
+            schema=current_schema_settings,
         )
     except toml.TomlDecodeError:
         return DEFAULT_CONFIG
@@ -62,6 +62,10 @@ VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR = 'The following property was found in th
 VALIDATE_READ_ONLY_RESPONSE_KEY_ERROR = 'The following property was found in the request, but is documented as being "readOnly": "{read_only_key}"'
 VALIDATE_ONE_OF_ERROR = "Expected data to match one and only one of the oneOf schema types; found {matches} matches"
 VALIDATE_ANY_OF_ERROR = "Expected data to match one or more of the documented anyOf schema types, but found no matches"
+ANY_OF_LIMIT_WARNING = (
+    "The anyOf section at {reference} has {options} options: only the first {max_options} are combined to "
+    "validate objects. Raise `max_any_of_options` in the validation settings to combine all of them."
+)
 UNDOCUMENTED_SCHEMA_SECTION_ERROR = (
     "Error: Unsuccessfully tried to index the OpenAPI schema by `{key}`. {error_addon}"
 )
@@ -0,0 +1,97 @@
+"""Context Module - the immutable state threaded through the validation of an exchange."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from openapi_tester.config import ValidationSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from openapi_tester.config import OpenAPITestConfig
+    from openapi_tester.memo import SubtreeMemo
+    from openapi_tester.sampling import Sampler
+
+
+class ReferencePath:
+    """
+    The location of a value in the validated data (e.g. ``GET /api/pets > response > 200 > name``), kept as a
+    linked list of segments, so that drilling down costs one small object and the string is only built when an error
+    is raised.
+    """
+
+    __slots__ = ("parent", "segment")
+
+    def __init__(self, segment: str, parent: ReferencePath | None = None) -> None:
+        self.segment = segment
+        self.parent = parent
+
+    def __truediv__(self, key: Any) -> ReferencePath:
+        return ReferencePath(f" > {key}", self)
+
+    def join(self, suffix: str) -> ReferencePath:
+        return ReferencePath(suffix, self)
+
+    def __str__(self) -> str:
+        segments = []
+        path: ReferencePath | None = self
+        while path is not None:
+            segments.append(path.segment)
+            path = path.parent
+        return "".join(reversed(segments))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+@dataclass(frozen=True)
+class ExchangeState:
+    """
+    What the validation of one exchange keeps across its values: the sampler that only validates a sample of the
+    items of large arrays and maps (see ``SamplingSettings``), and the memo of the values already validated (see
+    ``SubtreeMemo``).
+    """
+
+    sampler: Sampler | None = None
+    memo: SubtreeMemo | None = None
+
+
+@dataclass(frozen=True)
+class ValidationContext:
+    """
+    Immutable view of the ``OpenAPITestConfig`` options used while validating data, shared by every value of an
+    exchange. Only the reference changes while drilling down, see ``at``.
+
+    Probe contexts only tell whether data matches: mismatches raise ``ProbeMismatch``, without a message. Contexts
+    with an exchange state sample large arrays and maps, or skip the values they already validated, see
+    ``ExchangeState``.
+    """
+
+    http_message: str = "response"
+    reference: ReferencePath = field(default_factory=lambda: ReferencePath("root"))
+    case_tester: Callable[[str], None] | None = None
+    ignore_case: list[str] | None = None
+    validators: tuple[Callable[[dict, Any], str | None], ...] = ()
+    max_any_of_options: int = ValidationSettings.max_any_of_options
+    probe: bool = False
+    exchange: ExchangeState = ExchangeState()
+
+    @classmethod
+    def from_config(cls, test_config: OpenAPITestConfig) -> ValidationContext:
+        return cls(
+            http_message=test_config.http_message,
+            reference=ReferencePath(test_config.reference),
+            case_tester=test_config.case_tester,
+            ignore_case=test_config.ignore_case,
+            validators=tuple(test_config.validators or ()),
+            max_any_of_options=test_config.validation.max_any_of_options,
+        )
+
+    def at(self, reference: ReferencePath) -> ValidationContext:
+        return replace(self, reference=reference)
+
+    def as_probe(self) -> ValidationContext:
+        return self if self.probe else replace(self, probe=True)
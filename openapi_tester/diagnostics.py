@@ -0,0 +1,63 @@
+"""Diagnostics Module - error context that is only rendered when an error is raised."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+
+class Diagnostic:
+    """
+    Deferred error context (e.g. the ``error_addon`` of ``UNDOCUMENTED_SCHEMA_SECTION_ERROR``): holds a render
+    function and its arguments, and renders them when formatted. Lookups that succeed never format their
+    diagnostics, so listing every documented route costs nothing unless a route is missing.
+    """
+
+    __slots__ = ("args", "render")
+
+    def __init__(self, render: Callable[..., str], *args: Any) -> None:
+        self.render = render
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.render(*self.args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.render.__name__})"
+
+
+def render_undocumented_route(reference: Any, path: str, paths: Iterable[str]) -> str:
+    return (
+        f"\n\n{reference}\n\nUndocumented route {path}.\n\nDocumented routes: "
+        + "\n\t• ".join(paths)
+    )
+
+
+def render_undocumented_method(
+    reference: Any, method: str, route_object: dict[str, Any]
+) -> str:
+    return (
+        f"\n\n{reference}"
+        f"\n\nUndocumented method: {method}."
+        "\n\nDocumented methods: "
+        f"{[method.lower() for method in route_object.keys() if method.lower() != 'parameters']}."
+    )
+
+
+def render_undocumented_status_code(
+    reference: Any, status_code: int | str, responses_object: dict[str, Any]
+) -> str:
+    return (
+        f"\n\n{reference}"
+        f"\n\nUndocumented status code: {status_code}."
+        f"\n\nDocumented status codes: {list(responses_object.keys())}. "
+    )
+
+
+def render_undocumented_operation_section(
+    reference: Any, description: str, method: str, path: str
+) -> str:
+    return f"\n\n{reference}\n\n{description} method: {method}, path: {path}"
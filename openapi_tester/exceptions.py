@@ -20,6 +20,15 @@ class CaseError(DocumentationError):
         )
 
 
+class ProbeMismatch(DocumentationError):
+    """
+    Raised instead of a DocumentationError while probing ``oneOf`` and ``anyOf`` options: only whether an option
+    matches is needed, so no error message is rendered.
+    """
+
+    pass
+
+
 class OpenAPISchemaError(Exception):
     """
     Custom exception raised for invalid schema specifications.
@@ -36,6 +45,22 @@ class UndocumentedSchemaSectionError(OpenAPISchemaError):
     pass
 
 
+class AnyOfLimitWarning(UserWarning):
+    """
+    Warning emitted when an anyOf section has more options than the ``max_any_of_options`` validation setting.
+    """
+
+    pass
+
+
+class SamplingWarning(UserWarning):
+    """
+    Warning emitted the first time sampling skips items of an endpoint's data, see ``SamplingReport``.
+    """
+
+    pass
+
+
 class APIFrameworkNotInstalledError(Exception):
     """
     Raised when a required API framework is not installed.
@@ -3,30 +3,43 @@
 from __future__ import annotations
 
 import difflib
+import os
 import pathlib
 import re
+import warnings
+from functools import partial
 from typing import TYPE_CHECKING, cast
 from urllib.parse import urlparse
 
 import orjson
 import requests
 import yaml
-from django.urls import Resolver404, resolve
+from django.conf import settings
+from django.urls import Resolver404, URLResolver, get_resolver, resolve
 from django.utils.functional import cached_property
 from openapi_spec_validator import (
     OpenAPIV2SpecValidator,
     OpenAPIV30SpecValidator,
     OpenAPIV31SpecValidator,
 )
-from prance.util.resolver import RefResolver
 from rest_framework.schemas.generators import BaseSchemaGenerator, EndpointEnumerator
 from rest_framework.settings import api_settings
 
+from openapi_tester.config import settings as global_settings
 from openapi_tester.constants import UNDOCUMENTED_SCHEMA_SECTION_ERROR
 from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.registry import schema_registry
+from openapi_tester.resolver import (
+    ReferenceResolver,
+    get_document_uri,
+    get_top_level_document,
+    references_other_documents,
+)
+from openapi_tester.schema_cache import SchemaCache
+from openapi_tester.utils import normalize_operation
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Iterator, Mapping
     from typing import Any
     from urllib.parse import ParseResult
 
@@ -37,7 +50,15 @@ if TYPE_CHECKING:
 def handle_recursion_limit(schema: dict) -> Callable:
     """
     We are using a currying pattern to pass schema into the scope of the handler.
+
+    Deprecated: schemas are no longer de-referenced by prance, whose recursion limit handler this was. Recursive
+    references are kept as cycles instead (see ``ReferenceResolver``).
     """
+    warnings.warn(
+        "handle_recursion_limit is deprecated: recursive references are resolved into cycles by ReferenceResolver.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
 
     # noinspection PyUnusedLocal
     def handler(iteration: int, parse_result: ParseResult, recursions: tuple):  # pylint: disable=unused-argument
@@ -51,6 +72,20 @@ def handle_recursion_limit(schema: dict) -> Callable:
     return handler
 
 
+def iterate_url_patterns(
+    patterns: list | None = None, prefix: str = ""
+) -> Iterator[str]:
+    """
+    Yields every URL pattern of the project's URL configuration, prefixed with the patterns it is included under.
+    """
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        route = f"{prefix}{pattern.pattern}"
+        if isinstance(pattern, URLResolver):
+            yield from iterate_url_patterns(pattern.url_patterns, route)
+        else:
+            yield route
+
+
 class BaseSchemaLoader:
     """
     Base class for OpenAPI schema loading classes.
@@ -62,6 +97,8 @@ class BaseSchemaLoader:
     base_path = "/"
     field_key_map: dict[str, str]
     schema: dict | None = None
+    # whether the last schema prepared by the loader references other documents, see ``prepare_schema``
+    references_other_documents = False
 
     def __init__(self, field_key_map: dict[str, str] | None = None):
         super().__init__()
@@ -74,29 +111,137 @@ class BaseSchemaLoader:
         """
         raise NotImplementedError("The `load_schema` method has to be overwritten.")
 
+    def load_schema_source(self) -> bytes | None:
+        """
+        Returns the raw schema document, used to key the persistent schema cache. Loaders returning ``None`` are
+        not cached on disk.
+        """
+        return None
+
+    def parse_schema_source(self, source: bytes) -> dict:
+        """
+        Parses a raw schema document returned by ``load_schema_source``.
+        """
+        raise NotImplementedError(
+            "The `parse_schema_source` method has to be overwritten."
+        )
+
     def get_schema(self) -> dict:
         """
         Returns OpenAPI schema.
+
+        Prepared schemas are shared process-wide through the schema registry, so loaders with the same identity
+        only load, de-reference and validate their schema once. Schemas referencing other documents are not
+        registered, as the registry key does not tell when the other documents change.
         """
         if self.schema:
             return self.schema
-        self.set_schema(self.load_schema())
+        registry_key = self.get_registry_key()
+        if registry_key is None:
+            self.set_schema(self.load_schema())
+            return self.get_schema()
+        schema = schema_registry.get(registry_key)
+        if schema is None:
+            schema = self.load_prepared_schema()
+            if not self.references_other_documents:
+                schema_registry.register(registry_key, schema)
+        self.schema = schema
         return self.get_schema()
 
-    def de_reference_schema(self, schema: dict) -> dict:
-        url = schema.get("basePath", self.base_path)
-        recursion_handler = handle_recursion_limit(schema)
-        resolver = RefResolver(
-            schema,
-            recursion_limit_handler=recursion_handler,
-            recursion_limit=10,
-            url=url,
+    def load_prepared_schema(self) -> dict:
+        """
+        Loads and prepares the schema, going through the persistent schema cache when a cache directory is
+        configured, in which case a warm start skips de-referencing and validation altogether.
+
+        Lazily prepared schemas cannot be persisted, so in lazy mode the parsed document is cached instead. Schemas
+        referencing other documents are not persisted, as the cache key only covers the source document: a change in a
+        referenced document would leave a stale entry behind.
+        """
+        cache_dir = global_settings.schema.cache_dir
+        if not cache_dir:
+            return self.prepare_schema(self.load_schema())
+        return self.load_cached_schema(SchemaCache(cache_dir))
+
+    def load_cached_schema(self, schema_cache: SchemaCache) -> dict:
+        """
+        Returns the prepared schema, loaded from the persistent schema cache if it is there, see
+        ``load_prepared_schema``.
+        """
+        if (source := self.load_schema_source()) is None:
+            return self.prepare_schema(self.load_schema())
+        if global_settings.schema.lazy:
+            cache_key = schema_cache.get_key(source, ["document"])
+            document = schema_cache.load(cache_key)
+            if document is None:
+                document = self.parse_schema_source(source)
+                schema_cache.store(cache_key, document)
+            return self.prepare_schema(document)
+        cache_key = schema_cache.get_key(source, self.get_cache_context())
+        schema = schema_cache.load(cache_key)
+        if schema is None:
+            schema = self.prepare_schema(self.parse_schema_source(source))
+            if not self.references_other_documents:
+                schema_cache.store(cache_key, schema)
+        return schema
+
+    def get_cache_context(self) -> list[str]:
+        """
+        Returns everything besides the source document that the prepared schema depends on: the loader type, its
+        ``field_key_map`` and the URL configuration and DRF settings used to normalize the schema paths.
+        """
+        return [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            repr(sorted(self.field_key_map.items())),
+            repr(getattr(settings, "REST_FRAMEWORK", None)),
+            *iterate_url_patterns(),
+        ]
+
+    def get_registry_key(self) -> Hashable | None:
+        """
+        Returns the key identifying this loader's prepared schema in the schema registry, or ``None`` when the
+        loader's schema source cannot be identified.
+
+        Besides the source, the key includes the loader type, its ``field_key_map`` and the URL configuration, as
+        they are all used to normalize the schema paths, and whether the schema is prepared lazily.
+        """
+        if (source_key := self.get_source_key()) is None:
+            return None
+        return (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            tuple(sorted(self.field_key_map.items())),
+            settings.ROOT_URLCONF,
+            global_settings.schema.lazy,
+            *source_key,
         )
-        resolver.resolve_references()
-        return resolver.specs
 
-    def normalize_schema_paths(self, schema: dict) -> dict[str, dict]:
-        normalized_paths: dict[str, dict] = {}
+    def get_source_key(self) -> tuple | None:
+        """
+        Returns a tuple identifying where the schema is loaded from. Loaders returning ``None`` are not registered.
+        """
+        return None
+
+    def get_base_uri(self) -> str:
+        """
+        Returns the URI that relative references to other documents are resolved against.
+        """
+        return ""
+
+    def get_route_prefix(self) -> str | None:
+        """
+        Returns the prefix that ``resolve_path`` trims from request paths, or ``None`` when it cannot be expressed as a
+        literal prefix, in which case request paths are always resolved through ``resolve_path``.
+        """
+        return ""
+
+    def de_reference_schema(self, schema: dict) -> dict:
+        """
+        Resolves every ``$ref`` of the schema. References to the same target share one resolved object, and
+        recursive references are kept as cycles (see ``ReferenceResolver``).
+        """
+        return ReferenceResolver(schema, base_uri=self.get_base_uri()).resolve()
+
+    def normalize_schema_paths(self, schema: dict) -> dict[str, Mapping]:
+        normalized_paths: dict[str, Mapping] = {}
         for key, value in schema["paths"].items():
             try:
                 parameterized_path, _ = self.resolve_path(
@@ -108,16 +253,20 @@ class BaseSchemaLoader:
         return {**schema, "paths": normalized_paths}
 
     @staticmethod
-    def validate_schema(schema: dict):
+    def validate_schema(schema: dict, base_uri: str = ""):
         if "openapi" in schema:
             openapi_version_pattern = re.compile(r"^(\d)\.(\d+)")
             result = openapi_version_pattern.findall(schema["openapi"])
             if result:
                 major, minor = result[0]
                 if (major, minor) == ("3", "0"):
-                    validator = OpenAPIV30SpecValidator(schema=schema)
+                    validator = OpenAPIV30SpecValidator(
+                        schema=schema, base_uri=base_uri
+                    )
                 elif (major, minor) == ("3", "1"):
-                    validator = OpenAPIV31SpecValidator(schema=schema)
+                    validator = OpenAPIV31SpecValidator(
+                        schema=schema, base_uri=base_uri
+                    )
                 else:
                     raise UndocumentedSchemaSectionError(
                         UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(
@@ -130,17 +279,56 @@ class BaseSchemaLoader:
                     UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(key=schema["openapi"])
                 )
         else:
-            validator = OpenAPIV2SpecValidator(schema=schema)
+            validator = OpenAPIV2SpecValidator(schema=schema, base_uri=base_uri)
         validator.validate()
 
-    def set_schema(self, schema: dict) -> None:
+    def prepare_schema(self, schema: dict) -> dict:
         """
-        Sets self.schema and self.original_schema.
+        Validates, de-references and normalizes a loaded schema.
+
+        The schema is validated before it is de-referenced, as the de-referenced schema may contain cycles. In lazy
+        mode, only the top level objects are validated when loading the schema, and operations are validated,
+        de-referenced and normalized when first accessed: each operation is validated along with the components it
+        references (see ``get_operation_document``). Components no accessed operation uses are not validated, nor are
+        the rules spanning operations, such as the uniqueness of operation ids.
         """
+        self.references_other_documents = references_other_documents(schema)
+        if global_settings.schema.lazy:
+            self.validate_schema(
+                get_top_level_document(schema), base_uri=self.get_base_uri()
+            )
+            return self.normalize_schema_paths(
+                ReferenceResolver(schema, base_uri=self.get_base_uri()).resolve_lazily(
+                    prepare=partial(normalize_operation, memo={}),
+                    validate=partial(
+                        self.validate_schema, base_uri=self.get_base_uri()
+                    ),
+                )
+            )
+        self.validate_schema(schema, base_uri=self.get_base_uri())
         de_referenced_schema = self.de_reference_schema(schema)
-        self.validate_schema(de_referenced_schema)
 
-        self.schema = self.normalize_schema_paths(de_referenced_schema)
+        return self.normalize_schema_sections(
+            self.normalize_schema_paths(de_referenced_schema)
+        )
+
+    @staticmethod
+    def normalize_schema_sections(schema: dict) -> dict:
+        """
+        Normalizes the schema sections of every operation (see ``normalize_schema_section``), so that validation never
+        has to. Sections shared by several operations are normalized once, and share their normalized form.
+        """
+        memo: dict[int, tuple[dict, dict]] = {}
+        for path_item in schema["paths"].values():
+            for value in path_item.values():
+                normalize_operation(value, memo)
+        return schema
+
+    def set_schema(self, schema: dict) -> None:
+        """
+        Sets self.schema and self.original_schema.
+        """
+        self.schema = self.prepare_schema(schema)
 
     @cached_property
     def endpoints(self) -> list[str]:
@@ -220,13 +408,24 @@ class DrfYasgSchemaLoader(BaseSchemaLoader):
             info=Info(title="", default_version="")
         )
 
+    def get_source_key(self) -> tuple | None:
+        return (
+            repr(getattr(settings, "SWAGGER_SETTINGS", None)),
+            repr(getattr(settings, "REST_FRAMEWORK", None)),
+        )
+
     def load_schema(self) -> dict:
         """
         Loads generated schema from drf-yasg and returns it as a dict.
         """
+        return self.parse_schema_source(self.load_schema_source())
+
+    def load_schema_source(self) -> bytes:
         odict_schema = self.schema_generator.get_schema(None, True)
-        str_schema = orjson.dumps(odict_schema.as_odict()).decode("utf-8")
-        return cast("dict", orjson.loads(str_schema))
+        return orjson.dumps(odict_schema.as_odict())
+
+    def parse_schema_source(self, source: bytes) -> dict:
+        return cast("dict", orjson.loads(source))
 
     def resolve_path(
         self, endpoint_path: str, method: str
@@ -234,10 +433,21 @@ class DrfYasgSchemaLoader(BaseSchemaLoader):
         de_parameterized_path, resolved_path = super().resolve_path(
             endpoint_path=endpoint_path, method=method
         )
-        path_prefix = self.schema_generator.determine_path_prefix(self.endpoints)
-        trim_length = len(path_prefix) if path_prefix != "/" else 0
+        trim_length = len(self.path_prefix) if self.path_prefix != "/" else 0
         return de_parameterized_path[trim_length:], resolved_path
 
+    @cached_property
+    def path_prefix(self) -> str:
+        """
+        Returns the common prefix drf-yasg trims from the documented paths.
+        """
+        return self.schema_generator.determine_path_prefix(self.endpoints)
+
+    def get_route_prefix(self) -> str | None:
+        if self.path_prefix == "/":
+            return ""
+        return None if "{" in self.path_prefix else self.path_prefix
+
 
 class DrfSpectacularSchemaLoader(BaseSchemaLoader):
     """
@@ -250,14 +460,23 @@ class DrfSpectacularSchemaLoader(BaseSchemaLoader):
 
         self.schema_generator = SchemaGenerator()
 
+    def get_source_key(self) -> tuple | None:
+        return (
+            repr(getattr(settings, "SPECTACULAR_SETTINGS", None)),
+            repr(getattr(settings, "REST_FRAMEWORK", None)),
+        )
+
     def load_schema(self) -> dict:
         """
         Loads generated schema from drf_spectacular and returns it as a dict.
         """
-        str_schema = orjson.dumps(self.schema_generator.get_schema(public=True)).decode(
-            "utf-8"
-        )
-        return cast("dict", orjson.loads(str_schema))
+        return self.parse_schema_source(self.load_schema_source())
+
+    def load_schema_source(self) -> bytes:
+        return orjson.dumps(self.schema_generator.get_schema(public=True))
+
+    def parse_schema_source(self, source: bytes) -> dict:
+        return cast("dict", orjson.loads(source))
 
     def resolve_path(
         self, endpoint_path: str, method: str
@@ -272,6 +491,13 @@ class DrfSpectacularSchemaLoader(BaseSchemaLoader):
             resolved_path,
         )
 
+    def get_route_prefix(self) -> str | None:
+        from drf_spectacular.settings import spectacular_settings
+
+        path_prefix = spectacular_settings.SCHEMA_PATH_PREFIX or ""
+        # the prefix is a regular expression, which is only trimmed correctly when it is a literal
+        return None if re.search(r"[\\.^$*+?{}\[\]|()]", path_prefix) else path_prefix
+
 
 class StaticSchemaLoader(BaseSchemaLoader):
     """
@@ -283,6 +509,20 @@ class StaticSchemaLoader(BaseSchemaLoader):
 
         self.path = path if not isinstance(path, pathlib.PosixPath) else str(path)
 
+    def get_source_key(self) -> tuple | None:
+        """
+        Static schemas are identified by their absolute path and modification time, so that editing the file
+        invalidates the registered schema.
+        """
+        try:
+            modified_at = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        return os.path.abspath(self.path), modified_at
+
+    def get_base_uri(self) -> str:
+        return get_document_uri(self.path)
+
     def load_schema(self) -> dict[str, Any]:
         """
         Loads a static OpenAPI schema from file, and parses it to a python dict.
@@ -290,14 +530,19 @@ class StaticSchemaLoader(BaseSchemaLoader):
         :return: Schema contents as a dict
         :raises: ImproperlyConfigured
         """
-        with open(self.path, encoding="utf-8") as file:
-            content = file.read()
-            return cast(
-                "dict",
-                orjson.loads(content)
-                if ".json" in self.path
-                else yaml.load(content, Loader=yaml.FullLoader),
-            )
+        return self.parse_schema_source(self.load_schema_source())
+
+    def load_schema_source(self) -> bytes:
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def parse_schema_source(self, source: bytes) -> dict:
+        return cast(
+            "dict",
+            orjson.loads(source)
+            if ".json" in self.path
+            else yaml.load(source, Loader=yaml.FullLoader),
+        )
 
 
 class UrlStaticSchemaLoader(BaseSchemaLoader):
@@ -309,6 +554,12 @@ class UrlStaticSchemaLoader(BaseSchemaLoader):
         super().__init__(field_key_map=field_key_map)
         self.url = url
 
+    def get_source_key(self) -> tuple | None:
+        return (self.url,)
+
+    def get_base_uri(self) -> str:
+        return self.url
+
     def load_schema(self) -> dict[str, Any]:
         """
         Loads a static OpenAPI schema from url, and parses it to a python dict.
@@ -316,12 +567,17 @@ class UrlStaticSchemaLoader(BaseSchemaLoader):
         :return: Schema contents as a dict
         :raises: ImproperlyConfigured
         """
-        response = requests.get(self.url, timeout=20)
+        return self.parse_schema_source(self.load_schema_source())
+
+    def load_schema_source(self) -> bytes:
+        return requests.get(self.url, timeout=20).content
+
+    def parse_schema_source(self, source: bytes) -> dict:
         return cast(
             "dict",
             (
-                orjson.loads(response.content)
+                orjson.loads(source)
                 if ".json" in self.url
-                else yaml.load(response.content, Loader=yaml.FullLoader)
+                else yaml.load(source, Loader=yaml.FullLoader)
             ),
         )
@@ -0,0 +1,53 @@
+"""Memo Module - remembers the values of an exchange that were validated successfully."""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from openapi_tester.compiler import CompiledSchemaSection
+
+
+class SubtreeMemo:
+    """
+    The (compiled schema section, value) pairs validated successfully during one exchange, so that values repeated
+    in a payload (e.g. the same embedded object on every item of a list) are validated once, see ``SchemaTester.walk``.
+
+    Values are keyed by a digest of their JSON serialization, so only JSON data (as decoded from a response body)
+    may be memoized: values of other types (tuples, UUIDs, enums) serialize like JSON values they do not validate like.
+    At most ``max_size`` pairs are remembered.
+    """
+
+    __slots__ = ("_validated",)
+
+    max_size = 100_000
+
+    def __init__(self) -> None:
+        self._validated: set[tuple[CompiledSchemaSection, bool, bytes]] = set()
+
+    def get_key(
+        self, compiled: CompiledSchemaSection, data: Any, is_query_params: bool
+    ) -> tuple[CompiledSchemaSection, bool, bytes] | None:
+        """
+        Returns the key of a value validated against a compiled section, or None if the value can't be serialized.
+        """
+        try:
+            serialized = orjson.dumps(data)
+        except TypeError:
+            return None
+        return compiled, is_query_params, blake2b(serialized, digest_size=16).digest()
+
+    def add(self, key: tuple[CompiledSchemaSection, bool, bytes]) -> None:
+        if len(self._validated) < self.max_size:
+            self._validated.add(key)
+
+    def __contains__(self, key: tuple[CompiledSchemaSection, bool, bytes]) -> bool:
+        return key in self._validated
+
+    def __len__(self) -> int:
+        return len(self._validated)
@@ -0,0 +1,137 @@
+"""Operations Module - precomputed views of the documented operations of a schema."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from openapi_tester.utils import query_params_to_object
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+JSON_MEDIA_TYPE_PATTERN = re.compile(r"^application\/.*json$")
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+
+def get_json_media_type(content_object: Mapping[str, Any]) -> str | None:
+    """
+    Returns the first JSON media type of a content object, e.g. ``application/json`` or
+    ``application/vnd.api+json``.
+    """
+    for media_type in content_object:
+        if JSON_MEDIA_TYPE_PATTERN.match(media_type):
+            return media_type
+    return None
+
+
+def get_status_code_key(
+    responses_object: Mapping[str | int, Any], status_code: str | int
+) -> str | int | None:
+    """
+    Returns the key documenting a status code: the status code itself, its range (e.g. ``2XX``) or ``default``.
+    """
+    for key in (
+        str(status_code),
+        int(status_code),
+        f"{str(status_code)[0]}XX",
+        f"{str(status_code)[0]}xx",
+        "default",
+    ):
+        if key in responses_object:
+            return key
+    return None
+
+
+def get_content_schema(container: Mapping[str, Any]) -> dict[str, Any] | None:
+    """
+    Returns the schema of the first JSON media type of a request body or response object, or None if it documents
+    none.
+    """
+    content_object = container.get("content")
+    if not content_object:
+        return None
+    media_type = get_json_media_type(content_object)
+    if media_type is None:
+        return None
+    return (content_object[media_type] or {}).get("schema")
+
+
+class Operation:
+    """
+    A documented operation (a path and method), with the schemas an exchange needs ready to use: the request body
+    schema, the query parameters converted to an object schema and the response schema of each documented status
+    code. Schemas that are not documented are None, and left to the callers to diagnose.
+    """
+
+    def __init__(self, method_object: Mapping[str, Any], swagger: bool = False) -> None:
+        self.method_object = method_object
+        self.request_body_schema = get_content_schema(
+            method_object.get("requestBody") or {}
+        )
+        self.query_parameters: list[dict[str, Any]] = [
+            parameter
+            for parameter in method_object.get("parameters", [])
+            if parameter.get("in") == "query"
+        ]
+        self.query_parameters_schema = query_params_to_object(self.query_parameters)
+        # openapi 2.0, i.e. "swagger", documents response schemas in the response objects themselves
+        self.response_schemas: dict[str | int, dict[str, Any] | None] = {
+            key: response_object.get("schema")
+            if swagger
+            else get_content_schema(response_object)
+            for key, response_object in (method_object.get("responses") or {}).items()
+        }
+        self._status_code_keys: dict[str | int, str | int | None] = {}
+
+    def get_response_schema(self, status_code: str | int) -> dict[str, Any] | None:
+        """
+        Returns the response schema documented for a status code, falling back to its range (e.g. ``2XX``) and the
+        ``default`` response (see ``get_status_code_key``), or None if none is documented.
+        """
+        if status_code not in self._status_code_keys:
+            self._status_code_keys[status_code] = get_status_code_key(
+                self.response_schemas, status_code
+            )
+        key = self._status_code_keys[status_code]
+        return None if key is None else self.response_schemas[key]
+
+
+class OperationTable:
+    """
+    Operations of a paths object, keyed by path template and method.
+
+    The operations of every path item are built with the table, except those of lazily resolved path items (see
+    ``ReferenceResolver.resolve_lazily``), which are built when first looked up, so that lazily loaded schemas are not
+    resolved as a whole.
+    """
+
+    def __init__(self, paths_object: Mapping[str, Any], swagger: bool = False) -> None:
+        self.paths_object = paths_object
+        self.swagger = swagger
+        self._operations: dict[tuple[str, str], Operation] = {}
+        for template, path_item in paths_object.items():
+            if isinstance(path_item, dict):
+                for method in HTTP_METHODS:
+                    if path_item.get(method) is not None:
+                        self.build(template, method)
+
+    def build(self, template: str, method: str) -> Operation:
+        operation = self._operations[template, method] = Operation(
+            self.paths_object[template][method], swagger=self.swagger
+        )
+        return operation
+
+    def get(self, template: str, method: str) -> Operation | None:
+        """
+        Returns the operation documented for a path template and method, or None if it is not documented.
+        """
+        operation = self._operations.get((template, method))
+        if operation is not None:
+            return operation
+        path_item = self.paths_object.get(template)
+        if method not in HTTP_METHODS or not path_item or path_item.get(method) is None:
+            return None
+        return self.build(template, method)
@@ -0,0 +1,43 @@
+"""Registry Module - shares prepared OpenAPI schemas across loaders within a process."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class SchemaRegistry:
+    """
+    Process-wide store of prepared schemas.
+
+    Preparing a schema (de-referencing, spec validation and path normalization) is by far the most expensive part of
+    a loader's lifecycle, and every ``SchemaTester`` (e.g. one per ``OpenAPIClient``) creates its own loader. Loaders
+    therefore look their prepared schema up here, keyed by their identity (see ``BaseSchemaLoader.get_registry_key``),
+    so that the work is done once per process.
+
+    A registered schema is the very dict every loader with the same identity returns as ``loader.schema``: it must
+    not be changed in place. Loaders that need a different schema should set their own with ``set_schema``.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[Hashable, dict] = {}
+
+    def get(self, key: Hashable) -> dict | None:
+        return self._schemas.get(key)
+
+    def register(self, key: Hashable, schema: dict) -> None:
+        self._schemas[key] = schema
+
+    def clear(self) -> None:
+        self._schemas.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._schemas
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+schema_registry = SchemaRegistry()
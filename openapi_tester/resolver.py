@@ -0,0 +1,370 @@
+"""Resolver Module - de-references OpenAPI schemas into a graph of shared nodes."""
+
+from __future__ import annotations
+
+import pathlib
+from collections.abc import MutableMapping
+from functools import partial
+from typing import TYPE_CHECKING, TypeGuard, cast
+from urllib.parse import unquote, urldefrag, urljoin, urlparse
+
+import orjson
+import requests
+import yaml
+
+from openapi_tester.exceptions import OpenAPISchemaError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any
+
+# Top level objects holding reusable components, e.g. "#/components/schemas" or (OpenAPI 2.0) "#/definitions"
+COMPONENT_SECTIONS = ("components", "definitions", "parameters", "responses")
+
+
+class ReferenceResolutionError(OpenAPISchemaError):
+    """
+    Raised when a ``$ref`` cannot be resolved.
+    """
+
+    pass
+
+
+def is_reference(node: Any) -> TypeGuard[dict]:
+    return isinstance(node, dict) and isinstance(node.get("$ref"), str)
+
+
+def references_other_documents(document: Any) -> bool:
+    """
+    Returns whether a document has references to other documents, i.e. references that are not JSON pointers into
+    the document itself.
+    """
+    stack = [document]
+    seen: set[int] = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, dict):
+            if is_reference(node) and not node["$ref"].startswith("#"):
+                return True
+            stack.extend(
+                value for value in node.values() if isinstance(value, (dict, list))
+            )
+        elif isinstance(node, list):
+            stack.extend(value for value in node if isinstance(value, (dict, list)))
+    return False
+
+
+def get_top_level_document(document: dict) -> dict:
+    """
+    Returns the top level objects of a document besides its paths and components, with empty paths if it has paths,
+    so that they can be validated against the OpenAPI specification without the rest of the document.
+    """
+    top_level_document = {
+        name: value
+        for name, value in document.items()
+        if name != "paths" and name not in COMPONENT_SECTIONS
+    }
+    if "paths" in document:
+        top_level_document["paths"] = {}
+    return top_level_document
+
+
+def get_operation_document(
+    document: dict, path: str, path_item: dict, key: Any
+) -> dict:
+    """
+    Returns a document with one value of a path item (usually an operation) and the path level parameters, the top
+    level objects of the document (see ``get_top_level_document``), and the components they reference, so that the
+    value can be validated against the OpenAPI specification without the rest of the document.
+    """
+    operation_document = get_top_level_document(document)
+    path_item = {
+        name: path_item[name] for name in ("parameters", key) if name in path_item
+    }
+    operation_document["paths"] = {path: path_item}
+    stack: list[Any] = [path_item]
+    seen: set[int] = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        stack.extend(node.values())
+        if not is_reference(node) or not node["$ref"].startswith("#/"):
+            continue
+        tokens = [
+            unquote(token).replace("~1", "/").replace("~0", "~")
+            for token in node["$ref"][2:].split("/")
+        ]
+        # the referenced component (e.g. "#/components/schemas/Pet") or path item is copied as a whole
+        tokens = tokens[: 3 if tokens[0] == "components" else 2]
+        source, target = document, operation_document
+        try:
+            for token in tokens[:-1]:
+                source = source[token]
+                target = target.setdefault(token, {})
+            target[tokens[-1]] = source[tokens[-1]]
+        except (KeyError, TypeError):
+            # unresolvable references are reported by the resolver
+            continue
+        stack.append(source[tokens[-1]])
+    return operation_document
+
+
+def get_document_uri(path: str) -> str:
+    """
+    Returns the URI used to resolve references relative to a schema file.
+    """
+    return pathlib.Path(path).absolute().as_uri()
+
+
+class ReferenceResolver:
+    """
+    De-references every ``$ref`` of an OpenAPI document.
+
+    Every reference to the same target resolves to one shared object, so resolving a schema costs one node per
+    component instead of one copy per use site, and recursive components become cycles in the resolved graph rather
+    than being unrolled. Consumers walking the resolved schema must therefore follow the data they validate (as the
+    schema tester does) instead of walking the schema itself.
+
+    As with most resolvers, a ``$ref`` replaces the object containing it, including any sibling keys. References to
+    other documents are resolved relative to ``base_uri`` and fetched once per resolver.
+    """
+
+    def __init__(self, document: dict, base_uri: str = "") -> None:
+        self.base_uri = urldefrag(base_uri).url
+        self.documents: dict[str, Any] = {self.base_uri: document}
+        self._resolved: dict[int, Any] = {}
+        self._resolving: set[int] = set()
+
+    def resolve(self) -> dict:
+        """
+        Returns the de-referenced document. The source document is left untouched.
+        """
+        return cast(
+            "dict", self.resolve_node(self.documents[self.base_uri], self.base_uri)
+        )
+
+    def resolve_lazily(
+        self,
+        prepare: Callable[[Any], Any] | None = None,
+        validate: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """
+        Returns the document with its path items and component sections wrapped in ``LazyMapping`` objects, so that
+        operations and components (and everything they reference) are only de-referenced when first accessed.
+
+        :param prepare: An optional callable applied to each operation once it is de-referenced
+        :param validate: An optional callable validating each operation before it is de-referenced, passed the
+            operation with the parts of the document it uses (see ``get_operation_document``)
+        """
+        document = self.documents[self.base_uri]
+        resolved: dict[str, Any] = {}
+        for key, value in document.items():
+            if key == "paths" and isinstance(value, dict):
+                resolved[key] = {
+                    path: self.get_lazy_path_item(path, path_item, prepare, validate)
+                    for path, path_item in value.items()
+                }
+            elif key == "components" and isinstance(value, dict):
+                resolved[key] = {
+                    section: LazyMapping(
+                        self, *self.get_target(components, self.base_uri)
+                    )
+                    for section, components in value.items()
+                }
+            elif key in COMPONENT_SECTIONS and isinstance(value, dict):
+                resolved[key] = LazyMapping(self, value, self.base_uri)
+            else:
+                resolved[key] = self.resolve_node(value, self.base_uri)
+        return resolved
+
+    def get_lazy_path_item(
+        self,
+        path: str,
+        path_item: Any,
+        prepare: Callable[[Any], Any] | None,
+        validate: Callable[[dict], None] | None,
+    ) -> LazyMapping:
+        node, document_uri = self.get_target(path_item, self.base_uri)
+        return LazyMapping(
+            self,
+            node,
+            document_uri,
+            prepare=prepare,
+            # path items of other documents reference their own document, so they are not validated
+            validate=None
+            if validate is None or document_uri != self.base_uri
+            else partial(self.validate_path_item_value, validate, path, node),
+        )
+
+    def validate_path_item_value(
+        self, validate: Callable[[dict], None], path: str, path_item: dict, key: Any
+    ) -> None:
+        validate(
+            get_operation_document(self.documents[self.base_uri], path, path_item, key)
+        )
+
+    def resolve_node(self, node: Any, document_uri: str) -> Any:
+        if not isinstance(node, (dict, list)):
+            return node
+        node_id = id(node)
+        if node_id in self._resolved:
+            return self._resolved[node_id]
+        if is_reference(node):
+            return self.resolve_reference(node, document_uri)
+        resolved: dict | list
+        if isinstance(node, dict):
+            # registered before descending, so references back to this node close a cycle
+            resolved = self._resolved[node_id] = {}
+            for key, value in node.items():
+                resolved[key] = self.resolve_node(value, document_uri)
+        else:
+            resolved = self._resolved[node_id] = []
+            resolved.extend(self.resolve_node(value, document_uri) for value in node)
+        return resolved
+
+    def resolve_reference(self, node: dict, document_uri: str) -> Any:
+        node_id = id(node)
+        if node_id in self._resolving:
+            raise ReferenceResolutionError(
+                f"Could not resolve reference `{node['$ref']}`: it only refers to itself."
+            )
+        self._resolving.add(node_id)
+        try:
+            resolved = self.resolve_node(*self.get_reference_target(node, document_uri))
+        finally:
+            self._resolving.discard(node_id)
+        self._resolved[node_id] = resolved
+        return resolved
+
+    def get_reference_target(self, node: dict, document_uri: str) -> tuple[Any, str]:
+        """
+        Returns the (unresolved) object a reference points to, and the URI of the document containing it.
+        """
+        target_uri, pointer = urldefrag(urljoin(document_uri, node["$ref"]))
+        target = self.get_pointer_target(
+            self.get_document(target_uri), pointer, node["$ref"]
+        )
+        return target, target_uri
+
+    def get_target(self, node: Any, document_uri: str) -> tuple[Any, str]:
+        """
+        Follows references until reaching an object that is not a reference.
+        """
+        followed: set[int] = set()
+        while is_reference(node):
+            if id(node) in followed:
+                raise ReferenceResolutionError(
+                    f"Could not resolve reference `{node['$ref']}`: it only refers to itself."
+                )
+            followed.add(id(node))
+            node, document_uri = self.get_reference_target(node, document_uri)
+        return node, document_uri
+
+    def get_document(self, uri: str) -> Any:
+        if uri not in self.documents:
+            self.documents[uri] = self.load_document(uri)
+        return self.documents[uri]
+
+    @staticmethod
+    def load_document(uri: str) -> Any:
+        parsed_uri = urlparse(uri)
+        try:
+            if parsed_uri.scheme in ("http", "https"):
+                response = requests.get(uri, timeout=20)
+                response.raise_for_status()
+                source = response.content
+            elif parsed_uri.scheme in ("", "file"):
+                with open(unquote(parsed_uri.path), "rb") as file:
+                    source = file.read()
+            else:
+                raise ReferenceResolutionError(
+                    f"Could not load `{uri}`: unsupported scheme `{parsed_uri.scheme}`."
+                )
+        except (OSError, requests.RequestException) as e:
+            raise ReferenceResolutionError(f"Could not load `{uri}`: {e}") from e
+        if parsed_uri.path.endswith(".json"):
+            return orjson.loads(source)
+        return yaml.load(source, Loader=yaml.FullLoader)
+
+    @staticmethod
+    def get_pointer_target(document: Any, pointer: str, reference: str) -> Any:
+        target = document
+        for token in pointer.split("/")[1:] if pointer else []:
+            key = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                target = target[int(key)] if isinstance(target, list) else target[key]
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                raise ReferenceResolutionError(
+                    f"Could not resolve reference `{reference}`: `{key}` not found."
+                ) from e
+        return target
+
+
+class LazyMapping(MutableMapping):
+    """
+    View of an unresolved object, de-referencing each value the first time it is accessed.
+
+    Resolved values are memoized (and shared) by the resolver, so accessing a value twice, or accessing two values
+    referencing the same component, resolves it once. Values are passed to ``prepare``, when given, the first time
+    they are accessed, and their keys to ``validate``, when given, before they are first resolved. The view can be
+    changed like a dict, without changing the unresolved object.
+    """
+
+    def __init__(
+        self,
+        resolver: ReferenceResolver,
+        node: dict,
+        document_uri: str,
+        prepare: Callable[[Any], Any] | None = None,
+        validate: Callable[[Any], None] | None = None,
+    ) -> None:
+        self.resolver = resolver
+        self.node = node
+        self.document_uri = document_uri
+        self.prepare = prepare
+        self.validate = validate
+        # the values of the view, once resolved, and the keys whose values are not resolved yet
+        self._values: dict[Any, Any] = dict.fromkeys(node)
+        self._unresolved: set[Any] = set(node)
+
+    def __getitem__(self, key: Any) -> Any:
+        if key not in self._unresolved:
+            return self._values[key]
+        if self.validate is not None:
+            self.validate(key)
+        value = self.resolver.resolve_node(self.node[key], self.document_uri)
+        if self.prepare is not None:
+            value = self.prepare(value)
+        self._values[key] = value
+        self._unresolved.discard(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._values[key] = value
+        self._unresolved.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        del self._values[key]
+        self._unresolved.discard(key)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._values)!r})"
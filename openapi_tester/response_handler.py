@@ -2,16 +2,33 @@
 This module contains the concrete response handlers for both DRF and Django Ninja responses.
 """
 
+import contextlib
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qsl
 
+import orjson
+from django.http import StreamingHttpResponse
+from django.test.client import JSON_CONTENT_TYPE_RE
+from django.utils.functional import cached_property
+
+from openapi_tester.streaming import iter_chunks, iter_kept
+from openapi_tester.utils import to_json_data
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from django.http.response import HttpResponse
     from rest_framework.response import Response
 
+# orjson decodes integers beyond 64 bits as floats, so bodies with numbers of 19 digits or more are decoded by
+# ``json``. Digits are mapped to zeros to find them, which is much faster than a regular expression on large bodies.
+DIGITS_TO_ZEROS = bytes.maketrans(b"123456789", b"000000000")
+LONG_NUMBER = b"0" * 19
+
 
 @dataclass
 class GenericRequest:
@@ -28,6 +45,8 @@ class ResponseHandler(ABC):
     """
     This class is used to handle the response and request data
     from both DRF and Django HTTP (Django Ninja) responses.
+
+    The response body is decoded on first access of ``data``, and then reused for the rest of the exchange.
     """
 
     def __init__(self, response: "Response | HttpResponse") -> None:
@@ -42,8 +61,29 @@ class ResponseHandler(ABC):
     def request(self) -> GenericRequest: ...
 
     @property
+    def data(self) -> dict | None:
+        return self.decoded_data
+
+    @cached_property
+    def decoded_data(self) -> dict | None:
+        """
+        The decoded response body, decoded once per handler.
+        """
+        return self._decode()
+
     @abstractmethod
-    def data(self) -> dict | None: ...
+    def _decode(self) -> dict | None:
+        """
+        Decodes the response body.
+        """
+
+    @property
+    def native_data(self) -> Any:
+        """
+        The response data, taken from the response before it was rendered if the handler can: see
+        ``DRFResponseHandler.native_data``. Otherwise, the decoded body.
+        """
+        return self.data
 
     @staticmethod
     def _normalize_query_params(query_params: dict) -> dict:
@@ -70,6 +110,39 @@ class ResponseHandler(ABC):
                     normalized_query_params[key] = value
         return normalized_query_params
 
+    def iter_content(self, min_size: int = 0) -> "Iterable[bytes | memoryview] | None":
+        """
+        Returns the chunks of the rendered body, if it has at least ``min_size`` bytes or is streamed (e.g. by a
+        ``StreamingHttpResponse``, whose size is only known once it is read), and None otherwise, e.g. for responses
+        that are not rendered yet.
+        """
+        response = self.response
+        if not getattr(response, "is_rendered", True):
+            return None
+        # streaming responses have no content attribute
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return iter_chunks(content) if len(content) >= min_size else None
+        if isinstance(response, StreamingHttpResponse):
+            # streamed bodies can only be read once: the chunks read here are kept, and handed back to the response
+            # with the unread ones, so that the test can still read the whole body
+            chunks = iter(response.streaming_content)
+            kept: list[bytes] = []
+            response.streaming_content = chain(kept, chunks)
+            return iter_kept(chunks, kept)
+        return None
+
+    @staticmethod
+    def _load_json(content: bytes, load: "Callable[[], Any]") -> Any:
+        """
+        Decodes a JSON body with orjson, or with ``load`` (the ``json()`` method of the response) when orjson would
+        decode it differently (integers beyond 64 bits) or rejects it (e.g. NaN).
+        """
+        if LONG_NUMBER not in content.translate(DIGITS_TO_ZEROS):
+            with contextlib.suppress(orjson.JSONDecodeError):
+                return orjson.loads(content)
+        return load()
+
     @abstractmethod
     def endpoint(self) -> str: ...
 
@@ -81,30 +154,72 @@ class DRFResponseHandler(ResponseHandler):
 
     def __init__(self, response: "Response") -> None:
         super().__init__(response)
-        self._request_path = self.response.renderer_context["request"].path  # type: ignore[attr-defined]
-        self._request_method = self.response.renderer_context["request"].method  # type: ignore[attr-defined]
-        self._request_data = self.response.renderer_context["request"].data  # type: ignore[attr-defined]
-        self._request_headers = self.response.renderer_context["request"].headers  # type: ignore[attr-defined]
-        self._request_query_params = self._normalize_query_params(
-            self.response.renderer_context["request"].query_params  # type: ignore[attr-defined]
+        request = self.response.renderer_context["request"]  # type: ignore[attr-defined]
+        self._request = GenericRequest(
+            path=request.path,
+            method=request.method,
+            data=request.data,
+            headers=request.headers,
+            query_params=self._normalize_query_params(request.query_params),
         )
 
+    def _decode(self) -> dict | None:
+        response = self.response
+        if response.data is None:  # type: ignore[attr-defined]
+            return None
+        content_type = (
+            response.get("Content-Type")
+            if getattr(response, "is_rendered", True)
+            else None
+        )
+        if (
+            isinstance(content_type, str)
+            and JSON_CONTENT_TYPE_RE.match(content_type)
+            and response.charset.lower() in ("utf-8", "utf8")
+        ):
+            return self._load_json(response.content, response.json)  # type: ignore[attr-defined]
+        return response.json()  # type: ignore[attr-defined]
+
     @property
-    def data(self) -> dict | None:
-        return self.response.json() if self.response.data is not None else None  # type: ignore[attr-defined]
+    def native_data(self) -> Any:
+        return self.converted_data
+
+    @cached_property
+    def converted_data(self) -> Any:
+        """
+        ``response.data`` converted to the data its JSON body would decode to, when the response is to be rendered
+        by DRF's ``JSONRenderer`` and is not rendered yet (e.g. returned by a view called with ``APIRequestFactory``):
+        the response is validated without being rendered. The data is converted by ``to_json_data``, with the
+        renderer's encoder for the values JSON has no type for, and rejecting ``NaN`` and infinities as strict
+        renderers do.
+
+        Rendered bodies are decoded, which is cheaper than converting the data, as are the bodies of other
+        renderers, which may change the data (e.g. the casing of its keys).
+        """
+        from rest_framework.renderers import JSONRenderer
+
+        response = self.response
+        renderer = getattr(response, "accepted_renderer", None)
+        if (
+            getattr(response, "is_rendered", True)
+            or not isinstance(renderer, JSONRenderer)
+            or type(renderer).render is not JSONRenderer.render
+        ):
+            return self.data
+        if response.data is None:  # type: ignore[attr-defined]
+            return None
+        return to_json_data(
+            response.data,  # type: ignore[attr-defined]
+            renderer.encoder_class().default,
+            allow_nan=not renderer.strict,
+        )
 
     @property
     def request(self) -> GenericRequest:
-        return GenericRequest(
-            path=self._request_path,
-            method=self._request_method,
-            data=self._request_data,
-            headers=self._request_headers,
-            query_params=self._request_query_params,
-        )
+        return self._request
 
     def endpoint(self) -> str:
-        return f"{self._request_method} {self._request_path}"
+        return f"{self._request.method} {self._request.path}"
 
 
 class DjangoNinjaResponseHandler(ResponseHandler):
@@ -116,25 +231,25 @@ class DjangoNinjaResponseHandler(ResponseHandler):
         self, *request_args, response: "HttpResponse", path_prefix: str = "", **kwargs
     ) -> None:
         super().__init__(response)
-        self._request_method = request_args[0]
-        self._request_path = self._build_request_path(request_args[1], path_prefix)
-        self._request_query_params = self._build_request_query_params(request_args[1])
-        self._request_data = self._build_request_data(request_args[2])
-        self._request_headers = kwargs
+        self._request = GenericRequest(
+            path=self._build_request_path(request_args[1], path_prefix),
+            method=request_args[0],
+            data=self._build_request_data(request_args[2]),
+            headers=kwargs,
+            query_params=self._build_request_query_params(request_args[1]),
+        )
 
-    @property
-    def data(self) -> dict | None:
-        return self.response.json() if self.response.content else None  # type: ignore[attr-defined]
+    def _decode(self) -> dict | None:
+        content = self.response.content
+        if not content:
+            return None
+        if isinstance(content, bytes):
+            return self._load_json(content, self.response.json)  # type: ignore[attr-defined]
+        return self.response.json()
 
     @property
     def request(self) -> GenericRequest:
-        return GenericRequest(
-            path=self._request_path,
-            method=self._request_method,
-            data=self._request_data,
-            headers=self._request_headers,
-            query_params=self._request_query_params,
-        )
+        return self._request
 
     def _build_request_path(self, request_path: str, path_prefix: str) -> str:
         request_path = request_path.split("?")[0]
@@ -154,4 +269,4 @@ class DjangoNinjaResponseHandler(ResponseHandler):
             return {}
 
     def endpoint(self) -> str:
-        return f"{self._request_method} {self._request_path}"
+        return f"{self._request.method} {self._request.path}"
@@ -0,0 +1,187 @@
+"""Routing Module - maps request paths to the documented path templates of a schema."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from openapi_tester.constants import UNDOCUMENTED_SCHEMA_SECTION_ERROR
+from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.operations import OperationTable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from openapi_tester.loaders import BaseSchemaLoader
+    from openapi_tester.operations import Operation
+
+PATH_PARAMETER_PATTERN = re.compile(r"{[^{}/]+}")
+
+
+@dataclass(slots=True)
+class RouteNode:
+    """
+    Node of the route trie, holding one path segment.
+    """
+
+    segments: dict[str, RouteNode] = field(default_factory=dict)
+    patterns: list[tuple[re.Pattern, RouteNode]] = field(default_factory=list)
+    template: str | None = None
+
+
+class RouteIndex:
+    """
+    Segment trie of documented path templates.
+
+    A request path is matched in a single pass over its segments: literal segments (``/api/pets``) are looked up
+    first, then segments containing path parameters (``{id}``, ``{id}.json``), so that ``/pets/mine`` is matched to
+    ``/pets/mine`` rather than ``/pets/{id}`` when both are documented.
+    """
+
+    def __init__(self, templates: Iterable[str]) -> None:
+        self.root = RouteNode()
+        for template in templates:
+            self.add(template)
+
+    def add(self, template: str) -> None:
+        node = self.root
+        for segment in template.split("/"):
+            if PATH_PARAMETER_PATTERN.search(segment) is None:
+                node = node.segments.setdefault(segment, RouteNode())
+                continue
+            pattern = self.compile_segment(segment)
+            for existing_pattern, child in node.patterns:
+                if existing_pattern.pattern == pattern.pattern:
+                    node = child
+                    break
+            else:
+                child = RouteNode()
+                node.patterns.append((pattern, child))
+                node = child
+        if node.template is None:
+            node.template = template
+
+    @staticmethod
+    def compile_segment(segment: str) -> re.Pattern:
+        parts = PATH_PARAMETER_PATTERN.split(segment)
+        return re.compile("[^/]+".join(re.escape(part) for part in parts) + r"\Z")
+
+    def match(self, path: str) -> str | None:
+        """
+        Returns the documented template matching the path, or ``None``.
+        """
+        return self._match(self.root, path.split("/"), 0)
+
+    def _match(self, node: RouteNode, segments: list[str], index: int) -> str | None:
+        if index == len(segments):
+            return node.template
+        segment = segments[index]
+        child = node.segments.get(segment)
+        if child is not None:
+            template = self._match(child, segments, index + 1)
+            if template is not None:
+                return template
+        if segment:
+            for pattern, child in node.patterns:
+                if pattern.match(segment):
+                    template = self._match(child, segments, index + 1)
+                    if template is not None:
+                        return template
+        return None
+
+
+class SchemaRouter:
+    """
+    Routes requests to the documented operations of a loader's schema.
+
+    The paths object, with the path prefix, and the route index and operation table built from it are kept for as
+    long as the loader returns the same schema.
+    """
+
+    def __init__(
+        self, loader: BaseSchemaLoader, path_prefix: str | None = None
+    ) -> None:
+        self.loader = loader
+        self.path_prefix = path_prefix
+        self._prefixed_paths: tuple[dict, dict[str, Any]] | None = None
+        self._route_index: tuple[dict, RouteIndex] | None = None
+        self._operations: tuple[dict, OperationTable] | None = None
+
+    def get_paths_object(self) -> dict[str, Any]:
+        schema = self.loader.get_schema()
+        if "paths" not in schema:
+            raise UndocumentedSchemaSectionError(
+                UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(key="paths", error_addon="")
+            )
+        paths_object = schema["paths"]
+        if self.path_prefix:
+            # the prefixed paths are rebuilt only when the loader's schema changes
+            if (
+                self._prefixed_paths is None
+                or self._prefixed_paths[0] is not paths_object
+            ):
+                self._prefixed_paths = (
+                    paths_object,
+                    {
+                        f"{self.path_prefix}{key}": value
+                        for key, value in paths_object.items()
+                    },
+                )
+            paths_object = self._prefixed_paths[1]
+
+        return paths_object
+
+    def get_route_index(self) -> RouteIndex:
+        """
+        Returns the route index of the documented paths, built once per schema.
+        """
+        paths_object = self.get_paths_object()
+        if self._route_index is None or self._route_index[0] is not paths_object:
+            self._route_index = (paths_object, RouteIndex(paths_object))
+        return self._route_index[1]
+
+    def get_operation_table(self) -> OperationTable:
+        """
+        Returns the operation table of the documented paths, built once per schema.
+        """
+        paths_object = self.get_paths_object()
+        if self._operations is None or self._operations[0] is not paths_object:
+            self._operations = (
+                paths_object,
+                OperationTable(
+                    paths_object, swagger="openapi" not in self.loader.get_schema()
+                ),
+            )
+        return self._operations[1]
+
+    def get_operation(self, template: str, method: str) -> Operation | None:
+        """
+        Returns the operation documented for a path template and method, or None if it is not documented.
+        """
+        return self.get_operation_table().get(template, method)
+
+    def get_documented_path(self, path: str, method: str) -> str:
+        """
+        Returns the documented path template matching a request path.
+
+        Request paths are matched against the route index of the schema. Paths that are not documented, or
+        loaders trimming prefixes that cannot be matched literally, fall back to resolving the path through the
+        loader, which also provides the error message for unresolvable paths.
+        """
+        route_prefix = self.loader.get_route_prefix()
+        if route_prefix is not None:
+            route_path = urlparse(path).path
+            if not route_path.startswith("/"):
+                route_path = f"/{route_path}"
+            if route_path.startswith(route_prefix):
+                route_path = route_path[len(route_prefix) :]
+                route_index = self.get_route_index()
+                template = route_index.match(route_path)
+                if template is None and route_path.endswith("/"):
+                    template = route_index.match(route_path[:-1])
+                if template is not None:
+                    return template
+        parameterized_path, _ = self.loader.resolve_path(path, method=method)
+        return parameterized_path
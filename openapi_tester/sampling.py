@@ -0,0 +1,106 @@
+"""Sampling Module - picks the items of large arrays and additionalProperties maps that are validated."""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from random import Random
+from typing import TYPE_CHECKING, TypeVar
+
+from openapi_tester.exceptions import SamplingWarning
+
+if TYPE_CHECKING:
+    from openapi_tester.config import SamplingPolicy
+
+T = TypeVar("T")
+
+
+@dataclass
+class SamplingRecord:
+    """What sampling left out of the data of one endpoint."""
+
+    sections: int = 0
+    items: int = 0
+    skipped: int = 0
+
+
+class SamplingReport:
+    """
+    Process-wide record of what sampling left unvalidated, by endpoint: the number of sampled arrays and maps, of
+    their items, and of the items that were skipped.
+
+    A ``SamplingWarning`` is emitted the first time items of an endpoint are skipped, pointing to the report.
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, SamplingRecord] = {}
+
+    def record(self, endpoint: str, items: int, skipped: int) -> None:
+        if endpoint not in self.endpoints:
+            warnings.warn(
+                f"Only a sample of the data of `{endpoint}` is validated: {skipped} of {items} items were skipped."
+                " See openapi_tester.sampling.sampling_report for the items skipped so far.",
+                SamplingWarning,
+                stacklevel=2,
+            )
+        record = self.endpoints.setdefault(endpoint, SamplingRecord())
+        record.sections += 1
+        record.items += items
+        record.skipped += skipped
+
+    @property
+    def skipped(self) -> int:
+        return sum(record.skipped for record in self.endpoints.values())
+
+    def clear(self) -> None:
+        self.endpoints.clear()
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{endpoint}: skipped {record.skipped} of {record.items} items"
+            f" in {record.sections} sampled arrays and maps"
+            for endpoint, record in self.endpoints.items()
+        )
+
+
+sampling_report = SamplingReport()
+
+
+@dataclass(frozen=True)
+class Sampler:
+    """
+    Samples the items of the arrays and ``additionalProperties`` maps of an endpoint's data with a sampling policy, see
+    ``SamplingSettings``: its first and last items and a random sample of the others, in their original order. The
+    random sample is seeded, so the same data is always sampled the same way.
+    """
+
+    settings: SamplingPolicy
+    endpoint: str
+    report: SamplingReport = sampling_report
+
+    def sample(self, items: list[T], record: bool = True) -> list[T]:
+        """
+        Returns the items to validate, ``items`` itself when there are too few of them to be sampled.
+        """
+        first, last, random = (
+            self.settings.first,
+            self.settings.last,
+            self.settings.random,
+        )
+        size = len(items)
+        if size <= first + last + random:
+            return items
+        end = size - last
+        sampled = [
+            *items[:first],
+            *(
+                items[index]
+                for index in sorted(
+                    Random(self.settings.seed).sample(range(first, end), random)
+                )
+            ),
+            *items[end:],
+        ]
+        if record:
+            self.report.record(self.endpoint, size, size - len(sampled))
+        return sampled
@@ -0,0 +1,79 @@
+"""Schema Cache Module - persists prepared OpenAPI schemas between test runs."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Bump whenever the layout of prepared schemas changes without a release.
+SCHEMA_CACHE_FORMAT = 4
+
+
+def get_library_version() -> str:
+    try:
+        return version("django-contract-tester")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SchemaCache:
+    """
+    Directory of prepared (de-referenced, validated and normalized) schemas.
+
+    Entries are keyed by a hash of the source document, the context the schema was prepared in and the library
+    version, so changing any of them makes the entry unreachable instead of stale. Artifacts are pickled, which keeps
+    them compact and preserves shared and recursive schema nodes. Only point the cache at a directory you trust.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def get_key(source: bytes, context: Iterable[str]) -> str:
+        digest = hashlib.sha256()
+        for part in (get_library_version(), str(SCHEMA_CACHE_FORMAT), *context):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def load(self, key: str) -> dict | None:
+        """
+        Returns the cached schema, or ``None`` if it is missing or unreadable.
+        """
+        try:
+            with open(self.get_path(key), "rb") as file:
+                schema = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        return schema if isinstance(schema, dict) else None
+
+    def store(self, key: str, schema: dict) -> None:
+        """
+        Writes the schema atomically, so concurrent test processes never read a partial artifact.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(schema, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.get_path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+            raise
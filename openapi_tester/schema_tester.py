@@ -4,32 +4,35 @@ from __future__ import annotations
 
 import fnmatch
 import http
-import json
 import re
 from collections.abc import Callable
-from copy import copy, deepcopy
-from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.validators import URLValidator
 from django.http import HttpResponse
 
+from openapi_tester import validators as keyword_validators
+from openapi_tester.codegen import ValidatorGenerator, canonicalize
+from openapi_tester.columnar import is_composed
+from openapi_tester.compiler import (
+    CompiledSchemaSection,
+    SchemaCompiler,
+    get_schema_type,
+)
 from openapi_tester.config import OpenAPITestConfig
 from openapi_tester.config import settings as global_settings
-from openapi_tester.constants import (
-    INIT_ERROR,
-    UNDOCUMENTED_SCHEMA_SECTION_ERROR,
-    VALIDATE_ANY_OF_ERROR,
-    VALIDATE_EXCESS_KEY_ERROR,
-    VALIDATE_EXCESS_QUERY_PARAM_ERROR,
-    VALIDATE_MISSING_KEY_ERROR,
-    VALIDATE_MISSING_QUERY_PARAM_ERROR,
-    VALIDATE_NONE_ERROR,
-    VALIDATE_ONE_OF_ERROR,
-    VALIDATE_READ_ONLY_RESPONSE_KEY_ERROR,
-    VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR,
+from openapi_tester.constants import INIT_ERROR, UNDOCUMENTED_SCHEMA_SECTION_ERROR
+from openapi_tester.context import ExchangeState, ValidationContext
+from openapi_tester.diagnostics import (
+    Diagnostic,
+    render_undocumented_method,
+    render_undocumented_operation_section,
+    render_undocumented_route,
+    render_undocumented_status_code,
 )
 from openapi_tester.exceptions import (
     DocumentationError,
@@ -42,39 +45,40 @@ from openapi_tester.loaders import (
     StaticSchemaLoader,
     UrlStaticSchemaLoader,
 )
-from openapi_tester.utils import (
-    get_required_keys,
-    lazy_combinations,
-    normalize_query_param_value,
-    normalize_schema_section,
-    query_params_to_object,
-    serialize_schema_section_data,
-    should_validate_query_param,
-)
-from openapi_tester.validators import (
-    validate_enum,
-    validate_format,
-    validate_max_items,
-    validate_max_length,
-    validate_max_properties,
-    validate_maximum,
-    validate_min_items,
-    validate_min_length,
-    validate_min_properties,
-    validate_minimum,
-    validate_multiple_of,
-    validate_pattern,
-    validate_type,
-    validate_unique_items,
+from openapi_tester.memo import SubtreeMemo
+from openapi_tester.operations import (
+    JSON_MEDIA_TYPE_PATTERN,
+    get_json_media_type,
+    get_status_code_key,
 )
+from openapi_tester.routing import SchemaRouter
+from openapi_tester.sampling import Sampler
+from openapi_tester.schema_cache import SchemaCache
+from openapi_tester.section_tester import SchemaSectionTester
+from openapi_tester.streaming import iter_json_array
+from openapi_tester.verdicts import VERDICT_CACHE_FORMAT, get_verdict_cache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
     from rest_framework.response import Response
 
     from openapi_tester.response_handler import GenericRequest, ResponseHandler
 
 
-class SchemaTester:
+def has_streamable_items(compiled: CompiledSchemaSection) -> bool:
+    """
+    Returns whether a compiled section documents arrays whose items can be validated one at a time, i.e. without
+    keywords about the array as a whole (``minItems``, ``maxItems``, ``uniqueItems``) or composition.
+    """
+    return (
+        compiled.schema_type == "array"
+        and compiled.validators == (keyword_validators.validate_type,)
+        and not is_composed(compiled)
+    )
+
+
+class SchemaTester(SchemaSectionTester):
     """Schema Tester: this is the base class of the django-contract-tester library"""
 
     loader: (
@@ -83,7 +87,6 @@ class SchemaTester:
         | DrfYasgSchemaLoader
         | UrlStaticSchemaLoader
     )
-    validators: list[Callable[[dict, Any], str | None]]
 
     def __init__(
         self,
@@ -103,10 +106,14 @@ class SchemaTester:
         :param path_prefix: An optional string to prefix the path of the schema file
         :raises: openapi_tester.exceptions.DocumentationError or ImproperlyConfigured
         """
-        self.case_tester = case_tester
-        self._path_prefix = path_prefix
-        self.ignore_case = ignore_case or []
-        self.validators = validators or []
+        super().__init__(
+            case_tester=case_tester, ignore_case=ignore_case, validators=validators
+        )
+        self.compiler = SchemaCompiler()
+        self._generated_validators: dict[
+            tuple[int, str], tuple[CompiledSchemaSection, Callable[[Any], bool]]
+        ] = {}
+        self._section_digests: dict[int, tuple[CompiledSchemaSection, str]] = {}
 
         if schema_file_path is not None:
             try:
@@ -124,10 +131,14 @@ class SchemaTester:
             self.loader = DrfYasgSchemaLoader(field_key_map=field_key_map)
         else:
             raise ImproperlyConfigured(INIT_ERROR)
+        self.router = SchemaRouter(self.loader, path_prefix=path_prefix)
 
     @staticmethod
     def get_key_value(
-        schema: dict[str, dict], key: str, error_addon: str = "", use_regex=False
+        schema: Mapping[str, Any],
+        key: str,
+        error_addon: str | Diagnostic = "",
+        use_regex=False,
     ) -> dict:
         """
         Returns the value of a given key
@@ -148,39 +159,46 @@ class SchemaTester:
 
     @staticmethod
     def get_status_code(
-        schema: dict[str | int, dict], status_code: str | int, error_addon: str = ""
+        schema: Mapping[str | int, Any],
+        status_code: str | int,
+        error_addon: str | Diagnostic = "",
     ) -> dict:
         """
-        Returns the status code section of a schema, handles both str and int status codes
+        Returns the status code section of a schema, handles both str and int status codes, and falls back to the
+        status code range (e.g. ``2XX``) and the ``default`` response
         """
-        if str(status_code) in schema:
-            return schema[str(status_code)]
-        if int(status_code) in schema:
-            return schema[int(status_code)]
+        status_code_key = get_status_code_key(schema, status_code)
+        if status_code_key is not None:
+            return schema[status_code_key]
         raise UndocumentedSchemaSectionError(
             UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(
                 key=status_code, error_addon=error_addon
             )
         )
 
+    @staticmethod
+    def get_json_object(
+        content_object: Mapping[str, Any],
+        error_addon: str | Diagnostic = "",
+    ) -> dict:
+        """
+        Returns the JSON media type object of a content object
+        """
+        media_type = get_json_media_type(content_object)
+        if media_type is None:
+            raise UndocumentedSchemaSectionError(
+                UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(
+                    key=JSON_MEDIA_TYPE_PATTERN.pattern, error_addon=error_addon
+                )
+            )
+        return content_object[media_type]
+
     @staticmethod
     def get_schema_type(schema: dict[str, str]) -> str | None:
-        if "type" in schema:
-            return schema["type"]
-        if "properties" in schema or "additionalProperties" in schema:
-            return "object"
-        return None
+        return get_schema_type(schema)
 
     def get_paths_object(self) -> dict[str, Any]:
-        schema = self.loader.get_schema()
-        paths_object = self.get_key_value(schema, "paths")
-        if self._path_prefix:
-            paths_object = {
-                f"{self._path_prefix}{key}": value
-                for key, value in paths_object.items()
-            }
-
-        return paths_object
+        return self.router.get_paths_object()
 
     def get_response_schema_section(
         self, response_handler: ResponseHandler, test_config: OpenAPITestConfig
@@ -188,36 +206,46 @@ class SchemaTester:
         """
         Fetches the response section of a schema, wrt. the route, method, status code, and schema version.
 
+        Documented response schemas are looked up in the operation table (see ``Operation``). Otherwise the schema is
+        walked down to the first undocumented section, which raises its error.
+
         :param response: DRF Response Instance
         :return dict
         """
         response = response_handler.response
-        schema = self.loader.get_schema()
 
         response_method = response_handler.request.method.lower()
-        parameterized_path, _ = self.loader.resolve_path(
-            response_handler.request.path,
-            method=response_method,
+        parameterized_path = self.router.get_documented_path(
+            response_handler.request.path, method=response_method
         )
+        operation = self.router.get_operation(parameterized_path, response_method)
+        if operation is not None:
+            response_schema = operation.get_response_schema(response.status_code)
+            if response_schema is not None:
+                return response_schema
+
+        schema = self.loader.get_schema()
         paths_object = self.get_paths_object()
 
         route_object = self.get_key_value(
             paths_object,
             parameterized_path,
-            (
-                f"\n\n{test_config.reference}\n\nUndocumented route {parameterized_path}.\n\nDocumented routes: "
-                + "\n\t• ".join(paths_object.keys())
+            Diagnostic(
+                render_undocumented_route,
+                test_config.reference,
+                parameterized_path,
+                paths_object.keys(),
             ),
         )
 
         method_object = self.get_key_value(
             route_object,
             response_method,
-            (
-                f"\n\n{test_config.reference}"
-                f"\n\nUndocumented method: {response_method}."
-                "\n\nDocumented methods: "
-                f"{[method.lower() for method in route_object.keys() if method.lower() != 'parameters']}."
+            Diagnostic(
+                render_undocumented_method,
+                test_config.reference,
+                response_method,
+                route_object,
             ),
         )
 
@@ -225,10 +253,11 @@ class SchemaTester:
         status_code_object = self.get_status_code(
             responses_object,
             response.status_code,
-            (
-                f"\n\n{test_config.reference}"
-                f"\n\nUndocumented status code: {response.status_code}."
-                f"\n\nDocumented status codes: {list(responses_object.keys())}. "
+            Diagnostic(
+                render_undocumented_status_code,
+                test_config.reference,
+                response.status_code,
+                responses_object,
             ),
         )
 
@@ -240,20 +269,23 @@ class SchemaTester:
             content_object = self.get_key_value(
                 status_code_object,
                 "content",
-                (
-                    f"\n\n{test_config.reference}"
-                    f"\n\nNo content documented for method: {response_method}, path: {parameterized_path}"
+                Diagnostic(
+                    render_undocumented_operation_section,
+                    test_config.reference,
+                    "No content documented for",
+                    response_method,
+                    parameterized_path,
                 ),
             )
-            json_object = self.get_key_value(
+            json_object = self.get_json_object(
                 content_object,
-                r"^application\/.*json$",
-                (
-                    f"\n\n{test_config.reference}"
-                    "\n\nNo `application/json` responses documented for method: "
-                    f"{response_method}, path: {parameterized_path}"
+                Diagnostic(
+                    render_undocumented_operation_section,
+                    test_config.reference,
+                    "No `application/json` responses documented for",
+                    response_method,
+                    parameterized_path,
                 ),
-                use_regex=True,
             )
             return self.get_key_value(json_object, "schema")
 
@@ -270,32 +302,38 @@ class SchemaTester:
 
     def retrieve_documented_request(
         self, request: GenericRequest, test_config: OpenAPITestConfig
-    ) -> tuple[str, str, dict[Any, Any]]:
+    ) -> tuple[str, str, Mapping[str, Any]]:
         request_method = request.method.lower()  # request["REQUEST_METHOD"].lower()
 
-        parametrized_path, _ = self.loader.resolve_path(
+        parametrized_path = self.router.get_documented_path(
             request.path, method=request_method
         )
+        operation = self.router.get_operation(parametrized_path, request_method)
+        if operation is not None:
+            return parametrized_path, request_method, operation.method_object
 
+        # walks the schema down to the first undocumented section, which raises its error
         paths_object = self.get_paths_object()
 
         route_object = self.get_key_value(
             paths_object,
             parametrized_path,
-            (
-                f"\n\n{test_config.reference}\n\nUndocumented route {parametrized_path}.\n\nDocumented routes: "
-                + "\n\t• ".join(paths_object.keys())
+            Diagnostic(
+                render_undocumented_route,
+                test_config.reference,
+                parametrized_path,
+                paths_object.keys(),
             ),
         )
 
         method_object = self.get_key_value(
             route_object,
             request_method,
-            (
-                f"\n\n{test_config.reference}"
-                f"\n\nUndocumented method: {request_method}."
-                "\n\nDocumented methods: "
-                f"{[method.lower() for method in route_object.keys() if method.lower() != 'parameters']}."
+            Diagnostic(
+                render_undocumented_method,
+                test_config.reference,
+                request_method,
+                route_object,
             ),
         )
 
@@ -307,16 +345,13 @@ class SchemaTester:
         """
         Fetches the request query params section of a schema and converts it to an object schema format.
         """
-        parametrized_path, request_method, method_object = (
-            self.retrieve_documented_request(request, test_config)
+        parametrized_path, request_method, _ = self.retrieve_documented_request(
+            request, test_config
         )
 
-        parameters_object: list[dict[str, Any]] = method_object.get("parameters", [])
-        query_params = [
-            param for param in parameters_object if param.get("in") == "query"
-        ]
+        operation = self.router.get_operation(parametrized_path, request_method)
 
-        if not query_params:
+        if operation is None or not operation.query_parameters:
             if request.query_params:
                 raise UndocumentedSchemaSectionError(
                     UNDOCUMENTED_SCHEMA_SECTION_ERROR.format(
@@ -327,8 +362,9 @@ class SchemaTester:
                 )
             return {}
 
-        # we convert the query params to an object schema in order to be able to validate it within the same flow of test_schema_section
-        return query_params_to_object(query_params)
+        # the query params are converted to an object schema in order to be able to validate it within the same flow of
+        # test_schema_section
+        return operation.query_parameters_schema
 
     def get_request_body_schema_section(
         self, request: GenericRequest, test_config: OpenAPITestConfig
@@ -336,6 +372,9 @@ class SchemaTester:
         """
         Fetches the request section of a schema.
 
+        Documented request body schemas are looked up in the operation table (see ``Operation``). Otherwise the
+        schema is walked down to the first undocumented section, which raises its error.
+
         :param response: DRF Request Instance
         :return dict
         """
@@ -351,393 +390,105 @@ class SchemaTester:
             ):
                 return {}
 
+            operation = self.router.get_operation(parametrized_path, request_method)
+            if operation is not None and operation.request_body_schema is not None:
+                return operation.request_body_schema
+
             request_body_object = self.get_key_value(
                 method_object,
                 "requestBody",
-                (
-                    f"\n\n{test_config.reference}"
-                    f"\n\nNo request body documented for method: {request_method}, path: {parametrized_path}"
+                Diagnostic(
+                    render_undocumented_operation_section,
+                    test_config.reference,
+                    "No request body documented for",
+                    request_method,
+                    parametrized_path,
                 ),
             )
 
             content_object = self.get_key_value(
                 request_body_object,
                 "content",
-                (
-                    f"\n\n{test_config.reference}"
-                    f"\n\nNo content documented for method: {request_method}, path: {parametrized_path}"
+                Diagnostic(
+                    render_undocumented_operation_section,
+                    test_config.reference,
+                    "No content documented for",
+                    request_method,
+                    parametrized_path,
                 ),
             )
 
-            json_object = self.get_key_value(
+            json_object = self.get_json_object(
                 content_object,
-                r"^application\/.*json$",
-                (
-                    f"\n\n{test_config.reference}"
-                    "\n\nNo `application/json` requests documented for method: "
-                    f"{request_method}, path: {parametrized_path}"
+                Diagnostic(
+                    render_undocumented_operation_section,
+                    test_config.reference,
+                    "No `application/json` requests documented for",
+                    request_method,
+                    parametrized_path,
                 ),
-                use_regex=True,
             )
 
             return self.get_key_value(json_object, "schema")
 
         return {}
 
-    def handle_one_of(
+    def validate_schema_section(
         self,
-        schema_section: dict,
+        compiled: CompiledSchemaSection,
         data: Any,
-        reference: str,
-        test_config: OpenAPITestConfig,
-    ) -> None:
-        matches = 0
-        passed_schema_section_formats = set()
-        for option in schema_section["oneOf"]:
-            try:
-                test_config.reference = f"{test_config.reference}.oneOf"
-                self.test_schema_section(
-                    schema_section=option,
-                    data=data,
-                    test_config=test_config,
-                )
-                matches += 1
-                passed_schema_section_formats.add(option.get("format"))
-            except DocumentationError:
-                continue
-        if matches == 2 and passed_schema_section_formats == {"date", "date-time"}:
-            # With Django v4, the datetime validator now parses normal
-            # date formats successfully, so a oneOf: date // datetime section
-            # will succeed twice where it used to succeed once.
-            return
-        if matches != 1:
-            raise DocumentationError(
-                f"{VALIDATE_ONE_OF_ERROR.format(matches=matches)}\n\nReference: {reference}.oneOf"
-            )
-
-    def handle_any_of(
-        self,
-        schema_section: dict,
-        data: Any,
-        reference: str,
-        test_config: OpenAPITestConfig,
+        context: ValidationContext,
     ) -> None:
-        any_of: list[dict[str, Any]] = schema_section.get("anyOf", [])
-        for schema in chain(any_of, lazy_combinations(any_of)):
-            test_config.reference = f"{test_config.reference}.anyOf"
-            try:
-                self.test_schema_section(
-                    schema_section=schema,
-                    data=data,
-                    test_config=test_config,
-                )
-                return
-            except DocumentationError:
-                continue
-        raise DocumentationError(
-            f"{VALIDATE_ANY_OF_ERROR}\n\nReference: {reference}.anyOf"
-        )
-
-    def get_openapi_schema(self) -> str | None:
-        return self.loader.get_schema().get("openapi")
-
-    @staticmethod
-    def test_is_nullable(schema_item: dict) -> bool:
         """
-        Checks if the item is nullable.
-
-        OpenAPI 3 ref: https://swagger.io/docs/specification/data-models/data-types/#null
-        OpenApi 2 ref: https://help.apiary.io/api_101/swagger-extensions/
-
-        :param schema_item: schema item
-        :return: whether or not the item can be None
+        Tests data against a compiled section of the loaded schema, running its generated validator first when code
+        generation is enabled. The interpreter only runs when the generated validator does not accept the data, and
+        raises the errors.
         """
-        openapi_schema_3_nullable = "nullable"
-        swagger_2_nullable = "x-nullable"
-
-        if "oneOf" in schema_item:
-            one_of: list[dict[str, Any]] = schema_item.get("oneOf", [])
-            return any(
-                nullable_key in schema and schema[nullable_key]
-                for schema in one_of
-                for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
-            )
-
-        if "anyOf" in schema_item:
-            any_of: list[dict[str, Any]] = schema_item.get("anyOf", [])
-            return any(
-                nullable_key in schema and schema[nullable_key]
-                for schema in any_of
-                for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
-            )
-
-        return any(
-            nullable_key in schema_item and schema_item[nullable_key]
-            for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
-        )
-
-    def test_key_casing(
-        self,
-        key: str,
-        case_tester: Callable[[str], None] | None = None,
-        ignore_case: list[str] | None = None,
-    ) -> None:
-        tester = case_tester or getattr(self, "case_tester", None)
-        ignore_case = [*self.ignore_case, *(ignore_case or [])]
-        if tester and key not in ignore_case:
-            tester(key)
-
-    def test_schema_section(
-        self,
-        schema_section: dict,
-        data: Any,
-        test_config: OpenAPITestConfig | None = None,
-        is_query_params: bool = False,
-    ) -> None:
+        if (
+            global_settings.schema.codegen
+            and not (self.case_tester or context.case_tester)
+            and not (self.validators or context.validators)
+            and context.exchange.sampler is None
+        ):
+            try:
+                if self.get_generated_validator(compiled, context.http_message)(data):
+                    return
+            except (SyntaxError, ValueError, TypeError, RecursionError):
+                # the interpreter validates the data again and raises the appropriate error; generated checks call
+                # each other for nested sections, so data nested deeper than the stack allows is left to the
+                # interpreter, which does not recurse
+                pass
+        self.test_compiled_schema_section(compiled=compiled, data=data, context=context)
+
+    def get_generated_validator(
+        self, compiled: CompiledSchemaSection, http_message: str
+    ) -> Callable[[Any], bool]:
         """
-        This method orchestrates the testing of a schema section
+        Returns the generated validator of a compiled schema section, see ``openapi_tester.codegen``
         """
-        test_config = test_config or OpenAPITestConfig()
-        if data is None and "3.1" not in (self.get_openapi_schema() or ""):
-            if self.test_is_nullable(schema_section) or not schema_section:
-                # If data is None and nullable, we return early
-                return
-            raise DocumentationError(
-                f"{VALIDATE_NONE_ERROR.format(http_message=test_config.http_message)}"
-                "\n\nReference:"
-                f"\n\n{test_config.reference}"
-                f"\n\nSchema description:\n  {json.dumps(schema_section, indent=4)}"
-                "\n\nHint: Return a valid type, or document the value as nullable"
-            )
-        schema_section = normalize_schema_section(schema_section)
-        if "oneOf" in schema_section:
-            self.handle_one_of(
-                schema_section=schema_section,
-                data=data,
-                reference=test_config.reference,
-                test_config=test_config,
-            )
-            return
-        if "anyOf" in schema_section:
-            self.handle_any_of(
-                schema_section=schema_section,
-                data=data,
-                reference=test_config.reference,
-                test_config=test_config,
-            )
-            return
-
-        schema_section_type = self.get_schema_type(schema_section)
-        if not schema_section_type:
-            return
-        combined_validators = cast(
-            "list[Callable[[dict, Any], str | None]]",
-            [
-                validate_type,
-                validate_format,
-                validate_pattern,
-                validate_multiple_of,
-                validate_minimum,
-                validate_maximum,
-                validate_unique_items,
-                validate_min_length,
-                validate_max_length,
-                validate_min_items,
-                validate_max_items,
-                validate_max_properties,
-                validate_min_properties,
-                validate_enum,
-                *self.validators,
-                *(test_config.validators or []),
-            ],
-        )
-        for validator in combined_validators:
-            error = validator(schema_section, data)
-            if error:
-                raise DocumentationError(
-                    f"\n\n{error}"
-                    "\n\nReference: "
-                    f"\n\n{test_config.reference}"
-                    f"\n\n {test_config.http_message.capitalize()} value:\n  {data}"
-                    f"\n Schema description:\n  {schema_section}"
-                )
-            # Add early return for null data after type validation succeeds
-            if data is None and validator.__name__ == "validate_type":
-                return
+        key = (id(compiled), http_message)
+        cached = self._generated_validators.get(key)
+        if cached is None or cached[0] is not compiled:
+            context = ValidationContext(http_message=http_message, probe=True)
+
+            def fallback(section: CompiledSchemaSection, data: Any) -> bool:
+                try:
+                    self.test_compiled_schema_section(
+                        compiled=section, data=data, context=context
+                    )
+                except (DocumentationError, OpenAPISchemaError):
+                    return False
+                return True
 
-        if is_query_params:
-            self.test_openapi_query_params_object(
-                schema_section=schema_section, data=data, test_config=test_config
-            )
-        elif schema_section_type == "object":
-            self.test_openapi_object(
-                schema_section=schema_section, data=data, test_config=test_config
+            generator = ValidatorGenerator(
+                compiled, http_message, openapi_version=self.get_openapi_schema()
             )
-        elif schema_section_type == "array":
-            self.test_openapi_array(
-                schema_section=schema_section, data=data, test_config=test_config
-            )
-
-    def test_openapi_object(
-        self,
-        schema_section: dict,
-        data: dict,
-        test_config: OpenAPITestConfig,
-    ) -> None:
-        """
-        1. Validate that casing is correct for both request/response and schema
-        2. Check if any required key is missing from the request/response
-        3. Check if any request/response key is not in the schema
-        4. Validate sub-schema/nested data
-        """
-        properties = schema_section.get("properties", {})
-        write_only_properties = [
-            key for key in properties.keys() if properties[key].get("writeOnly")
-        ]
-        read_only_properties = [
-            key for key in properties.keys() if properties[key].get("readOnly")
-        ]
-        required_keys = get_required_keys(
-            schema_section=schema_section,
-            http_message=test_config.http_message,
-            write_only_props=write_only_properties,
-            read_only_props=read_only_properties,
-        )
-
-        request_response_keys = data.keys()
-        additional_properties: bool | dict | None = schema_section.get(
-            "additionalProperties"
-        )
-        additional_properties_allowed = additional_properties is not None
-        if additional_properties_allowed and not isinstance(
-            additional_properties, (bool, dict)
-        ):
-            raise OpenAPISchemaError("Invalid additionalProperties type")
-        for key in properties.keys():
-            self.test_key_casing(key, test_config.case_tester, test_config.ignore_case)
-            if key in required_keys and key not in request_response_keys:
-                raise DocumentationError(
-                    f"{VALIDATE_MISSING_KEY_ERROR.format(missing_key=key, http_message=test_config.http_message)}"
-                    "\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
-                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
-                    "\n\nHint: Remove the key from your OpenAPI docs, or"
-                    f" include it in your API {test_config.http_message}"
-                )
-        for key in request_response_keys:
-            self.test_key_casing(key, test_config.case_tester, test_config.ignore_case)
-            if key not in properties and not additional_properties_allowed:
-                raise DocumentationError(
-                    f"{VALIDATE_EXCESS_KEY_ERROR.format(excess_key=key, http_message=test_config.http_message)}"
-                    "\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
-                    f"\n\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
-                    "\n\nHint: Remove the key from your API"
-                    f" {test_config.http_message}, or include it in your OpenAPI docs"
-                )
-            if key in write_only_properties and test_config.http_message == "response":
-                raise DocumentationError(
-                    f"{VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR.format(write_only_key=key)}\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
-                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
-                    f"\n\nHint: Remove the key from your API {test_config.http_message}, or"
-                    ' remove the "WriteOnly" restriction'
-                )
-            if key in read_only_properties and test_config.http_message == "request":
-                raise DocumentationError(
-                    f"{VALIDATE_READ_ONLY_RESPONSE_KEY_ERROR.format(read_only_key=key)}\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
-                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
-                    f"\n\nHint: Remove the key from your API {test_config.http_message}, or"
-                    ' remove the "ReadOnly" restriction'
-                )
-        for key, value in data.items():
-            if key in properties:
-                drill_down_test_config = copy(test_config)
-                drill_down_test_config.reference = f"{test_config.reference} > {key}"
-                self.test_schema_section(
-                    schema_section=properties[key],
-                    data=value,
-                    test_config=drill_down_test_config,
-                )
-            elif isinstance(additional_properties, dict):
-                drill_down_test_config = copy(test_config)
-                drill_down_test_config.reference = f"{test_config.reference} > {key}"
-                self.test_schema_section(
-                    schema_section=additional_properties,
-                    data=value,
-                    test_config=drill_down_test_config,
-                )
-
-    def test_openapi_query_params_object(
-        self,
-        schema_section: dict,
-        data: dict,
-        test_config: OpenAPITestConfig,
-    ) -> None:
-        properties = schema_section.get("properties", {})
-        required_params = schema_section.get("required", [])
-        request_params_keys = data.keys()
-
-        for key in properties.keys():
-            self.test_key_casing(key, test_config.case_tester, test_config.ignore_case)
-            if key in required_params and key not in request_params_keys:
-                raise DocumentationError(
-                    f"{VALIDATE_MISSING_QUERY_PARAM_ERROR.format(missing_key=key, http_message=test_config.http_message)}"
-                    "\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} Query param:\n  {serialize_schema_section_data(data=data)}"
-                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
-                    "\n\nHint: Remove the key from your OpenAPI docs, or"
-                    f" include it in your API {test_config.http_message}"
-                )
-        for key in request_params_keys:
-            self.test_key_casing(key, test_config.case_tester, test_config.ignore_case)
-            if key not in properties:
-                raise DocumentationError(
-                    f"{VALIDATE_EXCESS_QUERY_PARAM_ERROR.format(excess_key=key, http_message=test_config.http_message)}"
-                    "\n\nReference:"
-                    f"\n\n{test_config.reference} > {key}"
-                    f"\n\n{test_config.http_message.capitalize()} query parameters:\n  {serialize_schema_section_data(data=data)}"
-                    f"\n\nQuery parameters' Schema section:\n  {serialize_schema_section_data(data=properties)}"
-                    "\n\nHint: Remove the query parameter from your API"
-                    f" {test_config.http_message}, or include it in your OpenAPI docs"
-                )
-        for key, value in data.items():
-            if key in properties:
-                if not should_validate_query_param(
-                    param_schema_section=properties[key], request_value=value
-                ):
-                    continue
-
-                normalized_value = normalize_query_param_value(
-                    param_schema=properties[key], value=value
-                )
-
-                drill_down_test_config = copy(test_config)
-                drill_down_test_config.reference = f"{test_config.reference} > {key}"
-                self.test_schema_section(
-                    schema_section=properties[key],
-                    data=normalized_value,
-                    test_config=drill_down_test_config,
-                )
-
-    def test_openapi_array(
-        self, schema_section: dict[str, Any], data: dict, test_config: OpenAPITestConfig
-    ) -> None:
-        for array_item in data:
-            array_item_test_config = copy(test_config)
-            array_item_test_config.reference = f"{test_config.reference}"
-            self.test_schema_section(
-                # the items keyword is required in arrays
-                schema_section=schema_section["items"],
-                data=array_item,
-                test_config=array_item_test_config,
+            cached = (
+                compiled,
+                generator.build(fallback, build_dir=global_settings.schema.build_dir),
             )
+            self._generated_validators[key] = cached
+        return cached[1]
 
     def validate_request(
         self,
@@ -753,11 +504,7 @@ class SchemaTester:
         :raises: ``openapi_tester.exceptions.DocumentationError`` for inconsistencies in the API response and schema.
                  ``openapi_tester.exceptions.CaseError`` for case errors.
         """
-        current_config = (
-            deepcopy(test_config)
-            if test_config is not None
-            else deepcopy(global_settings)
-        )
+        current_config = test_config if test_config is not None else global_settings
 
         if not current_config.validation.request:
             return
@@ -773,13 +520,22 @@ class SchemaTester:
             return
 
         if self.get_openapi_schema() is not None:
-            current_config.http_message = "request"
+            # the configuration is shared, so the exchange gets its own shallow copy
+            current_config = replace(current_config, http_message="request")
             if (
                 not test_config
                 or not test_config.reference
                 or test_config.reference == "root"
             ):
                 current_config.reference = f"{response_handler.request.method} {response_handler.request.path} > request"
+            context = replace(
+                ValidationContext.from_config(current_config),
+                exchange=ExchangeState(
+                    sampler=self.get_sampler(
+                        response_handler.endpoint(), current_config
+                    )
+                ),
+            )
 
             if current_config.validation.query_parameters:
                 query_params_schema = self.get_request_query_params_schema_section(
@@ -787,14 +543,10 @@ class SchemaTester:
                 )
 
                 if query_params_schema:
-                    query_params_config = deepcopy(current_config)
-                    query_params_config.reference = (
-                        f"{current_config.reference} > query parameter"
-                    )
-                    self.test_schema_section(
-                        schema_section=query_params_schema,
+                    self.test_compiled_schema_section(
+                        compiled=self.compiler.compile(query_params_schema),
                         data=response_handler.request.query_params,
-                        test_config=query_params_config,
+                        context=context.at(context.reference / "query parameter"),
                         is_query_params=True,
                     )
 
@@ -803,10 +555,10 @@ class SchemaTester:
             )
 
             if request_body_schema:
-                self.test_schema_section(
-                    schema_section=request_body_schema,
+                self.validate_schema_section(
+                    compiled=self.compiler.compile(request_body_schema),
                     data=response_handler.request.data,
-                    test_config=current_config,
+                    context=context,
                 )
 
     def validate_response(
@@ -822,18 +574,15 @@ class SchemaTester:
         :raises: ``openapi_tester.exceptions.DocumentationError`` for inconsistencies in the API response and schema.
                  ``openapi_tester.exceptions.CaseError`` for case errors.
         """
-        current_config = (
-            deepcopy(test_config)
-            if test_config is not None
-            else deepcopy(global_settings)
-        )
+        current_config = test_config if test_config is not None else global_settings
 
         if not current_config.validation.response or self._is_endpoint_excluded(
             response_handler.endpoint(), current_config.validation.excluded_endpoints
         ):
             return
 
-        current_config.http_message = "response"
+        # the configuration is shared, so the exchange gets its own shallow copy
+        current_config = replace(current_config, http_message="response")
 
         # Ensure reference is appropriate if not explicitly passed in test_config
         if (
@@ -847,12 +596,160 @@ class SchemaTester:
         response_schema = self.get_response_schema_section(
             response_handler, test_config=current_config
         )
-        self.test_schema_section(
-            schema_section=response_schema,
-            data=response_handler.data,
-            test_config=current_config,
+        compiled = self.compiler.compile(response_schema)
+        verdict_key = self.get_verdict_key(compiled, response_handler, current_config)
+        verdict_cache = get_verdict_cache(current_config.validation.verdict_cache_dir)
+        if verdict_key is not None and verdict_key in verdict_cache:
+            return
+        context = replace(
+            ValidationContext.from_config(current_config),
+            exchange=ExchangeState(
+                sampler=self.get_sampler(response_handler.endpoint(), current_config),
+                # response data is JSON data, decoded or converted, which is what the memo requires
+                memo=SubtreeMemo()
+                if current_config.validation.memoize_subtrees
+                else None,
+            ),
+        )
+        # sampling draws from the whole array, so sampled bodies are decoded
+        items = (
+            self.get_streamed_items(compiled, response_handler, current_config)
+            if context.exchange.sampler is None
+            else None
+        )
+        if items is not None:
+            # items share the reference of their array, see ``test_compiled_array``
+            items_compiled = compiled.get_items()
+            self.walk((items_compiled, item, context, False) for item in items)
+        else:
+            self.validate_schema_section(
+                compiled=compiled,
+                data=response_handler.native_data
+                if current_config.validation.native_response_data
+                else response_handler.data,
+                context=context,
+            )
+        if verdict_key is not None:
+            verdict_cache.add(verdict_key)
+
+    def has_custom_validators(self, test_config: OpenAPITestConfig) -> bool:
+        """
+        Returns whether custom validators, of the tester or of the test, are used.
+        """
+        return bool(self.validators or test_config.validators)
+
+    def get_streamed_items(
+        self,
+        compiled: CompiledSchemaSection,
+        response_handler: ResponseHandler,
+        test_config: OpenAPITestConfig,
+    ) -> Iterator[Any] | None:
+        """
+        Returns the items of a response body to validate while it is decoded (see ``iter_json_array``), or None if
+        the body is decoded before it is validated.
+
+        Bodies of at least ``stream_min_size`` bytes are streamed when they are arrays documented by an array
+        section whose items can be validated one at a time, i.e. without keywords about the array as a whole
+        (``minItems``, ``maxItems``, ``uniqueItems``), and when no custom validator, which receives whole arrays, is
+        used.
+        """
+        min_size = test_config.validation.stream_min_size
+        if (
+            min_size is None
+            or not has_streamable_items(compiled)
+            or self.has_custom_validators(test_config)
+        ):
+            return None
+        chunks = response_handler.iter_content(min_size)
+        return iter_json_array(chunks) if chunks is not None else None
+
+    def get_verdict_key(
+        self,
+        compiled: CompiledSchemaSection,
+        response_handler: ResponseHandler,
+        test_config: OpenAPITestConfig,
+    ) -> str | None:
+        """
+        Returns the key of a response's verdict in the verdict cache (see ``VerdictCache``): a hash of its body and
+        of everything its validation depends on, i.e. its endpoint and status code, the schema section it is validated
+        against, the OpenAPI version, the validation settings and the case testers.
+
+        Returns None when verdicts are not cached, or when the validation depends on functions that can't be told
+        apart across runs: custom validators and anonymous case testers.
+        """
+        if not test_config.validation.cache_verdicts or self.has_custom_validators(
+            test_config
+        ):
+            return None
+        case_testers = []
+        for case_tester in (self.case_tester, test_config.case_tester):
+            if case_tester is None:
+                case_testers.append("")
+                continue
+            name = f"{case_tester.__module__}.{case_tester.__qualname__}"
+            # lambdas and nested functions share their names with other functions
+            if "<" in name:
+                return None
+            case_testers.append(name)
+        response = response_handler.response
+        if getattr(response, "is_rendered", True) and isinstance(
+            getattr(response, "content", None), bytes
+        ):
+            body = response.content
+        elif getattr(response, "streaming", False):
+            # streamed bodies can only be read once, by the validation
+            return None
+        else:
+            try:
+                body = orjson.dumps(
+                    response_handler.native_data
+                    if test_config.validation.native_response_data
+                    else response_handler.data
+                )
+            except TypeError:
+                return None
+        cached = self._section_digests.get(id(compiled))
+        if cached is None or cached[0] is not compiled:
+            source = orjson.dumps(
+                canonicalize(compiled.source, {}),
+                option=orjson.OPT_NON_STR_KEYS,
+                default=repr,
+            )
+            cached = self._section_digests[id(compiled)] = (
+                compiled,
+                SchemaCache.get_key(source, []),
+            )
+        return SchemaCache.get_key(
+            body,
+            [
+                str(VERDICT_CACHE_FORMAT),
+                response_handler.endpoint(),
+                str(response.status_code),
+                cached[1],
+                str(self.get_openapi_schema()),
+                repr(keyword_validators.settings.validation),
+                repr(test_config.validation),
+                *case_testers,
+                repr([*self.ignore_case, *(test_config.ignore_case or [])]),
+            ],
         )
 
+    def get_sampler(
+        self, endpoint: str, test_config: OpenAPITestConfig
+    ) -> Sampler | None:
+        """
+        Returns the sampler of an endpoint's data, if sampling is enabled for the endpoint, see ``SamplingSettings``.
+        The policy of the first pattern of ``policies`` matching the endpoint is used, and otherwise that of the
+        settings, if one of their ``endpoints`` matches.
+        """
+        sampling = test_config.validation.sampling
+        for pattern, policy in sampling.policies.items():
+            if self._is_endpoint_excluded(endpoint, [pattern]):
+                return Sampler(policy, endpoint)
+        if not self._is_endpoint_excluded(endpoint, sampling.endpoints):
+            return None
+        return Sampler(sampling, endpoint)
+
     @staticmethod
     def _is_successful_response(response: Response | HttpResponse) -> bool:
         return response.status_code < http.HTTPStatus.BAD_REQUEST
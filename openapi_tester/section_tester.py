@@ -0,0 +1,692 @@
+"""Schema Section Tester - validates data against compiled schema sections."""
+
+from __future__ import annotations
+
+import json
+import warnings
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from openapi_tester import columnar
+from openapi_tester.compiler import CompiledSchemaSection, SchemaCompiler, is_nullable
+from openapi_tester.config import OpenAPITestConfig
+from openapi_tester.constants import (
+    ANY_OF_LIMIT_WARNING,
+    VALIDATE_ANY_OF_ERROR,
+    VALIDATE_EXCESS_KEY_ERROR,
+    VALIDATE_EXCESS_QUERY_PARAM_ERROR,
+    VALIDATE_MISSING_KEY_ERROR,
+    VALIDATE_MISSING_QUERY_PARAM_ERROR,
+    VALIDATE_NONE_ERROR,
+    VALIDATE_ONE_OF_ERROR,
+    VALIDATE_READ_ONLY_RESPONSE_KEY_ERROR,
+    VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR,
+)
+from openapi_tester.context import ReferencePath, ValidationContext
+from openapi_tester.exceptions import (
+    AnyOfLimitWarning,
+    DocumentationError,
+    OpenAPISchemaError,
+    ProbeMismatch,
+)
+from openapi_tester.utils import (
+    break_reference_cycles,
+    find_first_failure,
+    normalize_query_param_value,
+    serialize_schema_section_data,
+    should_validate_query_param,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from openapi_tester.loaders import BaseSchemaLoader
+    from openapi_tester.memo import SubtreeMemo
+
+    # a compiled schema section, the data to test against it, its context and whether it holds query parameters
+    ValidationTask = tuple[CompiledSchemaSection, Any, ValidationContext, bool]
+
+
+class SchemaSectionTester:
+    """
+    Tests data against schema sections: the validation engine of ``SchemaTester``, which adds the lookup of the
+    sections documenting requests and responses.
+    """
+
+    loader: BaseSchemaLoader
+    validators: list[Callable[[dict, Any], str | None]]
+
+    def __init__(
+        self,
+        case_tester: Callable[[str], None] | None = None,
+        ignore_case: list[str] | None = None,
+        validators: list[Callable[[dict, Any], str | None]] | None = None,
+    ) -> None:
+        self.case_tester = case_tester
+        self.ignore_case = ignore_case or []
+        self.validators = validators or []
+
+    def handle_one_of(
+        self,
+        schema_section: dict,
+        data: Any,
+        reference: str,
+        test_config: OpenAPITestConfig,
+    ) -> None:
+        """
+        Tests data against the ``oneOf`` options of a schema section, see ``test_compiled_one_of``.
+        """
+        self.test_compiled_one_of(
+            compiled=SchemaCompiler().compile(schema_section),
+            data=data,
+            context=ValidationContext.from_config(test_config).at(
+                ReferencePath(reference)
+            ),
+        )
+
+    def test_compiled_one_of(
+        self,
+        compiled: CompiledSchemaSection,
+        data: Any,
+        context: ValidationContext,
+    ) -> None:
+        """
+        Tests that data matches exactly one of the ``oneOf`` options of a compiled schema section.
+        """
+        probe_context = context.as_probe()
+        matches = 0
+        passed_schema_section_formats = set()
+        # options the data cannot match are ruled out without being validated
+        branch_index = compiled.compiler.get_branch_index(
+            compiled.schema_section["oneOf"]
+        )
+        for option in branch_index.get_candidates(data, context.http_message):
+            if self.probe_compiled_schema_section(
+                compiled=option, data=data, context=probe_context
+            ):
+                matches += 1
+                passed_schema_section_formats.add(option.source.get("format"))
+        if matches == 2 and passed_schema_section_formats == {"date", "date-time"}:
+            # With Django v4, the datetime validator now parses normal
+            # date formats successfully, so a oneOf: date // datetime section
+            # will succeed twice where it used to succeed once.
+            return
+        if matches != 1:
+            if context.probe:
+                raise ProbeMismatch
+            raise DocumentationError(
+                f"{VALIDATE_ONE_OF_ERROR.format(matches=matches)}\n\nReference: {context.reference}.oneOf"
+            )
+
+    def handle_any_of(
+        self,
+        schema_section: dict,
+        data: Any,
+        reference: str,
+        test_config: OpenAPITestConfig,
+    ) -> None:
+        """
+        Tests data against the ``anyOf`` options of a schema section, see ``test_compiled_any_of``.
+        """
+        self.test_compiled_any_of(
+            compiled=SchemaCompiler().compile(schema_section),
+            data=data,
+            context=ValidationContext.from_config(test_config).at(
+                ReferencePath(reference)
+            ),
+        )
+
+    def test_compiled_any_of(
+        self,
+        compiled: CompiledSchemaSection,
+        data: Any,
+        context: ValidationContext,
+    ) -> None:
+        """
+        Tests that data matches one of the ``anyOf`` options of a compiled schema section, or the union of the
+        options whose required properties it has (see ``probe_any_of_union``).
+        """
+        branch_index = compiled.compiler.get_branch_index(
+            compiled.schema_section.get("anyOf", [])
+        )
+        probe_context = context.as_probe()
+        for option in branch_index.get_candidates(data, context.http_message):
+            if self.probe_compiled_schema_section(
+                compiled=option, data=data, context=probe_context
+            ):
+                return
+        if isinstance(data, dict):
+            # every option is probed on its own, the limit only applies to the options combined in a union
+            options = branch_index.options
+            max_options = context.max_any_of_options
+            if len(options) > max_options:
+                warnings.warn(
+                    ANY_OF_LIMIT_WARNING.format(
+                        options=len(options),
+                        max_options=max_options,
+                        reference=context.reference,
+                    ),
+                    AnyOfLimitWarning,
+                    stacklevel=2,
+                )
+                options = options[:max_options]
+            if self.probe_any_of_union(
+                options=options, data=data, context=probe_context
+            ):
+                return
+        if context.probe:
+            raise ProbeMismatch
+        raise DocumentationError(
+            f"{VALIDATE_ANY_OF_ERROR}\n\nReference: {context.reference}.anyOf"
+        )
+
+    def probe_any_of_union(
+        self,
+        options: tuple[CompiledSchemaSection, ...],
+        data: dict,
+        context: ValidationContext,
+    ) -> bool:
+        """
+        Returns whether an object matches the union of the ``anyOf`` options whose documented required properties it
+        has, and whose keywords about the object as a whole (e.g. ``minProperties`` and ``maxProperties``) it
+        satisfies: each of its properties has to be documented by one of these options, and its value has to match the
+        property's schema in one of them.
+        """
+        http_message = context.http_message
+        candidates = [
+            option
+            for option in options
+            if option.schema_type == "object"
+            and option.has_required_keys(data, http_message)
+            and not any(
+                validator(option.schema_section, data)
+                for validator in option.validators
+            )
+        ]
+        if len(candidates) < 2:
+            # single options have been probed already
+            return False
+        excluded_properties = (
+            "write_only_properties"
+            if http_message == "response"
+            else "read_only_properties"
+        )
+        for key, value in data.items():
+            for option in candidates:
+                if key in option.properties:
+                    if key not in getattr(
+                        option, excluded_properties
+                    ) and self.probe_compiled_schema_section(
+                        compiled=option.get_property(key), data=value, context=context
+                    ):
+                        break
+                elif isinstance(option.additional_properties, dict):
+                    if self.probe_compiled_schema_section(
+                        compiled=option.get_additional_properties(),
+                        data=value,
+                        context=context,
+                    ):
+                        break
+                elif option.additional_properties:
+                    break
+            else:
+                return False
+        return True
+
+    def get_openapi_schema(self) -> str | None:
+        return self.loader.get_schema().get("openapi")
+
+    @staticmethod
+    def test_is_nullable(schema_item: dict) -> bool:
+        """
+        Checks if the item is nullable.
+
+        OpenAPI 3 ref: https://swagger.io/docs/specification/data-models/data-types/#null
+        OpenApi 2 ref: https://help.apiary.io/api_101/swagger-extensions/
+
+        :param schema_item: schema item
+        :return: whether or not the item can be None
+        """
+        return is_nullable(schema_item)
+
+    def test_key_casing(
+        self,
+        key: str,
+        case_tester: Callable[[str], None] | None = None,
+        ignore_case: list[str] | None = None,
+    ) -> None:
+        tester = case_tester or getattr(self, "case_tester", None)
+        ignore_case = [*self.ignore_case, *(ignore_case or [])]
+        if tester and key not in ignore_case:
+            tester(key)
+
+    def test_schema_section(
+        self,
+        schema_section: dict,
+        data: Any,
+        test_config: OpenAPITestConfig | None = None,
+        is_query_params: bool = False,
+    ) -> None:
+        """
+        This method orchestrates the testing of a schema section.
+
+        The section is compiled for this call only, as it may be changed between calls: sections of the loaded
+        schema are compiled once by ``validate_request`` and ``validate_response``.
+        """
+        self.test_compiled_schema_section(
+            compiled=SchemaCompiler().compile(schema_section),
+            data=data,
+            context=ValidationContext.from_config(test_config or OpenAPITestConfig()),
+            is_query_params=is_query_params,
+        )
+
+    def test_compiled_schema_section(
+        self,
+        compiled: CompiledSchemaSection,
+        data: Any,
+        context: ValidationContext,
+        is_query_params: bool = False,
+    ) -> None:
+        """
+        Tests data against a compiled schema section, see ``openapi_tester.compiler``
+        """
+        self.walk(((compiled, data, context, is_query_params),))
+
+    def walk(self, tasks: Iterable[ValidationTask]) -> None:
+        """
+        Validates the data of each task, and everything nested in it, without recursing: tasks are checked by
+        ``visit_compiled_schema_section``, which returns the tasks of the nested values. These are validated before
+        the next task, depth first, so errors are raised in the same order as by a recursive traversal, and documents
+        of any depth are validated in constant stack space. Only ``oneOf`` and ``anyOf`` options are validated by a
+        nested walk.
+
+        Objects and arrays nested in the data are added to the memo of their context, if any, once they and
+        everything nested in them are validated, and are skipped when they are met again (see ``SubtreeMemo``).
+        """
+        stack: list[tuple[Iterator[ValidationTask], SubtreeMemo | None, Any]] = [
+            (iter(tasks), None, None)
+        ]
+        while stack:
+            task = next(stack[-1][0], None)
+            if task is None:
+                _, memo, key = stack.pop()
+                if key is not None:
+                    memo.add(key)  # type: ignore[union-attr]
+                continue
+            memo = task[2].exchange.memo
+            key = None
+            if memo is not None and len(stack) > 1 and type(task[1]) in (dict, list):
+                key = memo.get_key(task[0], task[1], task[3])
+                if key is not None and key in memo:
+                    continue
+            children = self.visit_compiled_schema_section(*task)
+            if children is not None:
+                stack.append((iter(children), memo, key))
+            elif key is not None:
+                memo.add(key)  # type: ignore[union-attr]
+
+    def visit_compiled_schema_section(
+        self,
+        compiled: CompiledSchemaSection,
+        data: Any,
+        context: ValidationContext,
+        is_query_params: bool = False,
+    ) -> Iterable[ValidationTask] | None:
+        """
+        Tests data against a compiled schema section, leaving out its nested values: returns the tasks validating
+        them, if any (see ``walk``).
+        """
+        if data is None and "3.1" not in (self.get_openapi_schema() or ""):
+            if compiled.nullable or compiled.is_empty:
+                # If data is None and nullable, we return early
+                return None
+            if context.probe:
+                raise ProbeMismatch
+            raise DocumentationError(
+                f"{VALIDATE_NONE_ERROR.format(http_message=context.http_message)}"
+                "\n\nReference:"
+                f"\n\n{context.reference}"
+                f"\n\nSchema description:\n  {json.dumps(break_reference_cycles(compiled.source), indent=4)}"
+                "\n\nHint: Return a valid type, or document the value as nullable"
+            )
+        schema_section = compiled.schema_section
+        if compiled.discriminator is not None:
+            discriminated_option = compiled.get_discriminated_option(
+                data, self.loader.get_schema()
+            )
+            if discriminated_option is not None:
+                return ((discriminated_option, data, context, False),)
+        if "oneOf" in schema_section:
+            self.test_compiled_one_of(compiled=compiled, data=data, context=context)
+            return None
+        if "anyOf" in schema_section:
+            self.test_compiled_any_of(compiled=compiled, data=data, context=context)
+            return None
+
+        if not compiled.schema_type:
+            return None
+        for validator in (*compiled.validators, *self.validators, *context.validators):
+            error = validator(schema_section, data)
+            if error:
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"\n\n{error}"
+                    "\n\nReference: "
+                    f"\n\n{context.reference}"
+                    f"\n\n {context.http_message.capitalize()} value:\n  {data}"
+                    f"\n Schema description:\n  {schema_section}"
+                )
+            # Add early return for null data after type validation succeeds
+            if data is None and validator.__name__ == "validate_type":
+                return None
+
+        if is_query_params:
+            return self.test_compiled_query_params(
+                compiled=compiled, data=data, context=context
+            )
+        if compiled.schema_type == "object":
+            return self.test_compiled_object(
+                compiled=compiled, data=data, context=context
+            )
+        if compiled.schema_type == "array":
+            return self.test_compiled_array(
+                compiled=compiled, data=data, context=context
+            )
+        return None
+
+    def probe_compiled_schema_section(
+        self,
+        compiled: CompiledSchemaSection,
+        data: Any,
+        context: ValidationContext,
+    ) -> bool:
+        """
+        Returns whether data matches a compiled schema section. Used to select ``oneOf`` and ``anyOf`` options: with
+        a probe context (see ``ValidationContext.as_probe``), mismatches raise ``ProbeMismatch`` without rendering
+        the error messages that would be discarded.
+        """
+        try:
+            self.test_compiled_schema_section(
+                compiled=compiled, data=data, context=context
+            )
+        except DocumentationError:
+            return False
+        return True
+
+    def test_openapi_object(
+        self,
+        schema_section: dict,
+        data: dict,
+        test_config: OpenAPITestConfig,
+    ) -> None:
+        """
+        1. Validate that casing is correct for both request/response and schema
+        2. Check if any required key is missing from the request/response
+        3. Check if any request/response key is not in the schema
+        4. Validate sub-schema/nested data
+        """
+        self.walk(
+            self.test_compiled_object(
+                compiled=SchemaCompiler().compile(schema_section, normalize=False),
+                data=data,
+                context=ValidationContext.from_config(test_config),
+            )
+        )
+
+    def test_compiled_object(
+        self,
+        compiled: CompiledSchemaSection,
+        data: dict,
+        context: ValidationContext,
+    ) -> list[ValidationTask]:
+        """
+        Tests the keys of an object and returns the tasks validating its values, see ``walk``.
+
+        The outcome of the key checks only depends on the shape of the object, i.e. its set of keys, and on the
+        context they are tested in: the keys are not tested again for shapes that passed them already (see
+        ``SectionCache.validated_shapes``), and only the values of the object are validated.
+        """
+        properties = compiled.properties
+        additional_properties = compiled.additional_properties
+        if additional_properties is not None and not isinstance(
+            additional_properties, (bool, dict)
+        ):
+            raise OpenAPISchemaError("Invalid additionalProperties type")
+        shape = (
+            frozenset(data),
+            context.http_message,
+            context.case_tester,
+            tuple(context.ignore_case or ()),
+        )
+        validated_shapes = compiled.cache.validated_shapes
+        if shape not in validated_shapes:
+            self.test_compiled_object_keys(compiled, data, context)
+            if len(validated_shapes) < compiled.cache.max_validated_shapes:
+                validated_shapes.add(shape)
+        sampled_keys: set[str] | None = None
+        if context.exchange.sampler is not None and isinstance(
+            additional_properties, dict
+        ):
+            additional_keys = [key for key in data if key not in properties]
+            sampled = context.exchange.sampler.sample(
+                additional_keys, record=not context.probe
+            )
+            if sampled is not additional_keys:
+                sampled_keys = set(sampled)
+        tasks: list[ValidationTask] = []
+        for key, value in data.items():
+            if key in properties:
+                tasks.append(
+                    (
+                        compiled.get_property(key),
+                        value,
+                        context.at(context.reference / key),
+                        False,
+                    )
+                )
+            elif isinstance(additional_properties, dict) and (
+                sampled_keys is None or key in sampled_keys
+            ):
+                tasks.append(
+                    (
+                        compiled.get_additional_properties(),
+                        value,
+                        context.at(context.reference / key),
+                        False,
+                    )
+                )
+        return tasks
+
+    def test_compiled_object_keys(
+        self,
+        compiled: CompiledSchemaSection,
+        data: dict,
+        context: ValidationContext,
+    ) -> None:
+        """
+        Tests the casing of the keys of an object, and that none is missing, undocumented, or not allowed in the
+        direction of the exchange (``readOnly`` and ``writeOnly`` keys).
+        """
+        properties = compiled.properties
+        write_only_properties = compiled.write_only_properties
+        read_only_properties = compiled.read_only_properties
+        required_keys = compiled.get_required_keys(context.http_message)
+
+        request_response_keys = data.keys()
+        additional_properties_allowed = compiled.additional_properties is not None
+        for key in properties.keys():
+            self.test_key_casing(key, context.case_tester, context.ignore_case)
+            if key in required_keys and key not in request_response_keys:
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_MISSING_KEY_ERROR.format(missing_key=key, http_message=context.http_message)}"
+                    "\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
+                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
+                    "\n\nHint: Remove the key from your OpenAPI docs, or"
+                    f" include it in your API {context.http_message}"
+                )
+        for key in request_response_keys:
+            self.test_key_casing(key, context.case_tester, context.ignore_case)
+            if key not in properties and not additional_properties_allowed:
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_EXCESS_KEY_ERROR.format(excess_key=key, http_message=context.http_message)}"
+                    "\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
+                    f"\n\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
+                    "\n\nHint: Remove the key from your API"
+                    f" {context.http_message}, or include it in your OpenAPI docs"
+                )
+            if key in write_only_properties and context.http_message == "response":
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR.format(write_only_key=key)}\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
+                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
+                    f"\n\nHint: Remove the key from your API {context.http_message}, or"
+                    ' remove the "WriteOnly" restriction'
+                )
+            if key in read_only_properties and context.http_message == "request":
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_READ_ONLY_RESPONSE_KEY_ERROR.format(read_only_key=key)}\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} body:\n  {serialize_schema_section_data(data=data)}"
+                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
+                    f"\n\nHint: Remove the key from your API {context.http_message}, or"
+                    ' remove the "ReadOnly" restriction'
+                )
+
+    def test_openapi_query_params_object(
+        self,
+        schema_section: dict,
+        data: dict,
+        test_config: OpenAPITestConfig,
+    ) -> None:
+        self.walk(
+            self.test_compiled_query_params(
+                compiled=SchemaCompiler().compile(schema_section, normalize=False),
+                data=data,
+                context=ValidationContext.from_config(test_config),
+            )
+        )
+
+    def test_compiled_query_params(
+        self,
+        compiled: CompiledSchemaSection,
+        data: dict,
+        context: ValidationContext,
+    ) -> list[ValidationTask]:
+        """
+        Tests the names of query parameters and returns the tasks validating their values, see ``walk``.
+        """
+        properties = compiled.properties
+        required_params = compiled.schema_section.get("required", [])
+        request_params_keys = data.keys()
+
+        for key in properties.keys():
+            self.test_key_casing(key, context.case_tester, context.ignore_case)
+            if key in required_params and key not in request_params_keys:
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_MISSING_QUERY_PARAM_ERROR.format(missing_key=key, http_message=context.http_message)}"
+                    "\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} Query param:\n  {serialize_schema_section_data(data=data)}"
+                    f"\nSchema section:\n  {serialize_schema_section_data(data=properties)}"
+                    "\n\nHint: Remove the key from your OpenAPI docs, or"
+                    f" include it in your API {context.http_message}"
+                )
+        for key in request_params_keys:
+            self.test_key_casing(key, context.case_tester, context.ignore_case)
+            if key not in properties:
+                if context.probe:
+                    raise ProbeMismatch
+                raise DocumentationError(
+                    f"{VALIDATE_EXCESS_QUERY_PARAM_ERROR.format(excess_key=key, http_message=context.http_message)}"
+                    "\n\nReference:"
+                    f"\n\n{context.reference} > {key}"
+                    f"\n\n{context.http_message.capitalize()} query parameters:\n  {serialize_schema_section_data(data=data)}"
+                    f"\n\nQuery parameters' Schema section:\n  {serialize_schema_section_data(data=properties)}"
+                    "\n\nHint: Remove the query parameter from your API"
+                    f" {context.http_message}, or include it in your OpenAPI docs"
+                )
+        tasks: list[ValidationTask] = []
+        for key, value in data.items():
+            if key in properties:
+                if not should_validate_query_param(
+                    param_schema_section=properties[key], request_value=value
+                ):
+                    continue
+
+                normalized_value = normalize_query_param_value(
+                    param_schema=properties[key], value=value
+                )
+
+                tasks.append(
+                    (
+                        compiled.get_property(key),
+                        normalized_value,
+                        context.at(context.reference / key),
+                        False,
+                    )
+                )
+        return tasks
+
+    def test_openapi_array(
+        self, schema_section: dict[str, Any], data: list, test_config: OpenAPITestConfig
+    ) -> None:
+        self.walk(
+            self.test_compiled_array(
+                compiled=SchemaCompiler().compile(schema_section, normalize=False),
+                data=data,
+                context=ValidationContext.from_config(test_config),
+            )
+        )
+
+    def test_compiled_array(
+        self,
+        compiled: CompiledSchemaSection,
+        data: list,
+        context: ValidationContext,
+    ) -> Iterable[ValidationTask]:
+        """
+        Returns the tasks validating the items of an array, see ``walk``. Arrays of scalars are first checked as a
+        whole (see ``compile_bulk_check``), as are large arrays of flat objects when numpy is installed (see
+        ``openapi_tester.columnar``): items are only validated one by one if that check fails.
+        """
+        # items share the reference of their array, so the context is passed on as is
+        items = compiled.get_items()
+        if context.exchange.sampler is not None and isinstance(data, list):
+            data = context.exchange.sampler.sample(data, record=not context.probe)
+        if isinstance(data, list) and not self.validators and not context.validators:
+            check: Callable[[list], bool] | None = items.bulk_check
+            if (
+                check is None
+                and len(data) >= columnar.MIN_ROWS
+                and context.case_tester is None
+                and getattr(self, "case_tester", None) is None
+            ):
+                columnar_check = columnar.get_columnar_check(items)
+                if columnar_check is not None:
+                    check = partial(
+                        columnar_check,
+                        http_message=context.http_message,
+                        none_allowed="3.1" not in (self.get_openapi_schema() or ""),
+                    )
+            if check is not None:
+                if check(data):
+                    return ()
+                # the items before the first one failing the check are valid
+                data = data[find_first_failure(check, data) :]
+        return ((items, array_item, context, False) for array_item in data)
@@ -0,0 +1,114 @@
+"""Streaming Module - decodes the items of a JSON array body one at a time, while reading it."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+# size of the slices rendered bodies are read in, see ``iter_chunks``
+CHUNK_SIZE = 1 << 16
+
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+_decoder = json.JSONDecoder()
+
+
+def iter_chunks(content: bytes, size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Returns the slices of a body, without copying it.
+    """
+    view = memoryview(content)
+    return (view[start : start + size] for start in range(0, len(view), size))
+
+
+def iter_kept(chunks: Iterable[bytes], kept: list[bytes]) -> Iterator[bytes]:
+    """
+    Returns the chunks, adding each chunk to ``kept`` as it is read.
+    """
+    for chunk in chunks:
+        kept.append(chunk)
+        yield chunk
+
+
+def iter_json_array(chunks: Iterable[bytes | memoryview]) -> Iterator[Any] | None:
+    """
+    Returns an iterator over the items of the JSON array a UTF-8 body is made of, decoding them from its chunks as
+    ``json`` does, or None if the body does not start like an array (it is read up to its first character). Only
+    the text of the item being decoded is kept, and chunks are only read when the next item is asked for: a caller
+    stopping at an item never reads the rest of the body.
+
+    An item is decoded once the chunks it spans are read. As the end of an item can't be told from a chunk ending
+    in its middle, an item that can't be decoded yet is tried again once twice as much of the body is read, so that
+    large items don't cost a decoding attempt per chunk. The iterator raises ``json.JSONDecodeError`` where the body
+    stops being a JSON array.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunk_iterator = iter(chunks)
+    buffer = ""
+    position = 0
+    finished = False
+
+    def read() -> None:
+        nonlocal buffer, position, finished
+        chunk = next(chunk_iterator, None)
+        if chunk is None:
+            finished = True
+            text = text_decoder.decode(b"", final=True)
+        else:
+            text = text_decoder.decode(chunk)
+        buffer = buffer[position:] + text
+        position = 0
+
+    def peek() -> str | None:
+        """Skips whitespace, and returns the next character, or None at the end of the body."""
+        nonlocal position
+        while True:
+            position = WHITESPACE_PATTERN.match(buffer, position).end()  # type: ignore[union-attr]
+            if position < len(buffer):
+                return buffer[position]
+            if finished:
+                return None
+            read()
+
+    if peek() != "[":
+        return None
+    position += 1
+
+    def iter_items() -> Iterator[Any]:
+        nonlocal position
+        separator = peek()
+        if separator == "]":
+            position += 1
+        while separator != "]":
+            peek()
+            needed = 0
+            while True:
+                if finished or len(buffer) - position >= needed:
+                    try:
+                        item, end = _decoder.raw_decode(buffer, position)
+                        # a number at the end of what was read may go on in the next chunk (e.g. "2." and "5"),
+                        # so items are only taken once the delimiter after them is read
+                        following = WHITESPACE_PATTERN.match(buffer, end).end()  # type: ignore[union-attr]
+                        if finished or buffer[following : following + 1] in (",", "]"):
+                            break
+                    except json.JSONDecodeError:
+                        if finished:
+                            raise
+                    needed = 2 * (len(buffer) - position)
+                read()
+            position = end
+            yield item
+            separator = peek()
+            if separator not in (",", "]"):
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+        if peek() is not None:
+            raise json.JSONDecodeError("Extra data", buffer, position)
+
+    return iter_items()
@@ -4,6 +4,8 @@ Utils Module - this file contains utility functions used in multiple places.
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_left
 from copy import deepcopy
 from itertools import chain, combinations
 from typing import TYPE_CHECKING
@@ -11,15 +13,40 @@ from typing import TYPE_CHECKING
 import orjson
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any
 
+RECURSIVE_REFERENCE_PLACEHOLDER = "<recursive reference>"
+JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class NormalizedSchemaSection(dict):
+    """
+    A schema section returned by ``normalize_schema_section``, which normalizing again leaves as is. ``origin`` is
+    the section it was normalized from, e.g. the resolved component a discriminator mapping refers to.
+    """
+
+    origin: dict[str, Any] | None = None
+
 
 def merge_objects(dictionaries: Sequence[dict[str, Any]]) -> dict[str, Any]:
     """
     Deeply merge objects.
     """
+    return _merge_objects(dictionaries, {})
+
+
+def _merge_objects(
+    dictionaries: Sequence[dict[str, Any]],
+    memo: dict[tuple[int, ...], tuple[Sequence[dict[str, Any]], dict[str, Any]]],
+) -> dict[str, Any]:
+    # schemas may be recursive, so merges already in progress are looked up instead of being repeated. The memo
+    # holds on to the merged objects, as their ids could otherwise be reused by objects created later on.
+    memo_key = tuple(id(dictionary) for dictionary in dictionaries)
+    if memo_key in memo:
+        return memo[memo_key][1]
     output: dict[str, Any] = {}
+    memo[memo_key] = (dictionaries, output)
     for dictionary in dictionaries:
         for key, value in dictionary.items():
             if key not in output:
@@ -29,17 +56,45 @@ def merge_objects(dictionaries: Sequence[dict[str, Any]]) -> dict[str, Any]:
             if isinstance(current_value, list) and isinstance(value, list):
                 output[key] = list(chain(output[key], value))
                 continue
+            if current_value is value:
+                continue
             if isinstance(current_value, dict) and isinstance(value, dict):
-                output[key] = merge_objects([current_value, value])
+                output[key] = _merge_objects([current_value, value], memo)
                 continue
     return output
 
 
-def normalize_schema_section(schema_section: dict[str, Any]) -> dict[str, Any]:
+def normalize_schema_section(
+    schema_section: dict[str, Any],
+    memo: dict[int, tuple[dict[str, Any], dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
     """
     Remove allOf and handle edge uses of oneOf.
+
+    Calls sharing a memo share the sections they normalize. Normalized sections are ``NormalizedSchemaSection``
+    objects, which are returned as is, without being copied again.
     """
-    output: dict[str, Any] = deepcopy(schema_section)
+    return _normalize_schema_section(schema_section, {} if memo is None else memo)
+
+
+def _is_normalized(schema_section: dict[str, Any]) -> bool:
+    if schema_section.get("allOf"):
+        return False
+    one_of = schema_section.get("oneOf")
+    return not (one_of and all(item.get("enum") for item in one_of))
+
+
+def _normalize_schema_section(
+    schema_section: dict[str, Any],
+    memo: dict[int, tuple[dict[str, Any], dict[str, Any]]],
+) -> dict[str, Any]:
+    # de-referenced schemas share nodes and may be recursive, so every node is normalized once. As with merges, the
+    # memo holds on to the normalized objects so that their ids stay unique.
+    if isinstance(schema_section, NormalizedSchemaSection):
+        return schema_section
+    if id(schema_section) in memo:
+        return memo[id(schema_section)][1]
+    output: dict[str, Any] = dict(schema_section)
     if output.get("allOf"):
         all_of = output.pop("allOf")
         output = {**output, **merge_objects(all_of)}
@@ -47,19 +102,76 @@ def normalize_schema_section(schema_section: dict[str, Any]) -> dict[str, Any]:
         # handle the way drf-spectacular is doing enums
         one_of = output.pop("oneOf")
         output = {**output, **merge_objects(one_of)}
+    # merged allOf members may bring their own allOf along, in which case normalizing again still changes things
+    normalized: dict[str, Any] = (
+        NormalizedSchemaSection() if _is_normalized(output) else {}
+    )
+    memo[id(schema_section)] = (schema_section, normalized)
+    if isinstance(normalized, NormalizedSchemaSection):
+        normalized.origin = schema_section
     for key, value in output.items():
         if isinstance(value, dict):
-            output[key] = normalize_schema_section(value)
+            normalized[key] = _normalize_schema_section(value, memo)
         elif isinstance(value, list):
-            output[key] = [
-                normalize_schema_section(entry) if isinstance(entry, dict) else entry
+            normalized[key] = [
+                _normalize_schema_section(entry, memo)
+                if isinstance(entry, dict)
+                else deepcopy(entry)
                 for entry in value
             ]
-    return output
+        else:
+            normalized[key] = value
+    return normalized
+
+
+def normalize_operation(
+    operation: Any, memo: dict[int, tuple[dict[str, Any], dict[str, Any]]]
+) -> Any:
+    """
+    Normalizes, in place, the schema sections of an operation: those of its parameters, request body and responses.
+    Path item parameters (a list) are normalized as well, other values are left as is.
+    """
+    if isinstance(operation, list):
+        containers = operation
+    elif isinstance(operation, dict):
+        containers = list(operation.get("parameters", []))
+        request_body = operation.get("requestBody")
+        if isinstance(request_body, dict):
+            containers.extend(request_body.get("content", {}).values())
+        for response in operation.get("responses", {}).values():
+            if isinstance(response, dict):
+                # OpenAPI 2 documents the schema on the response itself
+                containers.append(response)
+                containers.extend(response.get("content", {}).values())
+    else:
+        return operation
+    for container in containers:
+        if isinstance(container, dict) and isinstance(container.get("schema"), dict):
+            container["schema"] = normalize_schema_section(container["schema"], memo)
+    return operation
+
+
+def break_reference_cycles(data: Any, ancestors: frozenset[int] = frozenset()) -> Any:
+    """
+    Returns a copy of the data in which objects containing themselves are replaced by a placeholder, so that
+    recursive schema sections can be serialized.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    if id(data) in ancestors:
+        return RECURSIVE_REFERENCE_PLACEHOLDER
+    ancestors = ancestors | {id(data)}
+    if isinstance(data, dict):
+        return {
+            key: break_reference_cycles(value, ancestors) for key, value in data.items()
+        }
+    return [break_reference_cycles(value, ancestors) for value in data]
 
 
 def serialize_schema_section_data(data: dict[str, Any]) -> str:
-    return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return orjson.dumps(
+        break_reference_cycles(data), option=orjson.OPT_INDENT_2, default=str
+    ).decode("utf-8")
 
 
 def lazy_combinations(options_list: Sequence[dict[str, Any]]) -> Iterator[dict]:
@@ -71,6 +183,94 @@ def lazy_combinations(options_list: Sequence[dict[str, Any]]) -> Iterator[dict]:
             yield merge_objects(combination)
 
 
+def find_first_failure(check: Callable[[list], bool], items: list) -> int:
+    """
+    Returns the index of the first item failing a check of whole lists, checking ever shorter leading slices: the
+    check must pass for a list if and only if it passes for each of its items.
+    """
+    return bisect_left(
+        range(1, len(items) + 1), True, key=lambda size: not check(items[:size])
+    )
+
+
+def to_json_data(
+    data: Any, default: Callable[[Any], Any], allow_nan: bool = True
+) -> Any:
+    """
+    Returns the data that encoding data to JSON, with ``default`` for the values JSON has no type for (e.g.
+    ``JSONEncoder.default``), and decoding it back would return, without encoding it: mappings become dicts with
+    string keys, tuples become lists, and subclasses of JSON types become their base type. Like ``json.dumps``,
+    ``NaN`` and infinities are rejected unless ``allow_nan`` is set. Nested data is converted without recursing.
+    """
+    root: list[Any] = []
+    # the items of the containers being converted, their converted containers and their ids: containers met again
+    # while they are being converted are circular references, which ``json.dumps`` rejects
+    stack: list[tuple[Iterator[Any], dict | list, int | None]] = [
+        (iter((data,)), root, None)
+    ]
+    converting: set[int | None] = set()
+    while stack:
+        iterator, converted, _ = stack[-1]
+        item = next(iterator, stack)
+        if item is stack:
+            converting.discard(stack.pop()[2])
+            continue
+        if isinstance(converted, dict):
+            key, value = item
+        else:
+            value = item
+        while type(value) not in JSON_SCALAR_TYPES:
+            if isinstance(value, (dict, list, tuple)):
+                if id(value) in converting:
+                    raise ValueError("Circular reference detected")
+                converting.add(id(value))
+                container: dict | list = {} if isinstance(value, dict) else []
+                stack.append(
+                    (
+                        iter(value.items() if isinstance(value, dict) else value),
+                        container,
+                        id(value),
+                    )
+                )
+                value = container
+                break
+            if isinstance(value, str):
+                value = str.__str__(value)
+            elif isinstance(value, int):
+                value = int.__int__(value)
+            elif isinstance(value, float):
+                value = float.__float__(value)
+            else:
+                value = default(value)
+        if not allow_nan and isinstance(value, float) and not math.isfinite(value):
+            raise ValueError(
+                f"Out of range float values are not JSON compliant: {value!r}"
+            )
+        if isinstance(converted, dict):
+            converted[_to_json_key(key)] = value
+        else:
+            converted.append(value)
+    return root[0]
+
+
+def _to_json_key(key: Any) -> str:
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
 def serialize_json(func):
     def wrapper(*args, content_type="application/json", **kwargs):
         data = kwargs.get("data")
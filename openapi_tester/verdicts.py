@@ -0,0 +1,71 @@
+"""Verdicts Module - remembers the responses that passed validation, within and optionally across test runs."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+
+# Bump whenever what a verdict depends on changes without a release.
+VERDICT_CACHE_FORMAT = 1
+
+
+class VerdictCache:
+    """
+    Keys of the exchanges that passed validation (see ``SchemaTester.get_verdict_key``), so that identical exchanges
+    are not validated again. Only passing verdicts are kept: failing exchanges are always validated, and raise.
+
+    With a directory, keys are appended to a file in it and read back by later runs. Each key is one short line,
+    written with a single append, so test processes sharing the directory do not corrupt each other's keys.
+    """
+
+    filename = "passed"
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory
+        self._keys: set[str] | None = None
+
+    def get_path(self) -> str:
+        return os.path.join(self.directory or "", self.filename)
+
+    @property
+    def keys(self) -> set[str]:
+        # read on first use, so that runs that never look a verdict up don't read the file
+        if self._keys is None:
+            self._keys = set()
+            if self.directory is not None:
+                with (
+                    contextlib.suppress(OSError),
+                    open(self.get_path(), encoding="utf-8") as file,
+                ):
+                    self._keys.update(line.strip() for line in file)
+        return self._keys
+
+    def add(self, key: str) -> None:
+        if key in self.keys:
+            return
+        self.keys.add(key)
+        if self.directory is not None:
+            # when the file can't be written, the verdict is still remembered by this process
+            with contextlib.suppress(OSError):
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self.get_path(), "a", encoding="utf-8") as file:
+                    file.write(f"{key}\n")
+
+    def clear(self) -> None:
+        self._keys = set()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys
+
+
+_verdict_caches: dict[str | None, VerdictCache] = {}
+
+
+def get_verdict_cache(directory: str | None) -> VerdictCache:
+    """
+    Returns the process-wide verdict cache persisted in a directory, or kept in memory only for ``None``.
+    """
+    verdict_cache = _verdict_caches.get(directory)
+    if verdict_cache is None:
+        verdict_cache = _verdict_caches[directory] = VerdictCache(directory)
+    return verdict_cache
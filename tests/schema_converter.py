@@ -31,7 +31,8 @@ class SchemaToPythonConverter:
 
     def convert_schema(self, schema: dict[str, Any]) -> Any:
         schema_type = schema.get("type", "object")
-        schema = normalize_schema_section(schema)
+        # sections are shared by the resolved schema, so the normalized one is copied before popping from it
+        schema = dict(normalize_schema_section(schema))
         if "oneOf" in schema:
             one_of = schema.pop("oneOf")
             return self.convert_schema({**schema, **random.sample(one_of, 1)[0]})
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.clients import OpenAPIClient
+from openapi_tester.codegen import ValidatorGenerator
+from openapi_tester.compiler import SchemaCompiler
+from openapi_tester.config import settings
+from openapi_tester.context import ValidationContext
+from openapi_tester.exceptions import DocumentationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pet_schema = {
+    "type": "object",
+    "required": ["name", "password"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1, "readOnly": True},
+        "name": {"type": "string", "maxLength": 10, "pattern": "^[A-Z]"},
+        "password": {"type": "string", "writeOnly": True},
+        "tags": {
+            "type": "array",
+            "items": {"type": "string", "enum": ["cat", "dog"]},
+        },
+        "owner": {
+            "type": "object",
+            "nullable": True,
+            "additionalProperties": {"type": "number"},
+        },
+        "kind": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+    },
+}
+
+
+@pytest.fixture
+def codegen(monkeypatch):
+    monkeypatch.setattr(settings.schema, "codegen", True)
+
+
+def generate(schema: dict, http_message: str = "response"):
+    interpreter = SchemaTester()
+    context = ValidationContext(http_message=http_message)
+
+    def fallback(section, data):
+        try:
+            interpreter.test_compiled_schema_section(section, data, context)
+        except DocumentationError:
+            return False
+        return True
+
+    generator = ValidatorGenerator(
+        SchemaCompiler().compile(schema), http_message, openapi_version="3.0.0"
+    )
+    return generator.build(fallback)
+
+
+@pytest.mark.parametrize(
+    ("data", "accepted"),
+    [
+        ({"id": 1, "name": "Fido"}, True),
+        ({"name": "Fido", "tags": ["cat"], "owner": None, "kind": 1}, True),
+        ({"name": "Fido", "owner": {"weight": 1.5}}, True),
+        ({"id": 1}, False),
+        ({"id": 0, "name": "Fido"}, False),
+        ({"name": "fido"}, False),
+        ({"name": "Fidooooooooo"}, False),
+        ({"name": "Fido", "password": "secret"}, False),
+        ({"name": "Fido", "tags": ["bird"]}, False),
+        ({"name": "Fido", "owner": {"weight": "heavy"}}, False),
+        ({"name": "Fido", "kind": []}, False),
+        ({"name": "Fido", "age": 1}, False),
+        (None, False),
+    ],
+)
+def test_generated_validator(data, accepted):
+    assert generate(pet_schema)(data) is accepted
+
+
+def test_generated_validator_checks_request_properties():
+    validator = generate(pet_schema, http_message="request")
+
+    assert validator({"name": "Fido", "password": "secret"})
+    assert not validator({"name": "Fido"})
+    assert not validator({"id": 1, "name": "Fido", "password": "secret"})
+
+
+def test_generated_validator_for_recursive_schema():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    schema["properties"]["child"] = schema
+    validator = generate(schema)
+
+    assert validator({"name": "a", "child": {"name": "b", "child": {"name": "c"}}})
+    assert not validator({"name": "a", "child": {"name": "b", "child": {"name": 1}}})
+
+
+def test_generated_module_is_imported_from_build_dir(tmp_path):
+    compiled = SchemaCompiler().compile(pet_schema)
+    ValidatorGenerator(compiled, "response", "3.0.0").build(
+        lambda section, data: True, build_dir=str(tmp_path)
+    )
+    (module,) = tmp_path.glob("*.py")
+
+    with patch.object(ValidatorGenerator, "generate_source") as generate_source:
+        validator = ValidatorGenerator(
+            SchemaCompiler().compile(pet_schema), "response", "3.0.0"
+        ).build(lambda section, data: True, build_dir=str(tmp_path))
+
+    generate_source.assert_not_called()
+    assert module.read_text().startswith('"""Validator generated by openapi_tester')
+    assert validator({"name": "Fido"})
+
+
+def test_generated_modules_are_keyed_by_schema():
+    compiler = SchemaCompiler()
+    first = ValidatorGenerator(compiler.compile(pet_schema), "response", "3.0.0")
+
+    assert (
+        first.key
+        == ValidatorGenerator(
+            compiler.compile(dict(pet_schema)), "response", "3.0.0"
+        ).key
+    )
+    assert (
+        first.key
+        != ValidatorGenerator(compiler.compile(pet_schema), "request", "3.0.0").key
+    )
+    assert (
+        first.key
+        != ValidatorGenerator(
+            compiler.compile({**pet_schema, "required": ["name"]}), "response", "3.0.0"
+        ).key
+    )
+
+
+@pytest.mark.usefixtures("codegen")
+def test_deeply_nested_data_falls_back_to_the_interpreter():
+    node = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    node["properties"]["child"] = node
+    leaf = {"value": 0}
+    data = leaf
+    for value in range(sys.getrecursionlimit() * 5):
+        data = {"value": value, "child": data}
+    tester = SchemaTester()
+    compiled = tester.compiler.compile(node)
+    context = ValidationContext(http_message="response")
+
+    tester.validate_schema_section(compiled, data, context)
+
+    leaf["value"] = "0"
+    with pytest.raises(DocumentationError):
+        tester.validate_schema_section(compiled, data, context)
+
+
+@pytest.mark.usefixtures("codegen")
+def test_validate_response_with_generated_validator(cars_api_schema: Path):
+    schema_tester = SchemaTester(schema_file_path=str(cars_api_schema))
+    openapi_client = OpenAPIClient(schema_tester=schema_tester)
+
+    with patch.object(
+        SchemaTester,
+        "test_compiled_schema_section",
+        autospec=True,
+        side_effect=SchemaTester.test_compiled_schema_section,
+    ) as test_compiled_schema_section:
+        openapi_client.get(path="/api/v1/cars/correct")
+
+    test_compiled_schema_section.assert_not_called()
+    assert schema_tester._generated_validators
+
+
+def test_generated_validator_raises_interpreter_errors(
+    cars_api_schema: Path, monkeypatch
+):
+    openapi_client = OpenAPIClient(
+        schema_tester=SchemaTester(schema_file_path=str(cars_api_schema))
+    )
+    with pytest.raises(DocumentationError) as interpreted:
+        openapi_client.get(path="/api/v1/cars/incorrect")
+    monkeypatch.setattr(settings.schema, "codegen", True)
+
+    with pytest.raises(DocumentationError) as generated:
+        openapi_client.get(path="/api/v1/cars/incorrect")
+
+    assert str(generated.value) == str(interpreted.value)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.columnar import MIN_ROWS, compile_columnar_check
+from openapi_tester.compiler import SchemaCompiler
+from openapi_tester.exceptions import DocumentationError
+
+pytest.importorskip("numpy")
+
+tester = SchemaTester()
+
+row_schema = {
+    "type": "object",
+    "required": ["id", "amount"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 0},
+        "amount": {"type": "number", "multipleOf": 0.5, "maximum": 10**6},
+        "status": {"type": "string", "enum": ["open", "closed"], "maxLength": 6},
+        "note": {"type": "string", "nullable": True},
+        "password": {"type": "string", "writeOnly": True},
+    },
+}
+array_schema = {"type": "array", "items": row_schema}
+
+
+def get_rows() -> list[dict]:
+    return [
+        {"id": i, "amount": i / 2, "status": "open", "note": None if i % 2 else "x"}
+        for i in range(MIN_ROWS)
+    ]
+
+
+def test_columnar_check():
+    check = compile_columnar_check(SchemaCompiler().compile(row_schema))
+    rows = get_rows()
+
+    assert check(rows, "response", True) is True
+    assert check(rows, "response", False) is False
+    assert check([*rows, {"id": 1}], "response", True) is False
+    assert check([*rows, {"id": 1, "amount": 1, "other": 1}], "response", True) is False
+    assert check([*rows, {"id": 1, "amount": 1, "password": ""}], "request", True)
+    assert not check([*rows, {"id": 1, "amount": 1, "password": ""}], "response", True)
+    assert check([*rows, {"id": 1, "amount": 0.3}], "response", True) is False
+    assert check([*rows, {"id": 2**70, "amount": 1}], "response", True) is True
+    assert check([*rows, {"id": -1, "amount": 1}], "response", True) is False
+    assert check([*rows, {"id": True, "amount": 1}], "response", True) is False
+    assert (
+        check([*rows, {"id": 1, "amount": 1, "status": "pending"}], "response", True)
+        is False
+    )
+
+
+def test_columnar_check_ignores_keywords_of_other_types():
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "pattern": "^1", "maxLength": 1},
+            "name": {"type": "string", "minimum": 1, "multipleOf": 2},
+            "active": {"type": "boolean", "maximum": 0},
+        },
+    }
+    check = compile_columnar_check(SchemaCompiler().compile(schema))
+    rows = [{"id": i, "name": "a", "active": True} for i in range(MIN_ROWS)]
+
+    assert check(rows, "response", True) is True
+    tester.test_schema_section({"type": "array", "items": schema}, rows)
+
+
+def test_columnar_check_requires_flat_objects():
+    compiler = SchemaCompiler()
+    nested = {
+        "type": "object",
+        "properties": {"owner": {"type": "object", "properties": {}}},
+    }
+    formatted = {
+        "type": "object",
+        "properties": {"id": {"type": "string", "format": "uuid"}},
+    }
+
+    assert compile_columnar_check(compiler.compile(nested)) is None
+    assert compile_columnar_check(compiler.compile(formatted)) is None
+    assert compile_columnar_check(compiler.compile({"type": "string"})) is None
+    with patch("openapi_tester.columnar.np", None):
+        assert compile_columnar_check(compiler.compile(row_schema)) is None
+
+
+def test_valid_rows_are_not_validated_one_by_one():
+    with patch.object(
+        SchemaTester, "test_compiled_object", wraps=tester.test_compiled_object
+    ) as test_compiled_object:
+        tester.test_schema_section(array_schema, get_rows())
+
+    test_compiled_object.assert_not_called()
+
+
+def test_first_invalid_row_is_reported():
+    rows = get_rows()
+    rows[-2]["status"] = "paused"
+    rows[-1]["amount"] = -0.3
+
+    with (
+        patch.object(
+            SchemaTester, "test_compiled_object", wraps=tester.test_compiled_object
+        ) as test_compiled_object,
+        pytest.raises(
+            DocumentationError, match="Expected: a member of the enum"
+        ) as error,
+    ):
+        tester.test_schema_section(array_schema, rows)
+
+    assert "root > status" in str(error.value)
+    assert test_compiled_object.call_count == 1
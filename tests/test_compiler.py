@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.compiler import ScalarKeywords, SchemaCompiler
+from openapi_tester.context import ValidationContext
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.validators import validate_enum, validate_min_length, validate_type
+
+tester = SchemaTester()
+
+pet_schema = {
+    "type": "object",
+    "required": ["name", "password"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "enum": ["Fido", "Tom"]},
+        "password": {"type": "string", "writeOnly": True},
+        "owner": {"allOf": [{"type": "object"}, {"properties": {"id": {}}}]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def test_compiled_section_runs_only_applicable_validators():
+    compiled = SchemaCompiler().compile(pet_schema)
+
+    assert compiled.validators == (validate_type,)
+    assert compiled.get_property("name").validators == (
+        validate_type,
+        validate_min_length,
+        validate_enum,
+    )
+
+
+def test_compiled_section_property_sets():
+    compiled = SchemaCompiler().compile(pet_schema)
+
+    assert compiled.write_only_properties == {"password"}
+    assert compiled.get_required_keys("response") == {"name"}
+    assert compiled.get_required_keys("request") == {"name", "password"}
+    assert compiled.get_property("owner").schema_section == {
+        "type": "object",
+        "properties": {"id": {}},
+    }
+
+
+def test_compiled_sections_are_shared():
+    compiler = SchemaCompiler()
+    compiled = compiler.compile(pet_schema)
+
+    assert compiler.compile(pet_schema) is compiled
+    assert compiled.get_property("tags") is compiler.compile(
+        compiled.properties["tags"]
+    )
+    assert compiler.compile(dict(pet_schema)) is not compiled
+
+
+def test_branch_indexes_are_compiled_once():
+    any_of = [{"type": "object", "properties": {"a": {}}}, {"properties": {"b": {}}}]
+    compiler = SchemaCompiler()
+    branch_index = compiler.get_branch_index(any_of)
+
+    assert compiler.get_branch_index(any_of) is branch_index
+    assert [option.source for option in branch_index.options] == any_of
+    assert branch_index.options[0] is compiler.compile(any_of[0])
+
+
+def test_branch_index_candidates():
+    options = [
+        {"type": "string"},
+        {"type": "integer", "enum": [1, 2]},
+        {"type": "object", "required": ["id"], "properties": {"id": {}}},
+        {
+            "type": "object",
+            "properties": {"kind": {"type": "string", "enum": ["cat"]}},
+            "additionalProperties": True,
+        },
+        {"oneOf": [{"type": "string"}]},
+        {"description": "anything"},
+    ]
+    branch_index = SchemaCompiler().get_branch_index(options)
+
+    def candidates(data):
+        return [
+            options.index(option.source)
+            for option in branch_index.get_candidates(data, "response")
+        ]
+
+    assert candidates("a") == [0, 4, 5]
+    assert candidates(2) == [1, 4, 5]
+    assert candidates(3) == [4, 5]
+    assert candidates({"id": 1}) == [2, 3, 4, 5]
+    assert candidates({"id": 1, "kind": "dog"}) == [4, 5]
+    assert candidates({"kind": "cat", "name": "Tom"}) == [3, 4, 5]
+    assert candidates({"kind": ["cat"]}) == [3, 4, 5]
+    assert candidates(None) == [0, 1, 2, 3, 4, 5]
+    with patch(
+        "openapi_tester.validators.settings.validation.disabled_constraints", ["enum"]
+    ):
+        assert candidates(3) == [1, 4, 5]
+
+
+def test_branch_index_ignores_undocumented_required_keys():
+    schema = {
+        "oneOf": [
+            {"type": "object", "required": ["kind"], "additionalProperties": True},
+            {"type": "string"},
+        ]
+    }
+    branch_index = SchemaCompiler().get_branch_index(schema["oneOf"])
+
+    assert len(branch_index.get_candidates({"a": 1}, "response")) == 1
+    tester.test_schema_section(schema, {"a": 1})
+
+
+def test_bulk_check():
+    compiler = SchemaCompiler()
+    integers = compiler.compile({"type": "integer", "minimum": 0, "maximum": 9})
+    tags = compiler.compile(
+        {"type": "string", "maxLength": 3, "pattern": "^t", "enum": ["t1", "t2"]}
+    )
+
+    assert integers.bulk_check([0, 5, 9]) is True
+    assert integers.bulk_check([]) is True
+    assert integers.bulk_check([0, 10]) is False
+    assert integers.bulk_check([1, True]) is False
+    assert integers.bulk_check([1, None]) is False
+    assert tags.bulk_check(["t1", "t2"]) is True
+    assert tags.bulk_check(["t1", "t3"]) is False
+    assert compiler.compile({"type": "string", "format": "uuid"}).bulk_check is None
+    assert compiler.compile({"type": "object"}).bulk_check is None
+    assert compiler.compile({"type": ["string", "null"]}).bulk_check is None
+
+
+def test_scalar_keywords():
+    numbers = ScalarKeywords.from_schema_section(
+        {"minimum": 1, "exclusiveMaximum": True, "maximum": 5}, "integer"
+    )
+    strings = ScalarKeywords.from_schema_section({"minLength": 2}, "string")
+
+    assert numbers is not None
+    assert strings is not None
+    assert numbers.check_bounds([1, 4]) is True
+    assert numbers.check_bounds([1, 5]) is False
+    assert strings.check_lengths([2, 3]) is True
+    assert strings.check_lengths([1]) is False
+    assert strings.check_values(["anything"]) is True
+    assert ScalarKeywords.from_schema_section({"enum": [[1]]}, "string") is None
+    assert ScalarKeywords.from_schema_section({"pattern": "("}, "string") is None
+
+
+def test_scalar_keywords_skip_keywords_of_other_types():
+    keywords = ScalarKeywords.from_schema_section(
+        {"minimum": 1, "maxLength": 3, "pattern": "("}, "boolean"
+    )
+
+    assert keywords is not None
+    assert not keywords.bounded
+    assert not keywords.measured
+    assert keywords.match is None
+
+
+@pytest.mark.parametrize(
+    ("items", "data"),
+    [
+        ({"type": "integer", "pattern": "^1"}, [1, 2]),
+        ({"type": "string", "minimum": 1}, ["a"]),
+        ({"type": "boolean", "maxLength": 3}, [True]),
+    ],
+)
+def test_bulk_check_ignores_keywords_of_other_types(items: dict, data: list):
+    tester.test_schema_section({"type": "array", "items": items}, data)
+
+
+def test_bulk_checked_array_reports_first_invalid_item():
+    schema = {"type": "array", "items": {"type": "integer", "maximum": 9}}
+
+    tester.test_schema_section(schema, list(range(10)))
+    with pytest.raises(DocumentationError, match="The value 10 exceeds"):
+        tester.test_schema_section(schema, [*range(10), 10, 11])
+    with patch(
+        "openapi_tester.validators.settings.validation.disabled_constraints",
+        ["maximum"],
+    ):
+        tester.test_schema_section(schema, [*range(10), 10, 11])
+
+
+def test_test_schema_section_is_not_cached():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    tester.test_schema_section(schema, {"name": "Fido"})
+    schema["properties"]["name"]["type"] = "integer"
+
+    with pytest.raises(DocumentationError, match='Expected: an "integer" type value'):
+        tester.test_schema_section(schema, {"name": "Fido"})
+
+
+def test_compiled_section_is_validated_against_current_settings():
+    compiled = tester.compiler.compile({"type": "string", "minLength": 5})
+    context = ValidationContext()
+
+    with pytest.raises(DocumentationError, match="minimum length of 5"):
+        tester.test_compiled_schema_section(compiled, "Fido", context)
+    with patch(
+        "openapi_tester.validators.settings.validation.disabled_constraints",
+        ["minLength"],
+    ):
+        tester.test_compiled_schema_section(compiled, "Fido", context)
@@ -3,6 +3,9 @@ import pathlib
 from openapi_tester.config import (
     DEFAULT_CONFIG,
     OpenAPITestConfig,
+    SamplingPolicy,
+    SamplingSettings,
+    SchemaSettings,
     ValidationSettings,
     load_config_from_ini_file,
     load_config_from_pyproject_toml,
@@ -21,6 +24,15 @@ def test_default_validation_settings():
     assert settings.disabled_types == []
     assert settings.disabled_formats == []
     assert settings.disabled_constraints == []
+    assert settings.max_any_of_options == 64
+    assert settings.native_response_data is False
+    assert settings.stream_min_size is None
+    assert settings.memoize_subtrees is False
+    assert settings.cache_verdicts is False
+    assert settings.verdict_cache_dir is None
+    assert settings.sampling == SamplingSettings(
+        endpoints=[], policies={}, first=100, last=100, random=100, seed=0
+    )
 
 
 def test_load_config_from_pyproject_toml_with_valid_config():
@@ -55,6 +67,24 @@ def test_load_config_from_pyproject_toml_with_valid_config():
         "minProperties",
         "maxProperties",
     ]
+    assert config.validation.max_any_of_options == 12
+    assert config.validation.native_response_data is True
+    assert config.validation.stream_min_size == 1000000
+    assert config.validation.memoize_subtrees is True
+    assert config.validation.cache_verdicts is True
+    assert config.validation.verdict_cache_dir == ".pytest_cache/django-contract-tester"
+    assert config.validation.sampling == SamplingSettings(
+        endpoints=["GET /api/v1/reports/*"],
+        policies={
+            "GET /api/v1/exports/*": SamplingPolicy(
+                first=10, last=10, random=1000, seed=42
+            )
+        },
+        first=10,
+        last=10,
+        random=20,
+        seed=42,
+    )
 
 
 def test_load_config_from_pyproject_toml_with_nonexistent_file():
@@ -115,6 +145,13 @@ def test_load_config_from_pyproject_toml_with_wrong_configs():
     assert config.validation.disabled_types == []
     assert config.validation.disabled_formats == []
     assert config.validation.disabled_constraints == []
+    assert config.validation.max_any_of_options == 64
+    assert config.validation.native_response_data is False
+    assert config.validation.stream_min_size is None
+    assert config.validation.memoize_subtrees is False
+    assert config.validation.cache_verdicts is False
+    assert config.validation.verdict_cache_dir is None
+    assert config.validation.sampling == SamplingSettings()
 
 
 def test_load_config_from_pyproject_toml_with_wrong_formatted_configs():
@@ -169,6 +206,24 @@ def test_load_config_from_ini_file_with_valid_config():
         "minProperties",
         "maxProperties",
     ]
+    assert config.validation.max_any_of_options == 12
+    assert config.validation.native_response_data is True
+    assert config.validation.stream_min_size == 1000000
+    assert config.validation.memoize_subtrees is True
+    assert config.validation.cache_verdicts is True
+    assert config.validation.verdict_cache_dir == ".pytest_cache/django-contract-tester"
+    assert config.validation.sampling == SamplingSettings(
+        endpoints=["GET /api/v1/reports/*"],
+        policies={
+            "GET /api/v1/exports/*": SamplingPolicy(
+                first=10, last=10, random=1000, seed=42
+            )
+        },
+        first=10,
+        last=10,
+        random=20,
+        seed=42,
+    )
 
 
 def test_load_config_from_ini_file_with_nonexistent_file():
@@ -220,3 +275,30 @@ def test_load_config_from_pyproject_toml_file_with_excluded_endpoints():
         "GET /api/v1/users/*",
         "POST /api/v1/users/*",
     ]
+
+
+def test_default_schema_settings():
+    assert SchemaSettings().cache_dir is None
+    assert SchemaSettings().lazy is False
+    assert SchemaSettings().codegen is False
+    assert SchemaSettings().build_dir is None
+
+
+def test_load_config_from_pyproject_toml_with_schema_settings():
+    config_path = pathlib.Path("tests/data/config/pyproject_schema.toml")
+    config = load_config_from_pyproject_toml(config_path=config_path)
+
+    assert config.schema.cache_dir == ".django-contract-tester-cache"
+    assert config.schema.lazy is True
+    assert config.schema.codegen is True
+    assert config.schema.build_dir == ".django-contract-tester-build"
+
+
+def test_load_config_from_ini_file_with_schema_settings():
+    config_path = pathlib.Path("tests/data/config/.django-contract-tester-schema")
+    config = load_config_from_ini_file(config_path=config_path)
+
+    assert config.schema.cache_dir == ".django-contract-tester-cache"
+    assert config.schema.lazy is True
+    assert config.schema.codegen is True
+    assert config.schema.build_dir == ".django-contract-tester-build"
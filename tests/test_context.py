@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import OpenAPITestConfig
+from openapi_tester.context import ReferencePath, ValidationContext
+from openapi_tester.exceptions import DocumentationError, ProbeMismatch
+from openapi_tester.response_handler_factory import ResponseHandlerFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from openapi_tester.response_handler import GenericRequest
+
+tester = SchemaTester()
+
+
+def test_reference_path():
+    root = ReferencePath("GET /api/pets > response")
+
+    assert str(root / 200 / "name") == "GET /api/pets > response > 200 > name"
+    assert str(root.join(".oneOf")) == "GET /api/pets > response.oneOf"
+    assert str(root) == "GET /api/pets > response"
+
+
+def test_context_from_config():
+    test_config = OpenAPITestConfig(
+        reference="GET /api/pets", http_message="request", validators=[str]
+    )
+
+    context = ValidationContext.from_config(test_config)
+
+    assert str(context.reference) == "GET /api/pets"
+    assert context.http_message == "request"
+    assert context.validators == (str,)
+    with pytest.raises(AttributeError):
+        context.http_message = "response"
+
+
+def test_array_items_share_the_context():
+    schema = {"type": "array", "items": {"type": "object", "properties": {"a": {}}}}
+
+    with patch.object(ValidationContext, "at", autospec=True) as at:
+        tester.test_schema_section(schema, [{}] * 100)
+
+    at.assert_not_called()
+
+
+def test_error_reference_is_built_from_the_path():
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {"name": {"oneOf": [{"type": "string"}, {"type": "null"}]}},
+        },
+    }
+
+    with pytest.raises(DocumentationError) as error:
+        tester.test_schema_section(
+            schema, [{"name": "Fido"}, {"name": 1}], OpenAPITestConfig(reference="pets")
+        )
+
+    assert "Reference: pets > name.oneOf" in str(error.value)
+
+
+def test_validation_does_not_change_the_test_config(
+    response_factory, pets_api_schema: Path, pets_post_request: GenericRequest
+):
+    schema_tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    response = response_factory(
+        schema=None,
+        url_fragment="/api/pets",
+        method="POST",
+        status_code=201,
+        request=pets_post_request,
+    )
+    response_handler = ResponseHandlerFactory.create(response=response)
+    test_config = OpenAPITestConfig()
+
+    schema_tester.validate_request(response_handler, test_config=test_config)
+
+    assert test_config == OpenAPITestConfig()
+
+
+def test_one_of_options_are_probed_without_error_messages():
+    schema = {
+        "type": "array",
+        "items": {
+            "oneOf": [
+                {"type": "object", "required": ["a"], "properties": {"a": {}}},
+                {"type": "object", "required": ["b"], "properties": {"b": {}}},
+            ]
+        },
+    }
+
+    with patch(
+        "openapi_tester.section_tester.serialize_schema_section_data"
+    ) as serialize:
+        tester.test_schema_section(schema, [{"b": 1}] * 10)
+        with pytest.raises(
+            DocumentationError, match="Expected data to match one and only one"
+        ):
+            tester.test_schema_section(schema, [{"c": 1}])
+
+    serialize.assert_not_called()
+
+
+def test_probe_context():
+    probe_context = ValidationContext().as_probe()
+    compiled = tester.compiler.compile({"type": "string"})
+
+    assert probe_context.probe
+    assert probe_context.as_probe() is probe_context
+    assert tester.probe_compiled_schema_section(compiled, "a", probe_context)
+    with pytest.raises(ProbeMismatch):
+        tester.test_compiled_schema_section(compiled, 1, probe_context)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import OpenAPITestConfig
+from openapi_tester.diagnostics import (
+    Diagnostic,
+    render_undocumented_method,
+    render_undocumented_route,
+)
+from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.response_handler_factory import ResponseHandlerFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from openapi_tester.response_handler import GenericRequest
+
+
+def test_diagnostic_is_rendered_when_formatted():
+    diagnostic = Diagnostic(
+        render_undocumented_method, "root", "put", {"get": {}, "parameters": []}
+    )
+
+    assert f"{diagnostic}" == (
+        "\n\nroot\n\nUndocumented method: put.\n\nDocumented methods: ['get']."
+    )
+
+
+def test_diagnostics_are_not_rendered_on_success(
+    response_factory, pets_api_schema: Path, pets_post_request: GenericRequest
+):
+    schema_tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    response = response_factory(
+        schema=None,
+        url_fragment="/api/pets",
+        method="POST",
+        status_code=201,
+        request=pets_post_request,
+    )
+    response_handler = ResponseHandlerFactory.create(response=response)
+
+    with patch(
+        "openapi_tester.schema_tester.render_undocumented_route",
+        wraps=render_undocumented_route,
+    ) as render:
+        schema_tester.validate_request(response_handler)
+
+    render.assert_not_called()
+
+
+def test_undocumented_route_lists_documented_routes(
+    pets_api_schema_prefix_in_server: Path, pets_post_request: GenericRequest
+):
+    schema_tester = SchemaTester(schema_file_path=str(pets_api_schema_prefix_in_server))
+
+    with pytest.raises(UndocumentedSchemaSectionError) as error:
+        schema_tester.retrieve_documented_request(
+            pets_post_request, OpenAPITestConfig(reference="POST /api/pets")
+        )
+
+    assert "\n\nPOST /api/pets\n\nUndocumented route /api/pets." in str(error.value)
+    assert str(error.value).endswith("Documented routes: /pets\n\t• /pets/{id}")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import settings
+from openapi_tester.context import ValidationContext
+from openapi_tester.exceptions import DocumentationError
+from tests.utils import TEST_ROOT
+
+schema_path = str(TEST_ROOT / "schemas" / "discriminator_schema.yaml")
+
+
+def get_animals_schema(schema_tester: SchemaTester) -> dict:
+    return schema_tester.loader.get_schema()["paths"]["/api/animals"]["get"][
+        "responses"
+    ]["200"]["content"]["application/json"]["schema"]
+
+
+@pytest.fixture(params=[False, True], ids=["eager", "lazy"])
+def schema_tester(request, monkeypatch) -> SchemaTester:
+    monkeypatch.setattr(settings.schema, "lazy", request.param)
+    return SchemaTester(schema_file_path=schema_path)
+
+
+def test_discriminator_selects_option(schema_tester: SchemaTester):
+    compiled = schema_tester.compiler.compile(get_animals_schema(schema_tester))
+    items = compiled.get_items()
+    animals = [
+        {"kind": "cat", "name": "Tom"},
+        {"kind": "Dog", "name": "Fido", "barks": True},
+    ] * 50
+
+    with patch.object(
+        SchemaTester,
+        "test_compiled_one_of",
+        autospec=True,
+        side_effect=SchemaTester.test_compiled_one_of,
+    ) as test_compiled_one_of:
+        schema_tester.test_compiled_schema_section(
+            compiled, animals, ValidationContext()
+        )
+
+    test_compiled_one_of.assert_not_called()
+    schema = schema_tester.loader.get_schema()
+    cat = items.get_discriminated_option({"kind": "cat"}, schema)
+    assert cat is not None
+    assert cat.source["properties"].keys() == {"kind", "name"}
+    # the mapped value and the component name select the same option
+    assert items.get_discriminated_option({"kind": "Cat"}, schema) is cat
+    dog = items.get_discriminated_option({"kind": "Dog"}, schema)
+    assert dog is not None
+    assert "barks" in dog.properties
+
+
+def test_discriminator_reports_errors_of_selected_option(schema_tester: SchemaTester):
+    compiled = schema_tester.compiler.compile(get_animals_schema(schema_tester))
+
+    # the Dog option would accept it, but the discriminator selects Cat
+    with pytest.raises(
+        DocumentationError, match='missing from the schema definition: "barks"'
+    ):
+        schema_tester.test_compiled_schema_section(
+            compiled,
+            [{"kind": "cat", "name": "Tom", "barks": True}],
+            ValidationContext(),
+        )
+
+
+def test_unknown_discriminator_values_fall_back_to_options(
+    schema_tester: SchemaTester,
+):
+    compiled = schema_tester.compiler.compile(get_animals_schema(schema_tester))
+
+    schema_tester.test_compiled_schema_section(
+        compiled, [{"kind": "lion", "name": "Leo", "barks": False}], ValidationContext()
+    )
+
+    assert compiled.get_items().cache.discriminated_options == {"lion": None}
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+import yaml
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from rest_framework import status
+
+from openapi_tester import SchemaTester
+from openapi_tester.clients import OpenAPIClient
+from openapi_tester.config import settings
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.loaders import StaticSchemaLoader
+from openapi_tester.registry import schema_registry
+from openapi_tester.resolver import LazyMapping, ReferenceResolver
+from openapi_tester.utils import NormalizedSchemaSection
+from tests.utils import TEST_ROOT
+
+yaml_schema_path = str(TEST_ROOT / "schemas" / "spectactular_reference_schema.yaml")
+
+
+@pytest.fixture(autouse=True)
+def lazy(monkeypatch):
+    monkeypatch.setattr(settings.schema, "lazy", True)
+    schema_registry.clear()
+    yield
+    schema_registry.clear()
+
+
+def test_lazy_schema_is_validated_one_operation_at_a_time():
+    with patch.object(StaticSchemaLoader, "validate_schema") as validate_schema:
+        schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+
+        validate_schema.assert_called_once()
+        assert validate_schema.call_args.args[0]["paths"] == {}
+        assert "components" not in validate_schema.call_args.args[0]
+        assert isinstance(schema["paths"]["/api/{version}/cars/correct"], LazyMapping)
+        assert isinstance(schema["components"]["schemas"], LazyMapping)
+
+        schema["paths"]["/api/{version}/cars/correct"]["get"]
+        schema["paths"]["/api/{version}/cars/correct"]["get"]
+
+    assert validate_schema.call_count == 2
+    operation_document = validate_schema.call_args.args[0]
+    assert list(operation_document["paths"]) == ["/api/v1/cars/correct"]
+    assert list(operation_document["paths"]["/api/v1/cars/correct"]) == ["get"]
+    assert "Car" in operation_document["components"]["schemas"]
+
+
+def test_invalid_operations_are_reported_on_first_access(tmp_path):
+    with open(yaml_schema_path, encoding="utf-8") as file:
+        document = yaml.safe_load(file)
+    document["paths"]["/api/v1/cars/correct"]["put"]["responses"] = "invalid"
+    invalid_schema_path = tmp_path / "schema.yaml"
+    invalid_schema_path.write_text(yaml.safe_dump(document), encoding="utf-8")
+
+    schema = StaticSchemaLoader(str(invalid_schema_path)).get_schema()
+
+    assert schema["paths"]["/api/{version}/cars/correct"]["get"]
+    with pytest.raises(OpenAPIValidationError):
+        schema["paths"]["/api/{version}/cars/correct"]["put"]
+
+
+def test_operations_are_resolved_on_first_access():
+    with patch.object(
+        ReferenceResolver,
+        "resolve_node",
+        autospec=True,
+        side_effect=ReferenceResolver.resolve_node,
+    ) as resolve_node:
+        schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+        resolved_at_load = resolve_node.call_count
+        route = schema["paths"]["/api/{version}/cars/correct"]
+
+        assert resolve_node.call_count == resolved_at_load
+        operation = route["get"]
+        assert resolve_node.call_count > resolved_at_load
+        assert route["get"] is operation
+
+
+def test_operations_are_normalized_on_first_access():
+    schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+    operation = schema["paths"]["/api/{version}/cars/correct"]["get"]
+
+    assert isinstance(
+        operation["responses"]["200"]["content"]["application/json"]["schema"],
+        NormalizedSchemaSection,
+    )
+
+
+def test_lazy_mappings_can_be_changed():
+    schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+    path_item = deepcopy(schema["paths"]["/api/{version}/cars/correct"])
+
+    del path_item["get"]
+    path_item["patch"] = {"responses": {}}
+
+    assert "get" not in path_item
+    assert list(path_item) == ["post", "put", "delete", "patch"]
+    assert path_item["patch"] == {"responses": {}}
+    assert "get" in schema["paths"]["/api/{version}/cars/correct"]
+
+
+def test_lazy_and_eager_schemas_are_registered_separately(monkeypatch):
+    loader = StaticSchemaLoader(yaml_schema_path)
+    lazy_key = loader.get_registry_key()
+    monkeypatch.setattr(settings.schema, "lazy", False)
+
+    assert loader.get_registry_key() != lazy_key
+
+
+def test_lazy_schema_resolves_like_eager_schema(monkeypatch):
+    lazy_schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+    monkeypatch.setattr(settings.schema, "lazy", False)
+    eager_schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+
+    for path, path_item in eager_schema["paths"].items():
+        for method, operation in path_item.items():
+            assert lazy_schema["paths"][path][method] == operation
+
+
+def test_lazy_schema_in_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.schema, "cache_dir", str(tmp_path))
+    StaticSchemaLoader(yaml_schema_path).get_schema()
+    schema_registry.clear()
+
+    with patch.object(StaticSchemaLoader, "parse_schema_source") as parse_schema_source:
+        schema = StaticSchemaLoader(yaml_schema_path).get_schema()
+
+    parse_schema_source.assert_not_called()
+    assert schema["paths"]["/api/{version}/cars/correct"]["get"]
+
+
+def test_validate_response_with_lazy_schema():
+    openapi_client = OpenAPIClient(
+        schema_tester=SchemaTester(schema_file_path=yaml_schema_path)
+    )
+
+    response = openapi_client.get(path="/api/v1/cars/correct")
+    assert response.status_code == status.HTTP_200_OK
+    with pytest.raises(DocumentationError):
+        openapi_client.get(path="/api/v1/cars/incorrect")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from unittest.mock import Mock, patch
+from urllib.parse import urlparse
 
 import pytest
 
@@ -9,7 +10,9 @@ from openapi_tester.loaders import (
     DrfYasgSchemaLoader,
     StaticSchemaLoader,
     UrlStaticSchemaLoader,
+    handle_recursion_limit,
 )
+from openapi_tester.utils import NormalizedSchemaSection
 from tests.utils import TEST_ROOT, get_schema_content
 
 yaml_schema_path = str(TEST_ROOT) + "/schemas/manual_reference_schema.yaml"
@@ -82,3 +85,23 @@ def test_static_loader_resolve_nested_route(loader):
         loader.resolve_path("/api/v1/categories/1/subcategories/1/", "get")[0]
         == "/api/{version}/categories/{category_pk}/subcategories/{subcategory_pk}/"
     )
+
+
+@pytest.mark.parametrize("loader", static_schema_loaders)
+def test_loader_normalizes_schema_sections(loader):
+    schema = loader.get_schema()
+
+    for path_item in schema["paths"].values():
+        for operation in path_item.values():
+            for response in operation["responses"].values():
+                for media_type in response.get("content", {}).values():
+                    assert isinstance(media_type["schema"], NormalizedSchemaSection)
+
+
+def test_handle_recursion_limit_is_deprecated():
+    schema = {"components": {"schemas": {"Node": {"type": "object"}}}}
+
+    with pytest.warns(DeprecationWarning):
+        handler = handle_recursion_limit(schema)
+
+    assert handler(0, urlparse("#/components/schemas/Node"), ()) == {"type": "object"}
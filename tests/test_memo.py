@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rest_framework.response import Response
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import OpenAPITestConfig, ValidationSettings
+from openapi_tester.context import ExchangeState, ValidationContext
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.memo import SubtreeMemo
+from openapi_tester.response_handler_factory import ResponseHandlerFactory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+tester = SchemaTester()
+
+owner_schema = {
+    "type": "object",
+    "required": ["id"],
+    "properties": {"id": {"type": "integer"}, "email": {"type": "string"}},
+}
+schema = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "owner": owner_schema},
+    },
+}
+
+
+def test_repeated_values_are_validated_once():
+    compiled = tester.compiler.compile(schema)
+    owner = {"id": 1, "email": "owner@example.com"}
+    data = [{"id": index, "owner": dict(owner)} for index in range(3)]
+    memo = SubtreeMemo()
+
+    with patch.object(
+        SchemaTester, "test_compiled_object", wraps=tester.test_compiled_object
+    ) as test_compiled_object:
+        tester.test_compiled_schema_section(
+            compiled, data, ValidationContext(exchange=ExchangeState(memo=memo))
+        )
+
+    # three items and one owner
+    assert test_compiled_object.call_count == 4
+    assert memo.get_key(compiled.get_items(), data[0], False) in memo
+    assert (
+        memo.get_key(compiled.get_items().get_property("owner"), owner, False) in memo
+    )
+
+
+def test_invalid_values_are_not_memoized():
+    compiled = tester.compiler.compile(schema)
+    data = [{"id": 1, "owner": {"id": "1"}}, {"id": 2, "owner": {"id": "1"}}]
+    memo = SubtreeMemo()
+
+    with pytest.raises(DocumentationError, match='Expected: an "integer" type value'):
+        tester.test_compiled_schema_section(
+            compiled, data, ValidationContext(exchange=ExchangeState(memo=memo))
+        )
+    assert len(memo) == 0
+    with pytest.raises(DocumentationError, match='Expected: an "integer" type value'):
+        tester.test_compiled_schema_section(
+            compiled, data[1:], ValidationContext(exchange=ExchangeState(memo=memo))
+        )
+
+
+def test_memo_keys():
+    memo = SubtreeMemo()
+    compiled = tester.compiler.compile(owner_schema)
+
+    assert memo.get_key(compiled, {"id": 1}, False) == memo.get_key(
+        compiled, {"id": 1}, False
+    )
+    assert memo.get_key(compiled, {"id": 1}, False) != memo.get_key(
+        compiled, {"id": 1.0}, False
+    )
+    assert memo.get_key(compiled, {"id": {1}}, False) is None
+    assert memo.get_key(compiled, {1: 1}, False) is None
+
+
+def test_memo_size_is_bounded():
+    memo = SubtreeMemo()
+    compiled = tester.compiler.compile(owner_schema)
+
+    with patch.object(SubtreeMemo, "max_size", 1):
+        memo.add(memo.get_key(compiled, {"id": 1}, False))
+        memo.add(memo.get_key(compiled, {"id": 2}, False))
+
+    assert len(memo) == 1
+
+
+@pytest.mark.parametrize(("memoize_subtrees", "call_count"), [(False, 3), (True, 1)])
+def test_responses_are_memoized_when_enabled(
+    pets_api_schema: Path, memoize_subtrees: bool, call_count: int
+):
+    pets_tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    data = [{"id": 1, "name": "Fido"}] * 3
+    response = Response(status=200, data=data)
+    response.request = {"REQUEST_METHOD": "GET", "PATH_INFO": "/api/pets"}  # type: ignore
+    response.renderer_context = {  # type: ignore[attr-defined]
+        "request": MagicMock(
+            path="/api/pets", method="GET", data={}, headers={}, query_params={}
+        )
+    }
+    response.json = lambda: data  # type: ignore
+    test_config = OpenAPITestConfig(
+        validation=ValidationSettings(memoize_subtrees=memoize_subtrees)
+    )
+
+    with patch.object(
+        SchemaTester, "test_compiled_object", wraps=pets_tester.test_compiled_object
+    ) as test_compiled_object:
+        pets_tester.validate_response(
+            ResponseHandlerFactory.create(response=response), test_config
+        )
+
+    assert test_compiled_object.call_count == call_count
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.operations import (
+    Operation,
+    OperationTable,
+    get_json_media_type,
+    get_status_code_key,
+)
+from openapi_tester.resolver import ReferenceResolver
+
+responses_object = {
+    "200": {"description": "ok"},
+    201: {"description": "created"},
+    "4XX": {"description": "client error"},
+    "5xx": {"description": "server error"},
+}
+
+
+@pytest.mark.parametrize(
+    ("status_code", "key"),
+    [(200, "200"), (201, 201), (404, "4XX"), (503, "5xx"), (302, None)],
+)
+def test_get_status_code_key(status_code, key):
+    assert get_status_code_key(responses_object, status_code) == key
+
+
+def test_get_status_code_key_default():
+    assert get_status_code_key({**responses_object, "default": {}}, 302) == "default"
+
+
+def test_get_status_code_falls_back_to_default():
+    schema = {"200": {"description": "ok"}, "default": {"description": "error"}}
+
+    assert SchemaTester.get_status_code(schema, 500) == {"description": "error"}
+    with pytest.raises(UndocumentedSchemaSectionError, match="Undocumented status"):
+        SchemaTester.get_status_code(
+            {"200": {}}, 500, error_addon="Undocumented status code"
+        )
+
+
+@pytest.mark.parametrize(
+    ("content_object", "media_type"),
+    [
+        ({"application/json": {}}, "application/json"),
+        (
+            {"text/plain": {}, "application/vnd.api+json": {}},
+            "application/vnd.api+json",
+        ),
+        ({"text/plain": {}}, None),
+    ],
+)
+def test_get_json_media_type(content_object, media_type):
+    assert get_json_media_type(content_object) == media_type
+
+
+def test_operation():
+    method_object = {
+        "parameters": [
+            {"name": "id", "in": "path", "required": True},
+            {"name": "page", "in": "query", "schema": {"type": "integer"}},
+        ],
+        "requestBody": {
+            "content": {"application/json": {"schema": {"type": "object"}}}
+        },
+        "responses": {
+            "200": {
+                "content": {"application/vnd.api+json": {"schema": {"type": "array"}}}
+            },
+            "204": {"description": "no content"},
+            "default": {"content": {"text/plain": {"schema": {"type": "string"}}}},
+        },
+    }
+
+    operation = Operation(method_object)
+
+    assert operation.query_parameters_schema == {
+        "type": "object",
+        "properties": {"page": {"type": "integer"}},
+    }
+    assert operation.request_body_schema == {"type": "object"}
+    assert operation.get_response_schema(200) == {"type": "array"}
+    assert operation.get_response_schema(204) is None
+    assert operation.get_response_schema(500) is None
+    assert Operation({}).request_body_schema is None
+    assert Operation({}).get_response_schema(200) is None
+
+
+def test_operation_response_schemas():
+    operation = Operation(
+        {
+            "responses": {
+                key: {"content": {"application/json": {"schema": {"title": str(key)}}}}
+                for key in [*responses_object, "default"]
+            }
+        }
+    )
+
+    assert operation.get_response_schema(200) == {"title": "200"}
+    assert operation.get_response_schema(201) == {"title": "201"}
+    assert operation.get_response_schema(404) == {"title": "4XX"}
+    assert operation.get_response_schema(503) == {"title": "5xx"}
+    assert operation.get_response_schema(302) == {"title": "default"}
+
+
+def test_swagger_operation_response_schemas():
+    operation = Operation(
+        {"responses": {"200": {"schema": {"type": "array"}}}}, swagger=True
+    )
+
+    assert operation.get_response_schema(200) == {"type": "array"}
+    assert operation.request_body_schema is None
+
+
+def test_operation_table():
+    method_object = {"responses": {"200": {"description": "ok"}}}
+    paths_object = {"/api/pets": {"get": method_object, "parameters": []}}
+
+    operations = OperationTable(paths_object)
+
+    operation = operations.get("/api/pets", "get")
+    assert operation is not None
+    assert operation.method_object is method_object
+    assert operations.get("/api/pets", "get") is operation
+    assert operations.get("/api/pets", "parameters") is None
+    assert operations.get("/api/pets", "post") is None
+    assert operations.get("/api/undocumented", "get") is None
+
+
+def test_operation_table_builds_lazy_operations_on_first_use():
+    document = {
+        "paths": {
+            "/api/pets": {
+                "get": {"responses": {"200": {"description": "ok"}}},
+                "post": {"responses": {"201": {"description": "created"}}},
+            }
+        }
+    }
+    paths_object = ReferenceResolver(document).resolve_lazily()["paths"]
+
+    operations = OperationTable(paths_object)
+
+    assert paths_object["/api/pets"]._unresolved == {"get", "post"}
+    assert operations.get("/api/pets", "get") is not None
+    assert paths_object["/api/pets"]._unresolved == {"post"}
+
+
+def test_router_operations(
+    pets_api_schema,
+):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    method_object = tester.get_paths_object()["/api/pets"]["get"]
+
+    operation = tester.router.get_operation("/api/pets", "get")
+    assert operation is not None
+    assert operation.method_object is method_object
+    assert tester.router.get_operation("/api/pets", "get") is operation
+    assert tester.router.get_operation("/api/pets", "delete") is None
+    assert tester.router.get_operation("/api/undocumented", "get") is None
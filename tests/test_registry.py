@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.clients import OpenAPIClient
+from openapi_tester.loaders import (
+    BaseSchemaLoader,
+    DrfSpectacularSchemaLoader,
+    StaticSchemaLoader,
+)
+from openapi_tester.registry import SchemaRegistry, schema_registry
+from tests.utils import TEST_ROOT
+
+yaml_schema_path = str(TEST_ROOT) + "/schemas/manual_reference_schema.yaml"
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    schema_registry.clear()
+    yield
+    schema_registry.clear()
+
+
+def test_registry_returns_registered_schema():
+    registry = SchemaRegistry()
+    schema = {"openapi": "3.0.0"}
+
+    assert registry.get("key") is None
+    registry.register("key", schema)
+
+    assert registry.get("key") is schema
+    assert "key" in registry
+    assert len(registry) == 1
+
+
+def test_static_loaders_share_prepared_schema():
+    first = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "en"})
+    second = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "en"})
+
+    assert first.get_schema() is second.get_schema()
+    assert len(schema_registry) == 1
+
+
+def test_static_loaders_with_different_field_key_map_are_not_shared():
+    first = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "en"})
+    second = StaticSchemaLoader(yaml_schema_path, field_key_map={"language": "de"})
+
+    assert first.get_registry_key() != second.get_registry_key()
+
+
+def test_static_loader_registry_key_changes_with_mtime(tmp_path):
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_bytes(open(yaml_schema_path, "rb").read())
+    loader = StaticSchemaLoader(str(schema_file))
+    key = loader.get_registry_key()
+
+    stat = os.stat(schema_file)
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert loader.get_registry_key() != key
+
+
+def test_static_loader_missing_file_is_not_registered():
+    assert StaticSchemaLoader("missing.yaml").get_registry_key() is None
+
+
+def test_loader_without_source_key_is_not_registered():
+    class CustomLoader(BaseSchemaLoader):
+        def load_schema(self) -> dict:
+            return {}
+
+    assert CustomLoader().get_registry_key() is None
+
+
+def test_generated_schema_loaders_share_prepared_schema():
+    first = DrfSpectacularSchemaLoader()
+    second = DrfSpectacularSchemaLoader()
+
+    assert first.get_schema() is second.get_schema()
+
+
+def test_openapi_clients_share_prepared_schema():
+    first = OpenAPIClient()
+    second = OpenAPIClient(schema_tester=SchemaTester())
+
+    assert (
+        first.schema_tester.loader.get_schema()
+        is second.schema_tester.loader.get_schema()
+    )
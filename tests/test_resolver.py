@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from openapi_tester import SchemaTester
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.loaders import StaticSchemaLoader
+from openapi_tester.registry import schema_registry
+from openapi_tester.resolver import (
+    ReferenceResolutionError,
+    ReferenceResolver,
+    get_document_uri,
+)
+from openapi_tester.utils import (
+    RECURSIVE_REFERENCE_PLACEHOLDER,
+    normalize_schema_section,
+    serialize_schema_section_data,
+)
+
+tree_schema = {
+    "openapi": "3.0.0",
+    "info": {"title": "Trees", "version": "1.0.0"},
+    "paths": {},
+    "components": {
+        "schemas": {
+            "Node": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Node"},
+                    },
+                },
+            },
+            "Forest": {
+                "type": "object",
+                "properties": {
+                    "oak": {"$ref": "#/components/schemas/Node"},
+                    "pine": {"$ref": "#/components/schemas/Node"},
+                },
+            },
+        }
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    schema_registry.clear()
+    yield
+    schema_registry.clear()
+
+
+def test_references_share_one_node():
+    resolved = ReferenceResolver(tree_schema).resolve()
+    schemas = resolved["components"]["schemas"]
+
+    assert schemas["Forest"]["properties"]["oak"] is schemas["Node"]
+    assert schemas["Forest"]["properties"]["pine"] is schemas["Node"]
+
+
+def test_recursive_references_become_cycles():
+    resolved = ReferenceResolver(tree_schema).resolve()
+    node = resolved["components"]["schemas"]["Node"]
+
+    assert node["properties"]["children"]["items"] is node
+    assert "$ref" in tree_schema["components"]["schemas"]["Forest"]["properties"]["oak"]
+
+
+def test_unresolvable_reference():
+    schema = {"paths": {}, "definitions": {"Pet": {"$ref": "#/definitions/Missing"}}}
+
+    with pytest.raises(ReferenceResolutionError, match="`Missing` not found"):
+        ReferenceResolver(schema).resolve()
+
+
+def test_reference_loop():
+    schema = {
+        "definitions": {
+            "Cat": {"$ref": "#/definitions/Dog"},
+            "Dog": {"$ref": "#/definitions/Cat"},
+        }
+    }
+
+    with pytest.raises(ReferenceResolutionError, match="only refers to itself"):
+        ReferenceResolver(schema).resolve()
+
+
+def test_references_to_other_files(tmp_path):
+    (tmp_path / "pet.yaml").write_text(
+        yaml.dump(
+            {"Pet": {"type": "object", "properties": {"name": {"type": "string"}}}}
+        )
+    )
+    schema = {
+        "a": {"$ref": "pet.yaml#/Pet"},
+        "b": {"$ref": "./pet.yaml#/Pet/properties/name"},
+    }
+
+    resolved = ReferenceResolver(
+        schema, base_uri=get_document_uri(str(tmp_path / "schema.yaml"))
+    ).resolve()
+
+    assert resolved["a"]["type"] == "object"
+    assert resolved["b"] is resolved["a"]["properties"]["name"]
+
+
+def test_recursive_schema_sections_can_be_normalized_and_serialized():
+    node = ReferenceResolver(tree_schema).resolve()["components"]["schemas"]["Node"]
+
+    normalized = normalize_schema_section(node)
+
+    assert normalized["properties"]["children"]["items"] is normalized
+    assert RECURSIVE_REFERENCE_PLACEHOLDER in serialize_schema_section_data(node)
+
+
+def test_validate_recursive_schema(tmp_path):
+    schema = {
+        **tree_schema,
+        "paths": {
+            "/api/v1/trees": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "A tree",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Node"}
+                                }
+                            },
+                        }
+                    }
+                }
+            }
+        },
+    }
+    schema_file = tmp_path / "trees.yaml"
+    schema_file.write_text(yaml.dump(schema))
+    tester = SchemaTester(schema_file_path=str(schema_file))
+    node = tester.loader.get_schema()["components"]["schemas"]["Node"]
+    tree = {"name": "root", "children": [{"name": "a", "children": [{"name": "b"}]}]}
+
+    tester.test_schema_section(node, tree)
+    with pytest.raises(DocumentationError):
+        tester.test_schema_section(
+            node, {"name": "root", "children": [{"children": [{"name": 1}]}]}
+        )
+
+
+def test_static_loader_resolves_relative_files(tmp_path):
+    (tmp_path / "components.yaml").write_text(
+        yaml.dump(
+            {"Pet": {"type": "object", "properties": {"id": {"type": "integer"}}}}
+        )
+    )
+    schema_file = tmp_path / "schema.yaml"
+    schema_file.write_text(
+        yaml.dump(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Pets", "version": "1.0.0"},
+                "paths": {
+                    "/api/v1/pets": {
+                        "get": {
+                            "responses": {
+                                "200": {
+                                    "description": "A pet",
+                                    "content": {
+                                        "application/json": {
+                                            "schema": {"$ref": "components.yaml#/Pet"}
+                                        }
+                                    },
+                                }
+                            }
+                        }
+                    }
+                },
+            }
+        )
+    )
+
+    schema = StaticSchemaLoader(str(schema_file)).get_schema()
+
+    response_schema = schema["paths"]["/api/v1/pets"]["get"]["responses"]["200"]
+    assert response_schema["content"]["application/json"]["schema"]["type"] == "object"
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import json
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
 
 from openapi_tester.response_handler import (
     DjangoNinjaResponseHandler,
     DRFResponseHandler,
     ResponseHandler,
 )
+from test_project.api.views.animals import Animals
+from test_project.api.views.cars import GoodCars
 
 
 @pytest.mark.parametrize(
@@ -121,3 +129,120 @@ def test_django_ninja_handler_data_returns_none_when_content_is_empty():
     )
 
     assert handler.data is None
+
+
+def test_drf_response_handler_data_is_decoded_once():
+    handler = _drf_response_handler(
+        response_data={"id": 1, "name": "doggie"},
+        parsed_json={"id": 1, "name": "doggie"},
+    )
+
+    assert handler.data is handler.data
+    assert handler.request is handler.request
+    handler.response.json.assert_called_once_with()
+
+
+def test_drf_response_handler_decodes_rendered_json_bodies():
+    response = HttpResponse(
+        b'{"id": 1, "name": "doggie"}', content_type="application/json"
+    )
+    response.data = {"id": 1, "name": "doggie"}
+    response.renderer_context = {
+        "request": MagicMock(
+            path="/api/pets", method="GET", data={}, headers={}, query_params={}
+        )
+    }
+    response.json = MagicMock()
+    handler = DRFResponseHandler(response=response)
+
+    assert handler.data == {"id": 1, "name": "doggie"}
+    response.json.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "content", [b'{"points": 18446744073709551616}', b'{"points": NaN}']
+)
+def test_django_ninja_handler_leaves_bodies_orjson_cannot_decode_to_json(
+    content: bytes,
+):
+    response = MagicMock()
+    response.content = content
+    response.json.return_value = {"points": 0}
+    handler = DjangoNinjaResponseHandler("GET", "/api/pets", None, response=response)
+
+    assert handler.data == {"points": 0}
+    assert handler.data is handler.data
+    response.json.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    ("view", "path"),
+    [(GoodCars, "/api/v1/cars/correct"), (Animals, "/api/v1/animals")],
+)
+def test_drf_response_handler_native_data(view, path: str):
+    response = view.as_view()(APIRequestFactory().get(path), version="v1")
+    handler = DRFResponseHandler(response=response)
+
+    native_data = handler.native_data
+
+    assert not response.is_rendered
+    assert native_data == json.loads(response.render().content)
+
+
+def _unrendered_drf_response_handler(response_data: Any) -> DRFResponseHandler:
+    response = Response(response_data)
+    response.accepted_renderer = JSONRenderer()
+    response.accepted_media_type = "application/json"
+    response.renderer_context = {  # type: ignore[attr-defined]
+        "request": MagicMock(
+            path="/api/pets", method="GET", data={}, headers={}, query_params={}
+        )
+    }
+    return DRFResponseHandler(response=response)
+
+
+def test_drf_response_handler_native_data_of_big_integers():
+    handler = _unrendered_drf_response_handler({"points": 2**70, "nested": [[[]]]})
+
+    assert handler.native_data == {"points": 2**70, "nested": [[[]]]}
+
+
+def test_drf_response_handler_native_data_is_rendered_data():
+    handler = _unrendered_drf_response_handler({1: "a", "b": (True, None)})
+
+    assert handler.native_data == {"1": "a", "b": [True, None]}
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_drf_response_handler_native_data_rejects_non_finite_floats(value: float):
+    handler = _unrendered_drf_response_handler({"weight": value})
+
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        handler.native_data  # noqa: B018
+    assert isinstance(handler.response, Response)
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        handler.response.render()
+
+
+def test_drf_response_handler_native_data_rejects_non_string_keys():
+    handler = _unrendered_drf_response_handler({(1, 2): "a"})
+
+    with pytest.raises(TypeError):
+        handler.native_data  # noqa: B018
+    with pytest.raises(TypeError):
+        handler.response.render()
+
+
+def test_drf_response_handler_native_data_of_rendered_responses(client):
+    handler = DRFResponseHandler(response=client.get("/api/v1/animals"))
+
+    assert handler.native_data is handler.data
+
+
+def test_drf_response_handler_native_data_without_json_renderer():
+    handler = _drf_response_handler(
+        response_data={"id": 1, "name": "doggie"},
+        parsed_json={"id": 1, "name": "doggie"},
+    )
+
+    assert handler.native_data is handler.data
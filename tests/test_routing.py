@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.exceptions import UndocumentedSchemaSectionError
+from openapi_tester.loaders import StaticSchemaLoader
+from openapi_tester.routing import RouteIndex
+from openapi_tester.schema_tester import OpenAPITestConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from openapi_tester.response_handler import GenericRequest
+
+route_index = RouteIndex(
+    [
+        "/api/pets",
+        "/api/pets/mine",
+        "/api/pets/{id}",
+        "/api/pets/{id}/toys/{toy_id}/",
+        "/api/files/{name}.json",
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "template"),
+    [
+        ("/api/pets", "/api/pets"),
+        ("/api/pets/mine", "/api/pets/mine"),
+        ("/api/pets/1", "/api/pets/{id}"),
+        ("/api/pets/1/toys/ball/", "/api/pets/{id}/toys/{toy_id}/"),
+        ("/api/files/report.json", "/api/files/{name}.json"),
+        ("/api/files/report.yaml", None),
+        ("/api/pets/", None),
+        ("/api/pets/1/toys", None),
+        ("/api/owners", None),
+    ],
+)
+def test_route_index_match(path, template):
+    assert route_index.match(path) == template
+
+
+def test_route_index_backtracks_from_literal_segments():
+    index = RouteIndex(["/api/pets/mine", "/api/pets/{id}/toys"])
+
+    assert index.match("/api/pets/mine/toys") == "/api/pets/{id}/toys"
+
+
+def test_documented_path_does_not_resolve_through_django(cars_api_schema: Path):
+    schema_tester = SchemaTester(schema_file_path=str(cars_api_schema))
+    schema_tester.loader.get_schema()
+
+    with patch.object(StaticSchemaLoader, "resolve_path") as resolve_path:
+        assert (
+            schema_tester.router.get_documented_path("/api/v1/cars/correct", "get")
+            == "/api/{version}/cars/correct"
+        )
+        assert (
+            schema_tester.router.get_documented_path("/api/v1/cars/correct/", "get")
+            == "/api/{version}/cars/correct"
+        )
+
+    resolve_path.assert_not_called()
+
+
+def test_documented_path_with_path_prefix(pets_api_schema_prefix_in_server: Path):
+    schema_tester = SchemaTester(
+        schema_file_path=str(pets_api_schema_prefix_in_server), path_prefix="/api"
+    )
+
+    assert (
+        schema_tester.router.get_documented_path("/api/pets/1", "get")
+        == "/api/pets/{id}"
+    )
+    assert schema_tester.get_paths_object() is schema_tester.get_paths_object()
+
+
+def test_undocumented_path_falls_back_to_resolve_path(cars_api_schema: Path):
+    schema_tester = SchemaTester(schema_file_path=str(cars_api_schema))
+
+    with pytest.raises(ValueError, match="Could not resolve path `/api/v1/unknown`"):
+        schema_tester.router.get_documented_path("/api/v1/unknown", "get")
+
+
+def test_undocumented_route(
+    pets_api_schema_prefix_in_server: Path, pets_post_request: GenericRequest
+):
+    schema_tester = SchemaTester(schema_file_path=str(pets_api_schema_prefix_in_server))
+
+    with pytest.raises(
+        UndocumentedSchemaSectionError, match="Undocumented route /api/pets"
+    ):
+        schema_tester.retrieve_documented_request(
+            pets_post_request, OpenAPITestConfig()
+        )
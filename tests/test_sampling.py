@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import (
+    OpenAPITestConfig,
+    SamplingPolicy,
+    SamplingSettings,
+    ValidationSettings,
+)
+from openapi_tester.context import ExchangeState, ValidationContext
+from openapi_tester.exceptions import DocumentationError, SamplingWarning
+from openapi_tester.sampling import Sampler, SamplingRecord, SamplingReport
+
+pytestmark = pytest.mark.filterwarnings(
+    "ignore::openapi_tester.exceptions.SamplingWarning"
+)
+
+tester = SchemaTester()
+settings = SamplingSettings(endpoints=["GET /api/reports/*"], first=2, last=2, random=3)
+
+
+def get_context(report: SamplingReport) -> ValidationContext:
+    return ValidationContext(
+        exchange=ExchangeState(sampler=Sampler(settings, "GET /api/reports/1", report))
+    )
+
+
+def test_sample():
+    report = SamplingReport()
+    sampler = Sampler(settings, "GET /api/reports/1", report)
+    items = list(range(100))
+
+    with pytest.warns(SamplingWarning, match="93 of 100 items were skipped"):
+        sample = sampler.sample(items)
+
+    assert sample[:2] == [0, 1]
+    assert sample[-2:] == [98, 99]
+    assert len(sample) == 7
+    assert sample == sorted(sample)
+    assert sampler.sample(items) == sample
+    assert Sampler(settings, "", report).sample(items, record=False) == sample
+    assert report.endpoints == {
+        "GET /api/reports/1": SamplingRecord(sections=2, items=200, skipped=186)
+    }
+    assert report.skipped == 186
+    assert str(report) == (
+        "GET /api/reports/1: skipped 186 of 200 items in 2 sampled arrays and maps"
+    )
+
+
+def test_small_arrays_are_not_sampled():
+    report = SamplingReport()
+    items = list(range(7))
+
+    assert Sampler(settings, "GET /api/reports/1", report).sample(items) is items
+    assert report.endpoints == {}
+
+
+def test_sampled_array_validation():
+    schema = {"type": "array", "items": {"type": "object", "properties": {}}}
+    compiled = tester.compiler.compile(schema)
+    data = [{} for _ in range(100)]
+    data[50] = {"name": "undocumented"}
+
+    tester.test_compiled_schema_section(compiled, data, get_context(SamplingReport()))
+    with pytest.raises(DocumentationError):
+        tester.test_compiled_schema_section(compiled, data, ValidationContext())
+    data[99] = {"name": "undocumented"}
+    with pytest.raises(DocumentationError):
+        tester.test_compiled_schema_section(
+            compiled, data, get_context(SamplingReport())
+        )
+
+
+def test_sampled_additional_properties_validation():
+    schema = {"type": "object", "additionalProperties": {"type": "integer"}}
+    compiled = tester.compiler.compile(schema)
+    data = {f"key{index}": index for index in range(100)}
+    data["key50"] = "fifty"
+    report = SamplingReport()
+
+    tester.test_compiled_schema_section(compiled, data, get_context(report))
+
+    assert report.skipped == 93
+    with pytest.raises(DocumentationError):
+        tester.test_compiled_schema_section(compiled, data, ValidationContext())
+
+
+def test_get_sampler():
+    test_config = OpenAPITestConfig(validation=ValidationSettings(sampling=settings))
+
+    assert tester.get_sampler("GET /api/reports/1", test_config) is not None
+    assert tester.get_sampler("GET /api/pets", test_config) is None
+    assert tester.get_sampler("GET /api/reports/1", OpenAPITestConfig()) is None
+
+
+def test_get_sampler_policies():
+    exports_policy = SamplingPolicy(first=1, last=1, random=10, seed=1)
+    sampling = SamplingSettings(
+        endpoints=["GET /api/reports/*"],
+        policies={
+            "GET /api/exports/*": exports_policy,
+            "/api/reports/big": SamplingPolicy(),
+        },
+    )
+    test_config = OpenAPITestConfig(validation=ValidationSettings(sampling=sampling))
+
+    exports_sampler = tester.get_sampler("GET /api/exports/1", test_config)
+    big_reports_sampler = tester.get_sampler("GET /api/reports/big", test_config)
+    reports_sampler = tester.get_sampler("GET /api/reports/1", test_config)
+    assert exports_sampler is not None and exports_sampler.settings is exports_policy
+    assert big_reports_sampler is not None
+    assert big_reports_sampler.settings == SamplingPolicy()
+    assert reports_sampler is not None and reports_sampler.settings is sampling
+    assert tester.get_sampler("GET /api/pets", test_config) is None
+
+
+def test_sampling_warning_is_emitted_once_per_endpoint(recwarn):
+    report = SamplingReport()
+    items = list(range(100))
+
+    for endpoint in ("GET /api/reports/1", "GET /api/reports/1", "GET /api/reports/2"):
+        Sampler(settings, endpoint, report).sample(items)
+
+    assert [str(warning.message).split(":")[0] for warning in recwarn.list] == [
+        "Only a sample of the data of `GET /api/reports/1` is validated",
+        "Only a sample of the data of `GET /api/reports/2` is validated",
+    ]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from openapi_tester.config import settings
+from openapi_tester.loaders import DrfSpectacularSchemaLoader, StaticSchemaLoader
+from openapi_tester.registry import schema_registry
+from openapi_tester.schema_cache import SchemaCache
+from tests.utils import TEST_ROOT
+
+yaml_schema_path = TEST_ROOT / "schemas" / "manual_reference_schema.yaml"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.schema, "cache_dir", str(tmp_path / "cache"))
+    schema_registry.clear()
+    yield tmp_path / "cache"
+    schema_registry.clear()
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "schema.yaml"
+    shutil.copy(yaml_schema_path, path)
+    return path
+
+
+def test_schema_cache_round_trip(tmp_path):
+    schema_cache = SchemaCache(str(tmp_path))
+    key = schema_cache.get_key(b"openapi: 3.0.0", ["context"])
+
+    assert schema_cache.load(key) is None
+    schema_cache.store(key, {"openapi": "3.0.0"})
+    assert schema_cache.load(key) == {"openapi": "3.0.0"}
+
+
+def test_schema_cache_key_depends_on_source_context_and_version():
+    key = SchemaCache.get_key(b"openapi: 3.0.0", ["context"])
+
+    assert SchemaCache.get_key(b"openapi: 3.1.0", ["context"]) != key
+    assert SchemaCache.get_key(b"openapi: 3.0.0", ["other"]) != key
+    with patch("openapi_tester.schema_cache.get_library_version", return_value="0"):
+        assert SchemaCache.get_key(b"openapi: 3.0.0", ["context"]) != key
+
+
+def test_schema_cache_ignores_corrupt_artifacts(tmp_path):
+    schema_cache = SchemaCache(str(tmp_path))
+    (tmp_path / f"key{SchemaCache.suffix}").write_bytes(b"not a pickle")
+
+    assert schema_cache.load("key") is None
+
+
+def test_warm_start_skips_preparation(cache_dir, schema_path):
+    cold_schema = StaticSchemaLoader(str(schema_path)).get_schema()
+    assert len(list(cache_dir.iterdir())) == 1
+
+    schema_registry.clear()
+    with patch.object(StaticSchemaLoader, "prepare_schema") as prepare_schema:
+        warm_schema = StaticSchemaLoader(str(schema_path)).get_schema()
+
+    prepare_schema.assert_not_called()
+    assert warm_schema == cold_schema
+
+
+def test_changed_schema_invalidates_cache(cache_dir, schema_path):
+    StaticSchemaLoader(str(schema_path)).get_schema()
+
+    schema_registry.clear()
+    schema_path.write_text(
+        schema_path.read_text().replace("title:", "description: changed\n  title:", 1)
+    )
+    with patch.object(
+        StaticSchemaLoader,
+        "prepare_schema",
+        autospec=True,
+        side_effect=StaticSchemaLoader.prepare_schema,
+    ) as prepare_schema:
+        StaticSchemaLoader(str(schema_path)).get_schema()
+
+    prepare_schema.assert_called_once()
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_generated_schema_is_cached(cache_dir):
+    schema = DrfSpectacularSchemaLoader().get_schema()
+
+    schema_registry.clear()
+    with patch.object(DrfSpectacularSchemaLoader, "prepare_schema") as prepare_schema:
+        assert DrfSpectacularSchemaLoader().get_schema() == schema
+
+    prepare_schema.assert_not_called()
+
+
+def test_cache_is_disabled_by_default(schema_path):
+    schema_registry.clear()
+    with patch.object(SchemaCache, "store") as store:
+        StaticSchemaLoader(str(schema_path)).get_schema()
+
+    store.assert_not_called()
+
+
+def test_schemas_referencing_other_documents_are_not_cached(cache_dir, tmp_path):
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(
+        "openapi: 3.0.0\n"
+        "info: {title: Pets, version: 1.0.0}\n"
+        "paths: {}\n"
+        "components:\n"
+        "  schemas:\n"
+        "    Pet: {$ref: 'pet.yaml#/Pet'}\n"
+    )
+    (tmp_path / "pet.yaml").write_text("Pet: {type: string}\n")
+    StaticSchemaLoader(str(schema_path)).get_schema()
+
+    (tmp_path / "pet.yaml").write_text("Pet: {type: integer}\n")
+    schema = StaticSchemaLoader(str(schema_path)).get_schema()
+
+    assert schema["components"]["schemas"]["Pet"] == {"type": "integer"}
+    assert not cache_dir.exists()
+    assert not len(schema_registry)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import glob
 import os
+import sys
 from copy import deepcopy
 from typing import TYPE_CHECKING
 from unittest.mock import patch
@@ -9,6 +10,7 @@ from uuid import UUID, uuid1, uuid4
 
 import pytest
 from django.core.exceptions import ImproperlyConfigured
+from rest_framework.test import APIRequestFactory
 
 from openapi_tester import (
     DrfSpectacularSchemaLoader,
@@ -21,13 +23,16 @@ from openapi_tester.config import ValidationSettings
 from openapi_tester.constants import (
     INIT_ERROR,
     OPENAPI_PYTHON_MAPPING,
+    VALIDATE_ANY_OF_ERROR,
     VALIDATE_EXCESS_KEY_ERROR,
     VALIDATE_MISSING_KEY_ERROR,
     VALIDATE_NONE_ERROR,
     VALIDATE_ONE_OF_ERROR,
     VALIDATE_WRITE_ONLY_RESPONSE_KEY_ERROR,
 )
+from openapi_tester.context import ValidationContext
 from openapi_tester.exceptions import (
+    AnyOfLimitWarning,
     CaseError,
     DocumentationError,
     UndocumentedSchemaSectionError,
@@ -36,6 +41,7 @@ from openapi_tester.loaders import UrlStaticSchemaLoader
 from openapi_tester.response_handler import GenericRequest
 from openapi_tester.response_handler_factory import ResponseHandlerFactory
 from openapi_tester.schema_tester import OpenAPITestConfig
+from test_project.api.views.cars import GoodCars
 from test_project.models import Names
 from tests import example_object, example_schema_types
 from tests.utils import TEST_ROOT, iterate_schema, mock_schema
@@ -129,6 +135,8 @@ docs_any_of_example = {
 # Excluded schemas files for test_example_schemas as they include expected validation errors.
 EXCLUDED_SCHEMA_FILES = [
     "openapi_v3_reference_schema.yaml",
+    # its oneOf options overlap, only its discriminator tells them apart
+    "discriminator_schema.yaml",
 ]
 
 
@@ -288,6 +296,21 @@ def test_validate_response_failure_scenario_undocumented_content(client, monkeyp
         tester.validate_response(ResponseHandlerFactory.create(response=response))
 
 
+def test_validate_response_from_native_data():
+    response = GoodCars.as_view()(
+        APIRequestFactory().get(de_parameterized_path), version="v1"
+    )
+    test_config = OpenAPITestConfig(
+        validation=ValidationSettings(native_response_data=True)
+    )
+
+    tester.validate_response(
+        ResponseHandlerFactory.create(response=response), test_config
+    )
+
+    assert not response.is_rendered
+
+
 def test_validate_request(
     response_factory, pets_api_schema: Path, pets_post_request: dict[str, Any]
 ):
@@ -626,6 +649,108 @@ def test_any_of_validation():
         )
 
 
+def test_any_of_union_validation():
+    any_of = {
+        "anyOf": [
+            {
+                "type": "object",
+                "required": [f"key_{index}"],
+                "properties": {f"key_{index}": {"type": "integer"}},
+            }
+            for index in range(12)
+        ]
+    }
+    tester.test_schema_section(any_of, {f"key_{index}": index for index in range(12)})
+
+    with (
+        patch.object(
+            SchemaTester,
+            "probe_compiled_schema_section",
+            autospec=True,
+            side_effect=SchemaTester.probe_compiled_schema_section,
+        ) as probe,
+        pytest.raises(DocumentationError),
+    ):
+        tester.test_schema_section(
+            any_of, {**{f"key_{index}": index for index in range(11)}, "key_11": "11"}
+        )
+
+    # no single option documents every property, so each property is probed against the options documenting it
+    assert probe.call_count == 12
+
+
+def test_any_of_union_applies_object_keywords_of_options():
+    any_of = {
+        "anyOf": [
+            {"type": "object", "properties": {"a": {"type": "integer"}}},
+            {"type": "object", "properties": {"b": {"type": "integer"}}},
+        ]
+    }
+    tester.test_schema_section(any_of, {"a": 1, "b": 2})
+
+    any_of["anyOf"][0]["maxProperties"] = 1
+    with pytest.raises(DocumentationError, match=VALIDATE_ANY_OF_ERROR):
+        tester.test_schema_section(any_of, {"a": 1, "b": 2})
+
+
+def test_any_of_union_ignores_undocumented_required_keys():
+    any_of = {
+        "anyOf": [
+            {
+                "type": "object",
+                "properties": {"a": {"type": "integer"}},
+                "required": ["a", "zz"],
+            },
+            {
+                "type": "object",
+                "properties": {"b": {"type": "integer"}},
+                "required": ["b"],
+            },
+        ]
+    }
+
+    tester.test_schema_section(any_of, {"a": 1, "b": 2})
+
+
+def test_any_of_options_limit():
+    any_of = {
+        "anyOf": [
+            {
+                "type": "object",
+                "required": [f"key_{index}"],
+                "properties": {f"key_{index}": {"type": "integer"}},
+            }
+            for index in range(3)
+        ]
+    }
+
+    test_config = OpenAPITestConfig(validation=ValidationSettings(max_any_of_options=2))
+
+    # options past the limit are still validated on their own
+    tester.test_schema_section(any_of, {"key_2": 2}, test_config)
+    with pytest.warns(AnyOfLimitWarning, match="has 3 options"):
+        tester.test_schema_section(any_of, {"key_0": 0, "key_1": 1}, test_config)
+    with (
+        pytest.warns(AnyOfLimitWarning, match="has 3 options"),
+        pytest.raises(DocumentationError, match=VALIDATE_ANY_OF_ERROR),
+    ):
+        tester.test_schema_section(any_of, {"key_0": 0, "key_2": 2}, test_config)
+    # the limit only applies to the tests configured with it
+    tester.test_schema_section(any_of, {"key_0": 0, "key_2": 2})
+
+
+def test_handle_any_of():
+    tester.handle_any_of(docs_any_of_example, {"age": 50}, "root", OpenAPITestConfig())
+
+    with pytest.raises(DocumentationError, match="Reference: GET /pets > pet.anyOf"):
+        tester.handle_any_of(
+            docs_any_of_example,
+            {"hunts": False},
+            "GET /pets > pet",
+            OpenAPITestConfig(),
+        )
+
+
 def test_one_of_validation():
     all_types = [
         {"type": "string"},
@@ -732,6 +857,14 @@ def test_one_of_validation():
         )
 
 
+def test_handle_one_of():
+    one_of = {"oneOf": [{"type": "integer"}, {"type": "string"}]}
+    tester.handle_one_of(one_of, 1, "root", OpenAPITestConfig())
+
+    with pytest.raises(DocumentationError, match="Reference: GET /pets > id.oneOf"):
+        tester.handle_one_of(one_of, None, "GET /pets > id", OpenAPITestConfig())
+
+
 def test_missing_keys_validation():
     # If a required key is missing, we should raise an error
     required_key = {
@@ -763,6 +896,62 @@ def test_excess_keys_validation():
         tester.test_schema_section(schema, example_object)
 
 
+def test_deeply_nested_data_validation():
+    node = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    node["properties"]["child"] = node
+    leaf = {"value": 0}
+    data = leaf
+    for value in range(sys.getrecursionlimit() * 5):
+        data = {"value": value, "child": data}
+
+    tester.test_schema_section(node, data)
+
+    leaf["value"] = "0"
+    with pytest.raises(DocumentationError) as error:
+        tester.test_schema_section(node, data)
+
+    assert f"root{' > child' * sys.getrecursionlimit() * 5} > value\n" in str(
+        error.value
+    )
+
+
+def test_object_keys_are_tested_once_per_shape():
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}, "name": {"type": "string"}},
+        },
+    }
+    compiled = tester.compiler.compile(schema)
+    data = [{"id": 1, "name": "a"}, {"name": "b", "id": 2}, {"id": 3}]
+
+    with patch.object(
+        SchemaTester,
+        "test_compiled_object_keys",
+        wraps=tester.test_compiled_object_keys,
+    ) as test_compiled_object_keys:
+        tester.test_compiled_schema_section(compiled, data, ValidationContext())
+        tester.test_compiled_schema_section(compiled, data, ValidationContext())
+        with pytest.raises(CaseError):
+            tester.test_compiled_schema_section(
+                compiled, data, ValidationContext(case_tester=is_pascal_case)
+            )
+        with pytest.raises(DocumentationError, match="The following property was"):
+            tester.test_compiled_schema_section(
+                compiled, [{"name": "c"}], ValidationContext()
+            )
+        with pytest.raises(DocumentationError, match="The following property was"):
+            tester.test_compiled_schema_section(
+                compiled, [{"name": "c"}], ValidationContext()
+            )
+
+    # two shapes, then the first one with a case tester, then the failing shape twice
+    assert test_compiled_object_keys.call_count == 5
+    assert len(compiled.get_items().cache.validated_shapes) == 2
+
+
 def test_custom_validators():
     def uuid_4_validator(schema_section: dict, data: Any) -> str | None:
         schema_format = schema_section.get("format")
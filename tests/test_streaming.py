@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, cast
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+
+from openapi_tester import SchemaTester
+from openapi_tester.config import OpenAPITestConfig, ValidationSettings
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.response_handler import DjangoNinjaResponseHandler
+from openapi_tester.streaming import iter_chunks, iter_json_array
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BODY = json.dumps(
+    [
+        {"id": 1, "name": "Fido", "tags": ["a", "ü"], "weight": 2.5e-3},
+        [],
+        {},
+        'text with \\"escapes\\" and , ] delimiters',
+        123456789012345678901234567890,
+        -0.5,
+        True,
+        None,
+    ],
+    indent=2,
+    ensure_ascii=False,
+).encode()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_iter_json_array(size: int):
+    items = iter_json_array(iter_chunks(BODY, size))
+
+    assert items is not None
+    assert list(items) == json.loads(BODY)
+
+
+@pytest.mark.parametrize("body", [b"[]", b" [ ] ", b"[1]", b'[{"a": [1, 2]}, 2]'])
+def test_iter_json_array_of_small_bodies(body: bytes):
+    assert list(iter_json_array(iter_chunks(body, 1))) == json.loads(body)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("body", [b"", b"  ", b'{"a": 1}', b"1", b'"[1]"'])
+def test_iter_json_array_of_other_bodies(body: bytes):
+    assert iter_json_array(iter_chunks(body, 1)) is None
+
+
+@pytest.mark.parametrize(
+    "body", [b"[1 2]", b"[1,]", b"[1", b"[1] 2", b'[{"a": }]', b"[2.]"]
+)
+def test_iter_json_array_of_malformed_bodies(body: bytes):
+    items = iter_json_array(iter_chunks(body, 1))
+
+    assert items is not None
+    with pytest.raises(json.JSONDecodeError):
+        list(items)
+
+
+def test_iter_json_array_reads_chunks_on_demand():
+    def chunks():
+        yield b'[{"id": 1}, '
+        yield b'{"id": 2}, '
+        raise AssertionError("read past the requested item")
+
+    items = iter_json_array(chunks())
+
+    assert next(items) == {"id": 1}
+
+
+def get_response_handler(response: HttpResponse | StreamingHttpResponse):
+    # like the responses of Django Ninja's test client
+    response.json = lambda: json.loads(response.content)  # type: ignore[union-attr]
+    # streamed bodies are only read through iter_content, which supports them
+    return DjangoNinjaResponseHandler(
+        "GET", "/api/pets", None, response=cast(HttpResponse, response)
+    )
+
+
+def get_test_config() -> OpenAPITestConfig:
+    return OpenAPITestConfig(validation=ValidationSettings(stream_min_size=0))
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_streamed_responses_are_validated_without_decoding_them(
+    pets_api_schema: Path, streaming: bool
+):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    body = json.dumps([{"id": 1, "name": "Fido"}, {"id": 2, "name": None}])
+    response = (
+        StreamingHttpResponse(iter([body[:20], body[20:]]))
+        if streaming
+        else HttpResponse(body)
+    )
+
+    with patch.object(
+        DjangoNinjaResponseHandler,
+        "data",
+        new_callable=PropertyMock,
+        side_effect=AssertionError,
+    ) as data:
+        tester.validate_response(get_response_handler(response), get_test_config())
+
+    data.assert_not_called()
+
+
+def test_streamed_responses_fail_as_decoded_responses(pets_api_schema: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    body = json.dumps([{"id": 1, "name": "Fido"}, {"id": "2", "name": "Rex"}])
+
+    with pytest.raises(DocumentationError) as decoded:
+        tester.validate_response(
+            get_response_handler(HttpResponse(body)), OpenAPITestConfig()
+        )
+    with pytest.raises(DocumentationError) as streamed:
+        tester.validate_response(
+            get_response_handler(HttpResponse(body)), get_test_config()
+        )
+
+    assert str(streamed.value) == str(decoded.value)
+
+
+def test_streamed_responses_stop_at_the_first_invalid_item(pets_api_schema: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+
+    def chunks():
+        yield b'[{"id": "1", "name": "Fido"}, '
+        raise AssertionError("read past the invalid item")
+
+    with pytest.raises(DocumentationError):
+        tester.validate_response(
+            get_response_handler(StreamingHttpResponse(chunks())), get_test_config()
+        )
+
+
+def test_streamed_responses_can_be_read_after_validation(pets_api_schema: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    body = json.dumps([{"id": 1, "name": "Fido"}, {"id": 2, "name": "Rex"}])
+    response = StreamingHttpResponse(iter([body[:20], body[20:]]))
+
+    tester.validate_response(get_response_handler(response), get_test_config())
+
+    assert response.getvalue() == body.encode()
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2]"])
+def test_read_chunks_are_given_back_to_streamed_responses(body: bytes):
+    response = StreamingHttpResponse(iter_chunks(body, 3))
+    items = iter_json_array(get_response_handler(response).iter_content())
+
+    if items is not None:
+        next(items)
+
+    assert response.getvalue() == body
+
+
+def test_small_responses_are_decoded(pets_api_schema: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    test_config = OpenAPITestConfig(
+        validation=ValidationSettings(stream_min_size=1_000)
+    )
+
+    with patch("openapi_tester.schema_tester.iter_json_array") as iter_json_array:
+        tester.validate_response(
+            get_response_handler(HttpResponse(b'[{"id": 1, "name": "Fido"}]')),
+            test_config,
+        )
+
+    iter_json_array.assert_not_called()
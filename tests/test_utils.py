@@ -1,13 +1,28 @@
+import json
+import sys
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import IntEnum
+from uuid import UUID
+
 import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.utils.encoders import JSONEncoder
 
 from openapi_tester.utils import (
+    NormalizedSchemaSection,
+    find_first_failure,
     get_required_keys,
     merge_objects,
+    normalize_operation,
     normalize_query_param_value,
+    normalize_schema_section,
     query_params_to_object,
     serialize_json,
     serialize_schema_section_data,
     should_validate_query_param,
+    to_json_data,
 )
 from tests.utils import sort_object
 
@@ -48,6 +63,63 @@ def test_merge_objects():
     assert sort_object(merge_objects(test_schemas)) == sort_object(expected)
 
 
+def test_find_first_failure():
+    def check(items):
+        return all(item < 5 for item in items)
+
+    assert find_first_failure(check, [1, 2, 5, 3, 7]) == 2
+    assert find_first_failure(check, [7]) == 0
+    assert find_first_failure(check, [1, 2]) == 2
+
+
+def test_to_json_data():
+    class Size(IntEnum):
+        SMALL = 1
+
+    data = OrderedDict(
+        id=UUID("b2b5a1c8-3d1e-4f5a-9c7b-2a0e6f1d4c3b"),
+        price=Decimal("9.50"),
+        created=datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        birthday=date(2020, 2, 29),
+        duration=timedelta(minutes=1),
+        label=gettext_lazy("Name"),
+        size=Size.SMALL,
+        tags=("a", "b"),
+        counts={1: 2, False: None, 1.5: [{}]},
+    )
+
+    converted = to_json_data(data, JSONEncoder().default)
+
+    assert converted == json.loads(json.dumps(data, cls=JSONEncoder))
+    assert type(converted) is dict
+    assert type(converted["size"]) is int
+    assert type(converted["tags"]) is list
+
+
+def test_to_json_data_rejects_circular_references():
+    data: dict = {"children": []}
+    data["children"].append(data)
+    repeated = [1]
+
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        to_json_data(data, JSONEncoder().default)
+    assert to_json_data([repeated, repeated], JSONEncoder().default) == [[1], [1]]
+    with pytest.raises(TypeError):
+        to_json_data({(1, 2): 1}, JSONEncoder().default)
+
+
+def test_to_json_data_of_deeply_nested_data():
+    data: dict = {}
+    for _ in range(sys.getrecursionlimit() * 5):
+        data = {"child": data}
+
+    converted = to_json_data(data, JSONEncoder().default)
+
+    for _ in range(sys.getrecursionlimit() * 5):
+        converted = converted["child"]
+    assert converted == {}
+
+
 def test_serialize_json_decorator():
     @serialize_json
     def dummy_function(*args, **kwargs):
@@ -300,3 +372,35 @@ def test_normalize_query_param_value_leaves_lists_untouched():
     param_schema = {"type": "array", "items": {"type": "integer"}}
 
     assert normalize_query_param_value(param_schema, [1, 2, 3]) == [1, 2, 3]
+
+
+def test_normalize_schema_section_is_idempotent():
+    schema_section = {
+        "allOf": [{"type": "object"}, {"properties": {"id": {"type": "integer"}}}]
+    }
+    normalized = normalize_schema_section(schema_section)
+
+    assert isinstance(normalized, NormalizedSchemaSection)
+    assert normalized == {"type": "object", "properties": {"id": {"type": "integer"}}}
+    assert normalize_schema_section(normalized) is normalized
+    assert (
+        normalize_schema_section(normalized["properties"]["id"])
+        is (normalized["properties"]["id"])
+    )
+
+
+def test_normalize_operation():
+    shared_schema = {"allOf": [{"type": "string"}]}
+    operation = {
+        "parameters": [{"name": "q", "in": "query", "schema": shared_schema}],
+        "requestBody": {"content": {"application/json": {"schema": shared_schema}}},
+        "responses": {"200": {"content": {"application/json": {"schema": {}}}}},
+    }
+
+    assert normalize_operation(operation, {}) is operation
+    parameter_schema = operation["parameters"][0]["schema"]
+    assert parameter_schema == {"type": "string"}
+    assert (
+        operation["requestBody"]["content"]["application/json"]["schema"]
+        is parameter_schema
+    )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rest_framework.response import Response
+
+from openapi_tester import SchemaTester
+from openapi_tester.case_testers import is_camel_case
+from openapi_tester.config import OpenAPITestConfig, ValidationSettings
+from openapi_tester.exceptions import DocumentationError
+from openapi_tester.response_handler_factory import ResponseHandlerFactory
+from openapi_tester.verdicts import VerdictCache, get_verdict_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def get_response_handler(data, status_code: int = 200):
+    response = Response(status=status_code, data=data)
+    response.request = {"REQUEST_METHOD": "GET", "PATH_INFO": "/api/pets"}  # type: ignore
+    response.renderer_context = {  # type: ignore[attr-defined]
+        "request": MagicMock(
+            path="/api/pets", method="GET", data={}, headers={}, query_params={}
+        )
+    }
+    response.json = lambda: data  # type: ignore
+    return ResponseHandlerFactory.create(response=response)
+
+
+def get_test_config(tmp_path: Path, **kwargs) -> OpenAPITestConfig:
+    return OpenAPITestConfig(
+        validation=ValidationSettings(
+            cache_verdicts=True, verdict_cache_dir=str(tmp_path), **kwargs
+        )
+    )
+
+
+def test_passing_verdicts_are_cached(pets_api_schema: Path, tmp_path: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    test_config = get_test_config(tmp_path)
+
+    with patch.object(
+        SchemaTester, "validate_schema_section", wraps=tester.validate_schema_section
+    ) as validate_schema_section:
+        for _ in range(2):
+            tester.validate_response(
+                get_response_handler([{"id": 1, "name": "Fido"}]), test_config
+            )
+        tester.validate_response(
+            get_response_handler([{"id": 2, "name": "Rex"}]), test_config
+        )
+
+    assert validate_schema_section.call_count == 2
+    assert len(get_verdict_cache(str(tmp_path)).keys) == 2
+
+
+def test_failing_verdicts_are_not_cached(pets_api_schema: Path, tmp_path: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    test_config = get_test_config(tmp_path)
+
+    for _ in range(2):
+        with pytest.raises(DocumentationError):
+            tester.validate_response(
+                get_response_handler([{"id": "1", "name": "Fido"}]), test_config
+            )
+
+    assert not get_verdict_cache(str(tmp_path)).keys
+
+
+def test_verdict_key(pets_api_schema: Path, tmp_path: Path):
+    tester = SchemaTester(schema_file_path=str(pets_api_schema))
+    test_config = get_test_config(tmp_path)
+    compiled = tester.compiler.compile({"type": "array"})
+    response_handler = get_response_handler([{"id": 1, "name": "Fido"}])
+
+    key = tester.get_verdict_key(compiled, response_handler, test_config)
+
+    assert key == tester.get_verdict_key(compiled, response_handler, test_config)
+    assert key != tester.get_verdict_key(
+        tester.compiler.compile({"type": "array", "items": {}}),
+        response_handler,
+        test_config,
+    )
+    assert key != tester.get_verdict_key(
+        compiled, get_response_handler([{"id": 1, "name": "Fido"}], 201), test_config
+    )
+    assert key != tester.get_verdict_key(
+        compiled, response_handler, get_test_config(tmp_path, formats=False)
+    )
+    assert key != tester.get_verdict_key(
+        compiled,
+        response_handler,
+        OpenAPITestConfig(case_tester=is_camel_case, validation=test_config.validation),
+    )
+    assert (
+        tester.get_verdict_key(compiled, response_handler, OpenAPITestConfig()) is None
+    )
+    assert (
+        tester.get_verdict_key(
+            compiled,
+            response_handler,
+            OpenAPITestConfig(validators=[str], validation=test_config.validation),
+        )
+        is None
+    )
+    assert (
+        tester.get_verdict_key(
+            compiled,
+            response_handler,
+            OpenAPITestConfig(
+                case_tester=lambda key: None, validation=test_config.validation
+            ),
+        )
+        is None
+    )
+
+
+def test_verdicts_are_persisted(tmp_path: Path):
+    VerdictCache(str(tmp_path)).add("abc")
+
+    assert "abc" in VerdictCache(str(tmp_path))
+    assert "abc" not in VerdictCache(str(tmp_path / "other"))
+    assert "abc" not in VerdictCache()